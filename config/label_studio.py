@@ -261,3 +261,111 @@ X_FRAME_OPTIONS_HEADER = get_env('X_FRAME_OPTIONS', None)
 
 # 스토리지 영속성 활성화
 STORAGE_PERSISTENCE = get_bool_env('STORAGE_PERSISTENCE', True)
+
+# ==============================================================================
+# Custom Export API 설정
+# ==============================================================================
+
+# NDJSON 스트리밍(response_type="stream") 시 한 번에 조회/prefetch할 Task 개수
+CUSTOM_EXPORT_STREAM_CHUNK_SIZE = int(get_env('CUSTOM_EXPORT_STREAM_CHUNK_SIZE', '500'))
+
+# Export 날짜 필터 대상 task.data 필드 목록 (쉼표 구분)
+# export_date_indexes 명령/API의 기본 인덱스 대상 필드 (CUSTOM_EXPORT_TIMESTAMP_FIELDS에 포함된 필드는 제외)
+CUSTOM_EXPORT_DATE_FIELDS = [
+    field.strip()
+    for field in get_env('CUSTOM_EXPORT_DATE_FIELDS', 'source_created_at').split(',')
+    if field.strip()
+]
+
+# timestamptz로 정규화하여 side table(custom_export_task_timestamp)에 저장할 task.data 날짜 필드 (쉼표 구분)
+# 이 필드들의 날짜 필터는 문자열 비교 대신 인덱스 범위 탐색을 사용 (Task 저장 / import 시 자동 갱신)
+# side table 행이 아직 없는 Task는 문자열 비교로 판정 (결과에서 누락되지 않음)
+CUSTOM_EXPORT_TIMESTAMP_FIELDS = [
+    field.strip()
+    for field in get_env('CUSTOM_EXPORT_TIMESTAMP_FIELDS', 'source_created_at').split(',')
+    if field.strip()
+]
+
+# run_export_worker 주기 동기화에서 비교할 최근 수정 Task 범위(초) - 그보다 오래된 누락은 sync_export_timestamps 명령으로 반영
+CUSTOM_EXPORT_TIMESTAMP_SYNC_LOOKBACK_SECONDS = int(get_env('CUSTOM_EXPORT_TIMESTAMP_SYNC_LOOKBACK_SECONDS', '3600'))
+
+# Task import(bulk_create) 직후 Export 날짜 필드 정규화 값 저장 (Label Studio 기본 bulk Serializer 확장)
+TASK_SERIALIZER_BULK = 'custom_api.task_import.ExportTaskSerializerBulk'
+
+# count / 페이지 응답 캐시 (프로젝트 generation 기반 무효화)
+CUSTOM_EXPORT_CACHE_ENABLED = get_bool_env('CUSTOM_EXPORT_CACHE_ENABLED', True)
+# 캐시 항목 유지 시간(초) - 시그널을 거치지 않는 쓰기(bulk 작업)의 최대 반영 지연
+CUSTOM_EXPORT_CACHE_TTL = int(get_env('CUSTOM_EXPORT_CACHE_TTL', '60'))
+# 프로세스당 최대 캐시 항목 수 (LRU)
+CUSTOM_EXPORT_CACHE_MAX_ENTRIES = int(get_env('CUSTOM_EXPORT_CACHE_MAX_ENTRIES', '256'))
+# generation 카운터를 저장할 Django cache alias (여러 Pod 환경에서는 Redis 등 공유 캐시 권장)
+CUSTOM_EXPORT_CACHE_ALIAS = get_env('CUSTOM_EXPORT_CACHE_ALIAS', 'default')
+
+# Export 필수 조건(검수자 annotation 존재)을 비정규화 테이블(custom_export_task_eligibility)로 판정
+# backfill_export_eligibility --all-projects 실행 후 활성화 (활성화 후 한 번 더 실행 - 비활성 상태에서는 갱신하지 않음)
+CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE = get_bool_env('CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE', False)
+
+# 증분 Export(updated_since) watermark 안전 구간(초)
+# 현재 시각 - 이 값까지만 반환하여 commit이 늦은 트랜잭션/Pod 간 시계 차이로 인한 누락 방지
+CUSTOM_EXPORT_DELTA_SAFETY_SECONDS = int(get_env('CUSTOM_EXPORT_DELTA_SAFETY_SECONDS', '30'))
+
+# Export 응답 압축 (Accept-Encoding 협상: zstd > gzip, 스트리밍은 chunk 단위 증분 압축)
+CUSTOM_EXPORT_COMPRESSION_ENABLED = get_bool_env('CUSTOM_EXPORT_COMPRESSION_ENABLED', True)
+# 이 크기(bytes) 미만의 일반 응답은 압축하지 않음 (스트리밍 응답은 크기와 무관하게 압축)
+CUSTOM_EXPORT_COMPRESSION_MIN_SIZE = int(get_env('CUSTOM_EXPORT_COMPRESSION_MIN_SIZE', '1024'))
+CUSTOM_EXPORT_GZIP_LEVEL = int(get_env('CUSTOM_EXPORT_GZIP_LEVEL', '6'))
+CUSTOM_EXPORT_ZSTD_LEVEL = int(get_env('CUSTOM_EXPORT_ZSTD_LEVEL', '3'))
+
+# 조건부 Export 요청 (필터링된 Task 집합 fingerprint ETag, If-None-Match 일치 시 304 Not Modified)
+CUSTOM_EXPORT_ETAG_ENABLED = get_bool_env('CUSTOM_EXPORT_ETAG_ENABLED', True)
+
+# snapshot 페이징(snapshot=true) 토큰 유효 시간 (초, 만료된 snapshot은 새 snapshot 생성 시 삭제)
+CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS = int(get_env('CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS', '3600'))
+
+# project_ids(다중 프로젝트) Export 시 프로젝트별 쿼리를 동시에 실행할 최대 스레드 수 (기본값 1: 순차 실행)
+# 2 이상이면 스레드마다 별도 DB 연결/트랜잭션을 사용하므로 프로젝트 간 결과가 같은 시점이 아니며
+# 요청당 DB 연결이 최대 이 수만큼 늘어남 (연결 풀/max_connections 여유 확인 후 설정)
+CUSTOM_EXPORT_MULTI_PROJECT_WORKERS = int(get_env('CUSTOM_EXPORT_MULTI_PROJECT_WORKERS', '1'))
+
+# Export 직렬화 fast path (.values() 행 → dict, orjson 렌더링)
+# false이면 Label Studio 오리지널 Serializer로 직렬화 (응답 필드 구성은 동일)
+CUSTOM_EXPORT_FAST_SERIALIZER = get_bool_env('CUSTOM_EXPORT_FAST_SERIALIZER', True)
+
+# format="parquet"/"arrow" 컬럼 압축 코덱 (빈 값이면 압축 안 함)
+# parquet: snappy, gzip, brotli, lz4, zstd / arrow(IPC): lz4, zstd만 지원 (지원하지 않는 형식 요청은 501)
+CUSTOM_EXPORT_COLUMNAR_COMPRESSION = get_env('CUSTOM_EXPORT_COLUMNAR_COMPRESSION', 'zstd')
+
+# 비동기 Export 작업(mode="async") 결과 파일 디렉터리 (여러 Pod가 공유하는 데이터 볼륨)
+CUSTOM_EXPORT_JOB_DIR = get_env('CUSTOM_EXPORT_JOB_DIR', os.path.join(BASE_DATA_DIR, 'custom_export_jobs'))
+# heartbeat가 이 시간(초) 동안 갱신되지 않은 작업은 다른 worker가 다시 실행
+CUSTOM_EXPORT_JOB_STALE_SECONDS = int(get_env('CUSTOM_EXPORT_JOB_STALE_SECONDS', '300'))
+# 작업당 최대 실행 시도 횟수
+CUSTOM_EXPORT_JOB_MAX_ATTEMPTS = int(get_env('CUSTOM_EXPORT_JOB_MAX_ATTEMPTS', '3'))
+# 비동기 작업 NDJSON 결과와 함께 기록할 미리 압축된 파일 형식 (쉼표 구분, 빈 값이면 기록 안 함)
+CUSTOM_EXPORT_JOB_PRECOMPRESS = [
+    encoding.strip()
+    for encoding in get_env('CUSTOM_EXPORT_JOB_PRECOMPRESS', 'gzip,zstd').split(',')
+    if encoding.strip()
+]
+# 완료/실패 작업과 결과 파일 보관 시간
+CUSTOM_EXPORT_JOB_RETENTION_HOURS = int(get_env('CUSTOM_EXPORT_JOB_RETENTION_HOURS', '24'))
+
+# 로컬 artifact(delivery="artifact") 디렉터리 (content-addressed 파일, 여러 Pod가 공유하는 데이터 볼륨)
+CUSTOM_EXPORT_ARTIFACT_DIR = get_env(
+    'CUSTOM_EXPORT_ARTIFACT_DIR', os.path.join(BASE_DATA_DIR, 'custom_export_artifacts')
+)
+# artifact 재사용/다운로드 가능 시간(초) - 지난 파일은 run_export_worker가 삭제
+CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS = int(get_env('CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS', '3600'))
+# 설정 시 artifact 다운로드를 nginx X-Accel-Redirect로 위임 (예: /custom-export-artifacts/ → internal location)
+CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT = get_env('CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT', '')
+
+# Custom API 요청 계측 (Server-Timing 헤더 + custom_api.timing JSON 로그)
+# 계측할 요청 비율 (0: 끔, 1: 전체) - SQL마다 시간 측정만 추가되므로 운영에서도 사용 가능
+CUSTOM_API_TIMING_SAMPLE_RATE = float(get_env('CUSTOM_API_TIMING_SAMPLE_RATE', '1.0'))
+# 이 시간(ms) 이상 걸린 요청은 WARNING 레벨로 기록 (나머지는 INFO)
+CUSTOM_API_TIMING_SLOW_MS = int(get_env('CUSTOM_API_TIMING_SLOW_MS', '1000'))
+LOGGING['loggers']['custom_api.timing'] = {
+    'handlers': ['console'],
+    'level': get_env('CUSTOM_API_TIMING_LOG_LEVEL', 'WARNING'),
+    'propagate': False,
+}
@@ -14,10 +14,15 @@ from rest_framework.permissions import IsAdminUser
 from rest_framework.authtoken.models import Token
 from organizations.models import Organization, OrganizationMember
 
+from .export_cache import bump_global_generation
+from .export_eligibility import use_eligibility_table
+from .export_jobs import create_eligibility_job
+from .instrumentation import InstrumentedViewMixin
+
 User = get_user_model()
 
 
-class CreateSuperuserAPI(APIView):
+class CreateSuperuserAPI(InstrumentedViewMixin, APIView):
     """
     Superuser 생성 API
 
@@ -154,7 +159,7 @@ class CreateSuperuserAPI(APIView):
             )
 
 
-class PromoteToSuperuserAPI(APIView):
+class PromoteToSuperuserAPI(InstrumentedViewMixin, APIView):
     """
     기존 사용자를 Superuser로 승격
 
@@ -170,8 +175,12 @@ class PromoteToSuperuserAPI(APIView):
             "email": "user@example.com",
             "is_superuser": true,
             "is_staff": true
-        }
+        },
+        "eligibility_job_id": "..."
     }
+
+    eligibility_job_id: CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=true일 때 등록된 eligibility 재계산 작업
+    (GET /api/custom/export/jobs/<job_id>/ 로 진행 확인, 비활성화 시 null)
     """
     permission_classes = [IsAdminUser]
 
@@ -198,6 +207,11 @@ class PromoteToSuperuserAPI(APIView):
             user.is_staff = True
             user.save()
 
+            # 검수자 판정(is_superuser)이 바뀌므로 Export 캐시 전체 무효화,
+            # 사용자의 annotation이 달린 Task의 Export 대상 여부는 run_export_worker가 재계산
+            bump_global_generation()
+            eligibility_job = create_eligibility_job(request.user, user.id) if use_eligibility_table() else None
+
             return Response({
                 'success': True,
                 'user': {
@@ -206,7 +220,8 @@ class PromoteToSuperuserAPI(APIView):
                     'username': user.username,
                     'is_superuser': user.is_superuser,
                     'is_staff': user.is_staff,
-                }
+                },
+                'eligibility_job_id': str(eligibility_job.id) if eligibility_job else None,
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -216,7 +231,7 @@ class PromoteToSuperuserAPI(APIView):
             )
 
 
-class DemoteFromSuperuserAPI(APIView):
+class DemoteFromSuperuserAPI(InstrumentedViewMixin, APIView):
     """
     Superuser 권한 해제
 
@@ -232,8 +247,12 @@ class DemoteFromSuperuserAPI(APIView):
             "email": "user@example.com",
             "is_superuser": false,
             "is_staff": false
-        }
+        },
+        "eligibility_job_id": "..."
     }
+
+    eligibility_job_id: CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=true일 때 등록된 eligibility 재계산 작업
+    (GET /api/custom/export/jobs/<job_id>/ 로 진행 확인, 비활성화 시 null)
     """
     permission_classes = [IsAdminUser]
 
@@ -267,6 +286,11 @@ class DemoteFromSuperuserAPI(APIView):
             user.is_staff = False
             user.save()
 
+            # 검수자 판정(is_superuser)이 바뀌므로 Export 캐시 전체 무효화,
+            # 사용자의 annotation이 달린 Task의 Export 대상 여부는 run_export_worker가 재계산
+            bump_global_generation()
+            eligibility_job = create_eligibility_job(request.user, user.id) if use_eligibility_table() else None
+
             return Response({
                 'success': True,
                 'user': {
@@ -275,7 +299,8 @@ class DemoteFromSuperuserAPI(APIView):
                     'username': user.username,
                     'is_superuser': user.is_superuser,
                     'is_staff': user.is_staff,
-                }
+                },
+                'eligibility_job_id': str(eligibility_job.id) if eligibility_job else None,
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -285,7 +310,7 @@ class DemoteFromSuperuserAPI(APIView):
             )
 
 
-class ListUsersAPI(APIView):
+class ListUsersAPI(InstrumentedViewMixin, APIView):
     """
     전체 사용자 목록 조회 (is_superuser 포함)
 
@@ -5,29 +5,57 @@ Label Studio 1.20.0 기반 커스텀 Export API
 MLOps 시스템의 모델 학습 및 성능 계산을 위한 필터링된 Task Export 제공
 """
 
-from django.db.models import Q, Prefetch
-from django.db.models.functions import Cast
-from django.db.models import DateTimeField as ModelDateTimeField
-from django.db import connection
+import datetime
+import os
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef, Q, Prefetch, TextField
+from django.db.models.expressions import RawSQL
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.settings import api_settings
 
 from projects.models import Project
-from tasks.models import Task, Annotation, Prediction
+from tasks.models import Task, Prediction
 
 # Label Studio 오리지널 Serializer 사용
 from tasks.serializers import PredictionSerializer, AnnotationSerializer
 
-from .export_serializers import (
-    CustomExportRequestSerializer,
-    CustomExportResponseSerializer,
-    TaskExportSerializer,
+from . import export_artifacts, export_cache, export_compression, export_encoder, export_etag, export_stats
+from .export_files import accel_redirect_response, file_download_response
+from .export_formats import COLUMNAR_FORMATS, compression_error, is_available, write_columnar
+from .export_jobs import create_job, find_artifact_job, get_job_for_user, job_payload, request_params
+from .export_delta import filter_changed, high_water_mark
+from .export_eligibility import filter_eligible, use_eligibility_table, valid_annotations
+from .models import ExportJob, ExportTaskTimestamp
+from .export_indexes import (
+    ExportIndexError,
+    configured_date_fields,
+    create_date_index,
+    date_field_sql,
+    drop_date_index,
+    list_date_indexes,
 )
+from .export_pagination import apply_cursor, encode_cursor
+from .export_parallel import run_per_project, stream_per_project
+from .export_annotations import ALL as ALL_ANNOTATIONS, AnnotationSelection
+from .export_predictions import ALL as ALL_PREDICTIONS, PredictionSelection
+from .export_projection import FULL, Projection
+from .export_sampling import sample
+from .export_shards import filter_shard
+from .instrumentation import InstrumentedViewMixin, phase
+from .export_snapshots import create_snapshot, get_snapshot, matches as snapshot_matches, page_task_ids
+from .export_timestamps import parse_errors, timestamp_fields
+from .export_serializers import CustomExportRequestSerializer, CustomExportStatsRequestSerializer
 
 
-class CustomExportAPI(APIView):
+class CustomExportAPI(InstrumentedViewMixin, APIView):
     """
     Custom Export API
 
@@ -37,12 +65,20 @@ class CustomExportAPI(APIView):
     - 날짜 범위 필터링 (task.data 내의 동적 날짜 필드)
     - 모델 버전 필터링 (prediction.model_version)
     - 승인자 필터링 (annotation.completed_by)
-    - 선택적 페이징 지원
+    - 선택적 페이징 지원 (page 번호 또는 (created_at, id) 기반 cursor)
+    - NDJSON 스트리밍 (response_type="stream")
+    - Accept-Encoding 협상 압축 (zstd / gzip, 스트리밍은 chunk 단위 증분 압축)
+    - 조건부 요청 (ETag / If-None-Match → 304 Not Modified)
 
     URL: POST /api/custom/export/
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [export_encoder.ExportJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        return export_compression.apply(request, response)
 
     def post(self, request):
         """
@@ -50,15 +86,41 @@ class CustomExportAPI(APIView):
 
         Request Body:
         {
-            "project_id": 1,                        // 필수
+            "project_id": 1,                        // 필수 (또는 project_ids)
+            "project_ids": [1, 2, 3],               // 옵션 (여러 프로젝트 병렬 Export, project_id 대신 사용)
             "search_from": "2025-01-01 00:00:00",  // 옵션
             "search_to": "2025-01-31 23:59:59",    // 옵션
             "search_date_field": "source_created_at", // 옵션 (기본값: source_created_at)
             "model_version": "bert-v1",            // 옵션
             "confirm_user_id": 8,                   // 옵션 (검수자 ID)
+            "updated_since": "2025-01-31T00:00:00Z", // 옵션 (증분 Export, 이전 응답의 watermark)
+            "updated_until": "2025-02-01T00:00:00Z", // 옵션 (증분 Export 상한, 기본값: 서버 watermark)
+            "shard_index": 0,                       // 옵션 (shard_count와 함께, Task ID 해시 구간 기준)
+            "shard_count": 4,                       // 옵션 (최대 1024)
+            "sample_size": 500,                     // 옵션 (결정적 샘플, stratify_by 사용 시 층별 개수)
+            "sample_seed": 0,                       // 옵션 (기본값: 0)
+            "stratify_by": "model_version",         // 옵션 ("model_version", "label")
             "page": 1,                              // 옵션 (페이징)
             "page_size": 100,                       // 옵션 (페이징)
-            "response_type": "data"                 // 옵션 ("data" 또는 "count", 기본값: "data")
+            "pagination": "page",                   // 옵션 ("page" 또는 "cursor", 기본값: "page")
+            "cursor": "eyJjIjoi...",                // 옵션 (cursor 페이징, 이전 응답의 next_cursor)
+            "snapshot": false,                      // 옵션 (true이면 첫 요청 시점의 대상 Task 목록 고정)
+            "snapshot_token": "3f0c2a0e-...",       // 옵션 (snapshot 페이징, 첫 응답의 snapshot_token)
+            "include_total": true,                  // 옵션 (false이면 COUNT(*) 생략)
+            "response_type": "data",                // 옵션 ("data", "count", "stream", 기본값: "data")
+            "format": "json",                       // 옵션 ("json", "parquet", "arrow", 기본값: "json")
+            "fields": ["id", "data", "annotations"], // 옵션 (응답 Task 필드, 기본값: 전체)
+            "data_keys": ["image", "source_created_at"], // 옵션 (task.data 중 포함할 키, 기본값: 전체)
+            "include_annotations": true,            // 옵션 (기본값: true)
+            "include_predictions": true,            // 옵션 (기본값: true)
+            "annotation_mode": "all",               // 옵션 (all, latest, latest_per_reviewer, confirm_user)
+            "prediction_mode": "all",               // 옵션 (all, model_version, latest_per_version, latest,
+                                                    //       top_k, min_score)
+            "prediction_top_k": 3,                  // prediction_mode="top_k"인 경우
+            "prediction_min_score": 0.5,            // prediction_mode="min_score"인 경우
+            "normalize_users": false,               // 옵션 (true이면 completed_by_info 대신 최상위 users 맵)
+            "mode": "sync",                         // 옵션 ("sync", "async", 기본값: "sync")
+            "delivery": "inline"                    // 옵션 ("inline", "artifact", 기본값: "inline")
         }
 
         Response (response_type="data"):
@@ -69,7 +131,27 @@ class CustomExportAPI(APIView):
             "page_size": 100,    // 페이징 사용 시
             "total_pages": 2,    // 페이징 사용 시
             "has_next": true,    // 페이징 사용 시
-            "has_previous": false // 페이징 사용 시
+            "has_previous": false, // 페이징 사용 시
+            "snapshot_token": "3f0c2a0e-...", // snapshot=true인 경우
+            "snapshot_expires_at": "...",     // snapshot=true인 경우
+            "watermark": "2025-02-01T00:00:00Z", // updated_since/updated_until 사용 시
+            "users": {"8": {"id": 8, "email": "...", ...}} // normalize_users=true인 경우
+        }
+
+        Response (project_ids, response_type="data" / "count"):
+        {
+            "total": 250,
+            "project_totals": {"1": 150, "2": 100},
+            "tasks": [...]       // project_ids 순서 → 최신 Task 순, 각 Task에 project_id 포함
+        }
+
+        Response (pagination="cursor"):
+        {
+            "total": 150,        // include_total=true인 경우
+            "page_size": 100,
+            "has_next": true,
+            "next_cursor": "eyJjIjoi...",  // 마지막 페이지이면 null
+            "tasks": [...]
         }
 
         Response (response_type="count"):
@@ -77,13 +159,45 @@ class CustomExportAPI(APIView):
             "total": 150
         }
 
+        Response (response_type="stream"):
+            Content-Type: application/x-ndjson
+            한 줄에 Task 하나씩 (전체 건수 계산 생략, 페이징 미적용)
+
+        Response (format="parquet" / "arrow"):
+            Content-Type: application/vnd.apache.parquet / application/vnd.apache.arrow.file
+            annotation 단위 행의 컬럼형 파일 (task 필드 + annotation 메타데이터 + completed_by_info)
+
+        Response (mode="async"): 202 Accepted
+        {
+            "job_id": "...",
+            "status": "pending",
+            "status_url": "/api/custom/export/jobs/<job_id>/",
+            ...
+        }
+
+        Response (delivery="artifact", 기록된 파일 없음): 202 Accepted (mode="async"와 같은 작업 응답 + artifact_id)
+
+        Response (delivery="artifact", 기록된 파일 재사용):
+        {
+            "artifact_id": "9b1f...",   // 요청 파라미터 + 프로젝트 generation 해시
+            "reused": true,
+            "content_type": "application/x-ndjson",
+            "file_size": 1048576,
+            "expires_at": "...",
+            "download_url": "/api/custom/export/artifacts/<artifact_id>/download"
+        }
+
+        Response (If-None-Match가 응답 ETag와 일치): 304 Not Modified (본문 없음)
+
         중요:
         - 검수자(is_superuser=True)의 유효한(was_cancelled=False) annotation이 있는 task만 반환
         - 임시 저장(draft) annotation은 제외됨
         """
         # 1. Request 유효성 검증
         serializer = CustomExportRequestSerializer(data=request.data)
-        if not serializer.is_valid():
+        with phase('validate'):
+            valid = serializer.is_valid()
+        if not valid:
             return Response(
                 {"error": "Invalid request parameters", "details": serializer.errors},
                 status=status.HTTP_400_BAD_REQUEST
@@ -91,16 +205,55 @@ class CustomExportAPI(APIView):
 
         validated_data = serializer.validated_data
 
+        # 증분 Export: 상한을 서버 watermark로 고정 (캐시 키, 비동기 작업, 응답이 같은 상한 사용)
+        watermark = None
+        if validated_data.get('updated_since') or validated_data.get('updated_until'):
+            watermark = high_water_mark(validated_data.get('updated_until'))
+            validated_data = {**validated_data, 'updated_until': watermark}
+
+        # project_ids: 여러 프로젝트를 병렬 조회하여 하나의 응답으로 병합
+        if validated_data.get('project_ids'):
+            return self._multi_project_response(validated_data, watermark)
+
         # 2. 파라미터 추출
         project_id = validated_data['project_id']
         search_from = validated_data.get('search_from')
         search_to = validated_data.get('search_to')
         search_date_field = validated_data.get('search_date_field', 'source_created_at')
-        model_version = validated_data.get('model_version')
-        confirm_user_id = validated_data.get('confirm_user_id')
         page = validated_data.get('page')
         page_size = validated_data.get('page_size')
+        pagination = validated_data.get('pagination', 'page')
+        cursor = validated_data.get('cursor')
+        include_total = validated_data.get('include_total', True)
         response_type = validated_data.get('response_type', 'data')
+        export_format = validated_data.get('format', 'json')
+        projection = Projection.from_validated(validated_data)
+
+        if export_format in COLUMNAR_FORMATS and not is_available():
+            return Response(
+                {"error": f"format='{export_format}' requires pyarrow, which is not installed"},
+                status=status.HTTP_501_NOT_IMPLEMENTED
+            )
+        if export_format in COLUMNAR_FORMATS and compression_error(export_format):
+            # 스트리밍 시작 후 writer 생성이 실패하면 잘린 200 응답이 되므로 미리 거부
+            return Response(
+                {"error": compression_error(export_format)},
+                status=status.HTTP_501_NOT_IMPLEMENTED
+            )
+
+        # count / 페이지 응답 캐시 조회 (프로젝트 generation이 같으면 DB 조회 없이 응답)
+        cache_key = None
+        if export_cache.is_enabled() and not validated_data.get('snapshot') \
+                and self._is_cacheable(response_type, pagination, page):
+            cache_key = export_cache.make_key('export', project_id, validated_data)
+            cached = export_cache.get_result(cache_key)
+            if cached is not None:
+                cached_etag = export_cache.get_result(self._etag_cache_key(cache_key))
+                if export_etag.not_modified(request, cached_etag):
+                    return self._not_modified(cached_etag)
+                response = self._with_etag(Response(cached, status=status.HTTP_200_OK), cached_etag)
+                response['X-Export-Cache'] = 'HIT'
+                return response
 
         # 3. 프로젝트 존재 여부 확인
         try:
@@ -111,58 +264,389 @@ class CustomExportAPI(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        # mode='async'인 경우 작업만 등록하고 job ID 즉시 반환 (run_export_worker가 실행)
+        if validated_data.get('mode') == 'async':
+            return self._job_response(request, serializer, project_id, watermark)
+
+        # snapshot 페이징: 대상 Task 목록을 고정하고 이후 페이지는 고정된 목록에서 조회
+        if validated_data.get('snapshot'):
+            return self._snapshot_response(request, validated_data, projection, watermark)
+
+        # delivery='artifact': 기록된 파일이 있으면 다운로드 URL 반환, 없으면 기록 작업 등록 (202)
+        if validated_data.get('delivery') == 'artifact':
+            return self._artifact_response(request, serializer, validated_data, watermark)
+
         # 4. QuerySet 빌드
-        queryset = self._build_queryset(
-            project_id=project_id,
-            search_from=search_from,
-            search_to=search_to,
-            search_date_field=search_date_field,
-            model_version=model_version,
-            confirm_user_id=confirm_user_id
-        )
+        queryset = self._queryset_for(validated_data)
+
+        # 조건부 요청: 필터링된 Task 집합 fingerprint(집계 쿼리 1회)가 같으면 직렬화 없이 304
+        # (count / 전체 응답만, 페이지 / cursor / 스트리밍 요청에서는 계산하지 않음)
+        etag = None
+        if export_etag.is_enabled() and not watermark and export_etag.applies_to(validated_data):
+            with phase('etag'):
+                etag = export_etag.compute(validated_data, queryset)
+            if export_etag.not_modified(request, etag):
+                return self._not_modified(etag)
+
+        # 5. response_type='stream'인 경우 NDJSON 스트리밍
+        # 전체 Task 목록을 메모리에 올리지 않고 chunk 단위로 조회/직렬화하여 즉시 전송
+        if response_type == 'stream':
+            response = StreamingHttpResponse(
+                self._stream_tasks(queryset, projection),
+                content_type='application/x-ndjson',
+                status=status.HTTP_200_OK
+            )
+            return self._with_watermark_header(response, watermark)
+
+        # format='parquet'/'arrow'인 경우 chunk = row group 단위 컬럼형 파일 스트리밍
+        if export_format in COLUMNAR_FORMATS:
+            response = self._columnar_response(queryset, export_format, project_id, projection)
+            return self._with_watermark_header(response, watermark)
 
-        # 5. 전체 개수 계산
-        total = queryset.count()
+        # 날짜 파싱 실패 Task 건수 (정규화 필드로 날짜 필터 시에만, 0이면 생략)
+        date_parse_errors = 0
+        if (search_from or search_to) and search_date_field in timestamp_fields():
+            with phase('count'):
+                date_parse_errors = parse_errors(project_id, search_date_field).count()
 
         # 6. response_type='count'인 경우 건수만 반환 (성능 최적화)
         if response_type == 'count':
+            with phase('count'):
+                response_data = {"total": queryset.count()}
+            if date_parse_errors:
+                response_data["date_parse_errors"] = date_parse_errors
+            if watermark:
+                response_data["watermark"] = watermark
+            return self._cached_response(cache_key, response_data, etag)
+
+        # 7. 페이징 처리 (response_type='data'인 경우)
+        if pagination == 'cursor':
+            response_data = self._paginate_by_cursor(queryset, cursor, page_size, projection)
+        elif page and page_size:
+            response_data = self._paginate_by_page(queryset, page, page_size, include_total, projection)
+        else:
+            # 전체 반환
+            response_data = {
+                "tasks": self._serialize_tasks(self._task_source(queryset, projection), projection)
+            }
+
+        # 전체 개수 계산 (include_total=false이면 COUNT(*) 생략)
+        if include_total and 'total' not in response_data:
+            with phase('count'):
+                response_data = {"total": queryset.count(), **response_data}
+
+        if date_parse_errors:
+            response_data["date_parse_errors"] = date_parse_errors
+
+        if projection.normalize_users:
+            response_data["users"] = self._users_map(response_data["tasks"])
+
+        if watermark:
+            response_data["watermark"] = watermark
+
+        return self._cached_response(cache_key, response_data, etag)
+
+    def _job_response(self, request, serializer, project_id, watermark, artifact_id=None):
+        """
+        비동기 Export 작업 등록 → 202 (run_export_worker가 실행)
+        """
+        params = request_params(serializer)
+        if watermark:
+            params['updated_until'] = watermark.isoformat()
+        if artifact_id:
+            params['artifact_id'] = artifact_id
+        job = create_job(request.user, project_id, params)
+        payload = job_payload(job)
+        if watermark:
+            payload['watermark'] = watermark
+        return Response(payload, status=status.HTTP_202_ACCEPTED)
+
+    def _artifact_response(self, request, serializer, validated_data, watermark):
+        """
+        로컬 artifact 응답
+
+        같은 요청 파라미터 + 프로젝트 generation으로 기록된 파일이 있으면 DB 조회 없이 다운로드 URL을 반환한다.
+        없으면 요청 안에서 기록하지 않고 비동기 작업으로 등록하여 202 + status URL을 반환한다.
+        (같은 artifact를 기록 중인 작업이 있으면 그 작업을 반환)
+        """
+        artifact_id = export_artifacts.artifact_id(validated_data['project_id'], validated_data)
+
+        path = export_artifacts.find(artifact_id)
+        if path is None:
+            job = find_artifact_job(artifact_id)
+            if job is None:
+                return self._job_response(request, serializer, validated_data['project_id'], watermark, artifact_id)
+            return Response(job_payload(job), status=status.HTTP_202_ACCEPTED)
+
+        response_data = export_artifacts.artifact_payload(artifact_id, path, reused=True)
+        if watermark:
+            response_data["watermark"] = watermark
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def _snapshot_response(self, request, validated_data, projection, watermark):
+        """
+        snapshot 페이징 응답
+
+        snapshot_token이 없으면 현재 필터 결과로 snapshot을 만들고, 있으면 고정된 목록을 사용한다.
+        페이지의 Task는 (snapshot, position) 범위에서 ID를 읽어 id IN (...)으로 조회하므로
+        필터 쿼리와 COUNT(*)를 다시 실행하지 않는다.
+        """
+        project_id = validated_data['project_id']
+        page = validated_data['page']
+        page_size = validated_data['page_size']
+        snapshot_token = validated_data.get('snapshot_token')
+
+        if snapshot_token:
+            snapshot = get_snapshot(snapshot_token, request.user, project_id)
+            if snapshot is None:
+                return Response(
+                    {"error": f"Snapshot {snapshot_token} does not exist or has expired"},
+                    status=status.HTTP_410_GONE
+                )
+            if not snapshot_matches(snapshot, validated_data):
+                return Response(
+                    {"error": "Filter parameters do not match the snapshot"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # 첫 요청의 watermark 유지
+            watermark = snapshot.params.get('updated_until') or watermark
+        else:
+            snapshot = create_snapshot(request.user, project_id, validated_data, self._queryset_for(validated_data))
+
+        task_ids = page_task_ids(snapshot, (page - 1) * page_size, page_size)
+        queryset = self._with_export_relations(
+            Task.objects.filter(id__in=task_ids), projection.annotation_selection, projection.prediction_selection
+        )
+
+        response_data = {
+            "total": snapshot.total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (snapshot.total + page_size - 1) // page_size,
+            "has_next": page * page_size < snapshot.total,
+            "has_previous": page > 1,
+            "snapshot_token": str(snapshot.id),
+            "snapshot_expires_at": snapshot.expires_at,
+            "tasks": self._serialize_tasks(self._task_source(queryset, projection), projection),
+        }
+
+        if projection.normalize_users:
+            response_data["users"] = self._users_map(response_data["tasks"])
+
+        if watermark:
+            response_data["watermark"] = watermark
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def _users_map(self, tasks_data):
+        """
+        normalize_users 응답의 최상위 users 맵 (annotation completed_by ID 기준, IN 쿼리 1회)
+
+        Returns:
+            dict: {"<user_id>": {"id", "email", "username", "is_superuser"}}
+        """
+        user_ids = {
+            annotation['completed_by']
+            for task_data in tasks_data
+            for annotation in task_data.get('annotations') or []
+            if annotation.get('completed_by') is not None
+        }
+        if not user_ids:
+            return {}
+
+        users = get_user_model().objects.filter(id__in=user_ids).order_by('id').values(
+            'id', 'email', 'username', 'is_superuser'
+        )
+        return {str(user['id']): user for user in users}
+
+    def _multi_project_response(self, validated_data, watermark):
+        """
+        project_ids 요청: 프로젝트별 쿼리를 병렬 실행(CUSTOM_EXPORT_MULTI_PROJECT_WORKERS)하고
+        project_ids 순서로 병합
+
+        - count: 프로젝트별 건수(project_totals) + 합계
+        - data: 프로젝트별 Task 목록(-created_at, -id)을 project_ids 순서로 이어 붙임
+        - stream: project_ids 순서의 NDJSON (앞 프로젝트를 전송하는 동안 다음 프로젝트를 미리 조회)
+        """
+        project_ids = validated_data['project_ids']
+        existing = set(Project.objects.filter(id__in=project_ids).values_list('id', flat=True))
+        missing = [project_id for project_id in project_ids if project_id not in existing]
+        if missing:
             return Response(
-                {"total": total},
-                status=status.HTTP_200_OK
+                {"error": f"Projects with ids {missing} do not exist"},
+                status=status.HTTP_404_NOT_FOUND
             )
 
-        # 7. 페이징 처리 (response_type='data'인 경우)
-        if page and page_size:
-            # 페이징 적용
-            start = (page - 1) * page_size
-            end = start + page_size
-            tasks = queryset[start:end]
+        response_type = validated_data.get('response_type', 'data')
+        # 병합된 결과에서 프로젝트를 구분할 수 있도록 project_id는 항상 포함
+        projection = Projection.from_validated(validated_data).require('project_id')
+
+        def queryset_for(project_id):
+            return self._queryset_for({**validated_data, 'project_id': project_id})
 
-            total_pages = (total + page_size - 1) // page_size
-            has_next = page * page_size < total
-            has_previous = page > 1
+        if response_type == 'stream':
+            response = StreamingHttpResponse(
+                stream_per_project(
+                    project_ids,
+                    lambda project_id: self._stream_tasks(queryset_for(project_id), projection)
+                ),
+                content_type='application/x-ndjson',
+                status=status.HTTP_200_OK
+            )
+            return self._with_watermark_header(response, watermark)
 
+        if response_type == 'count':
+            totals = run_per_project(project_ids, lambda project_id: queryset_for(project_id).count())
             response_data = {
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": total_pages,
-                "has_next": has_next,
-                "has_previous": has_previous,
-                "tasks": self._serialize_tasks(tasks)
+                "total": sum(totals.values()),
+                "project_totals": {str(project_id): total for project_id, total in totals.items()},
             }
         else:
-            # 전체 반환
-            tasks = queryset.all()
-
+            results = run_per_project(
+                project_ids,
+                lambda project_id: self._serialize_tasks(
+                    self._task_source(queryset_for(project_id), projection), projection
+                )
+            )
+            tasks = [task_data for project_id in project_ids for task_data in results[project_id]]
             response_data = {
-                "total": total,
-                "tasks": self._serialize_tasks(tasks)
+                "total": len(tasks),
+                "project_totals": {str(project_id): len(results[project_id]) for project_id in project_ids},
+                "tasks": tasks,
             }
+            if projection.normalize_users:
+                response_data["users"] = self._users_map(tasks)
+
+        if watermark:
+            response_data["watermark"] = watermark
 
         return Response(response_data, status=status.HTTP_200_OK)
 
-    def _build_queryset(self, project_id, search_from, search_to, search_date_field, model_version, confirm_user_id):
+    def _with_watermark_header(self, response, watermark):
+        """
+        스트리밍 응답에 증분 Export watermark 헤더 추가 (본문에 메타데이터를 넣을 수 없는 형식)
+        """
+        if watermark:
+            response['X-Export-Watermark'] = watermark.isoformat()
+        return response
+
+    def _with_etag(self, response, etag):
+        if etag:
+            response['ETag'] = etag
+        return response
+
+    def _not_modified(self, etag):
+        """
+        If-None-Match 일치 → 304 Not Modified (ETag만 포함, 본문 없음)
+        """
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _etag_cache_key(self, cache_key):
+        return f"{cache_key}:etag"
+
+    def _is_cacheable(self, response_type, pagination, page):
+        """
+        캐시 대상: count 응답과 페이지 단위 data 응답 (전체 반환/스트리밍은 크기가 커서 제외)
+        """
+        if response_type == 'count':
+            return True
+        return response_type == 'data' and (pagination == 'cursor' or page is not None)
+
+    def _cached_response(self, cache_key, response_data, etag=None):
+        """
+        응답 생성 + 캐시 저장 (cache_key가 없으면 캐시하지 않음, ETag는 캐시 HIT 응답에도 사용)
+        """
+        response = self._with_etag(Response(response_data, status=status.HTTP_200_OK), etag)
+        if cache_key:
+            export_cache.set_result(cache_key, response_data)
+            if etag:
+                export_cache.set_result(self._etag_cache_key(cache_key), etag)
+            response['X-Export-Cache'] = 'MISS'
+        return response
+
+    def _paginate_by_page(self, queryset, page, page_size, include_total, projection=FULL):
+        """
+        page 번호 기반 (OFFSET) 페이징
+
+        include_total=false이면 COUNT(*) 대신 page_size + 1개를 조회하여 has_next 판단
+        """
+        start = (page - 1) * page_size
+
+        queryset = self._task_source(queryset, projection)
+
+        if not include_total:
+            tasks = list(queryset[start:start + page_size + 1])
+            return {
+                "page": page,
+                "page_size": page_size,
+                "has_next": len(tasks) > page_size,
+                "has_previous": page > 1,
+                "tasks": self._serialize_tasks(tasks[:page_size], projection)
+            }
+
+        with phase('count'):
+            total = queryset.count()
+        tasks = queryset[start:start + page_size]
+
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size,
+            "has_next": page * page_size < total,
+            "has_previous": page > 1,
+            "tasks": self._serialize_tasks(tasks, projection)
+        }
+
+    def _paginate_by_cursor(self, queryset, cursor, page_size, projection=FULL):
+        """
+        (created_at, id) keyset 기반 cursor 페이징
+
+        OFFSET 없이 cursor 이후 page_size + 1개만 조회하므로 깊은 페이지도 첫 페이지와 비용이 같다.
+        """
+        if cursor:
+            queryset = apply_cursor(queryset, cursor)
+
+        tasks = list(self._task_source(queryset, projection)[:page_size + 1])
+        has_next = len(tasks) > page_size
+        tasks = tasks[:page_size]
+
+        return {
+            "page_size": page_size,
+            "has_next": has_next,
+            "next_cursor": encode_cursor(tasks[-1]) if has_next else None,
+            "tasks": self._serialize_tasks(tasks, projection)
+        }
+
+    def _queryset_for(self, validated_data):
+        """
+        검증된 요청 파라미터로 QuerySet 빌드 (비동기 작업 worker와 공용)
+        """
+        return self._build_queryset(
+            project_id=validated_data['project_id'],
+            search_from=validated_data.get('search_from'),
+            search_to=validated_data.get('search_to'),
+            search_date_field=validated_data.get('search_date_field', 'source_created_at'),
+            model_version=validated_data.get('model_version'),
+            confirm_user_id=validated_data.get('confirm_user_id'),
+            updated_since=validated_data.get('updated_since'),
+            updated_until=validated_data.get('updated_until'),
+            shard_index=validated_data.get('shard_index'),
+            shard_count=validated_data.get('shard_count'),
+            sample_size=validated_data.get('sample_size'),
+            sample_seed=validated_data.get('sample_seed', 0),
+            stratify_by=validated_data.get('stratify_by'),
+            annotation_selection=AnnotationSelection.from_validated(validated_data),
+            prediction_selection=PredictionSelection.from_validated(validated_data)
+        )
+
+    def _build_queryset(self, project_id, search_from, search_to, search_date_field, model_version, confirm_user_id,
+                        updated_since=None, updated_until=None, shard_index=None, shard_count=None,
+                        sample_size=None, sample_seed=0, stratify_by=None,
+                        annotation_selection=ALL_ANNOTATIONS, prediction_selection=ALL_PREDICTIONS):
         """
         필터 조건에 따라 QuerySet 빌드
 
@@ -173,6 +657,12 @@ class CustomExportAPI(APIView):
             search_date_field: task.data 내의 날짜 필드명 (기본값: source_created_at)
             model_version: 모델 버전 (prediction.model_version)
             confirm_user_id: 승인자 ID (annotation.completed_by)
+            updated_since: 증분 Export 하한 (이 시각 이후 수정분, 미포함)
+            updated_until: 증분 Export 상한 (이 시각까지 수정분, 포함)
+            shard_index / shard_count: MD5(Task ID)가 shard_index번째 해시 구간에 속하는 Task만 (해시 샤딩)
+            sample_size / sample_seed / stratify_by: 필터링된 Task 중 결정적 샘플만 (층화 시 층별 개수)
+            annotation_selection: prefetch할 annotation 선택 규칙 (annotation_mode)
+            prediction_selection: prefetch할 prediction 선택 규칙 (prediction_mode)
 
         Returns:
             QuerySet: 필터링된 Task QuerySet
@@ -180,59 +670,76 @@ class CustomExportAPI(APIView):
         # 기본 필터: project_id
         queryset = Task.objects.filter(project_id=project_id)
 
-        # 날짜 범위 필터 (task.data->>'{search_date_field}')
-        # 동적으로 날짜 필드명을 사용하여 단순 문자열 비교 수행
-        # 보안: search_date_field는 Serializer에서 정규식 검증됨
-        if search_from:
-            # datetime을 문자열로 변환 (YYYY-MM-DD HH:MI:SS 형식)
-            search_from_str = search_from.strftime('%Y-%m-%d %H:%M:%S')
+        # 샤딩: 여러 worker가 서로 겹치지 않는 Task 부분집합을 병렬 조회
+        queryset = filter_shard(queryset, shard_index, shard_count)
 
-            # SQL Injection 방지: 필드명을 identifier로 쿼팅
-            # PostgreSQL에서 identifier는 이중 따옴표로 감싸되,
-            # Serializer에서 이미 검증되었으므로 안전하게 사용
-            queryset = queryset.extra(
-                where=["(data->>%s) >= %s"],
-                params=[search_date_field, search_from_str]
-            )
+        # 날짜 범위 필터
+        if search_from or search_to:
+            if search_date_field in timestamp_fields():
+                queryset = self._filter_by_normalized_date(
+                    queryset, project_id, search_date_field, search_from, search_to
+                )
+            else:
+                queryset = self._filter_by_raw_date(
+                    queryset, search_date_field, search_from, search_to
+                )
 
-        if search_to:
-            search_to_str = search_to.strftime('%Y-%m-%d %H:%M:%S')
-            queryset = queryset.extra(
-                where=["(data->>%s) <= %s"],
-                params=[search_date_field, search_to_str]
-            )
-
-        # 모델 버전 필터 (prediction.model_version)
-        if model_version:
-            queryset = queryset.filter(
-                predictions__model_version=model_version
-            ).distinct()
+        # 증분 Export 필터: (updated_since, updated_until] 구간에 Task/검수자 annotation/prediction이 수정된 Task
+        if updated_since or updated_until:
+            queryset = filter_changed(queryset, project_id, updated_since, updated_until)
 
         # 승인자 필터 (annotation.completed_by)
         # Super User만 승인자로 간주
         if confirm_user_id:
             queryset = queryset.filter(
-                annotations__completed_by_id=confirm_user_id,
-                annotations__completed_by__is_superuser=True,
-                annotations__was_cancelled=False
-            ).distinct()
+                Exists(self._valid_annotations().filter(
+                    task_id=OuterRef('pk'),
+                    completed_by_id=confirm_user_id
+                ))
+            )
 
         # 필수 필터: 검수자(Super User)의 유효한(submit된) annotation이 있는 task만
         # MLOps 요구사항:
         # - annotation이 없는 task 제외
         # - 검수자(is_superuser=True)의 annotation만 포함
         # - 유효한(was_cancelled=False) annotation만 포함 (임시 저장 제외)
-        queryset = queryset.filter(
-            annotations__completed_by__is_superuser=True,
-            annotations__was_cancelled=False
-        ).distinct()
+        if use_eligibility_table():
+            # 미리 계산된 TaskExportEligibility로 판정 (annotation ↔ user JOIN 없음)
+            queryset = filter_eligible(queryset, model_version=model_version)
+        else:
+            # 필터는 모두 상관 EXISTS 서브쿼리로 구성
+            # JOIN + DISTINCT는 annotation/prediction 수만큼 행이 늘어나고 프로젝트 전체를
+            # 중복 제거해야 하지만, EXISTS는 semi-join으로 처리되어 행이 늘지 않으므로
+            # ORDER BY -created_at LIMIT n이 필요한 행만 읽고 멈출 수 있다.
 
+            # 모델 버전 필터 (prediction.model_version)
+            if model_version:
+                queryset = queryset.filter(
+                    Exists(Prediction.objects.filter(
+                        task_id=OuterRef('pk'),
+                        model_version=model_version
+                    ))
+                )
+
+            queryset = queryset.filter(
+                Exists(self._valid_annotations().filter(task_id=OuterRef('pk')))
+            )
+
+        # 샘플링: Export 대상이 모두 결정된 뒤 샘플 순서 상위 sample_size개 (층화 시 층별)
+        queryset = sample(queryset, sample_size, sample_seed, stratify_by)
+
+        return self._with_export_relations(queryset, annotation_selection, prediction_selection)
+
+    def _with_export_relations(self, queryset, annotation_selection=ALL_ANNOTATIONS,
+                               prediction_selection=ALL_PREDICTIONS):
+        """
+        Export 응답용 prefetch + 정렬 (필터링된 QuerySet / snapshot 페이지 공용)
+        """
         # Prefetch 최적화: N+1 쿼리 방지
         # 검수자의 유효한 annotation만 prefetch
-        valid_annotations_queryset = Annotation.objects.filter(
-            completed_by__is_superuser=True,
-            was_cancelled=False
-        ).select_related('completed_by').order_by('-created_at')
+        valid_annotations_queryset = annotation_selection.apply(
+            self._valid_annotations().select_related('completed_by')
+        )
 
         queryset = queryset.prefetch_related(
             Prefetch(
@@ -241,66 +748,505 @@ class CustomExportAPI(APIView):
             ),
             Prefetch(
                 'predictions',
-                queryset=Prediction.objects.order_by('-created_at')
+                queryset=prediction_selection.apply(Prediction.objects.all())
             )
         ).select_related('project')
 
-        # 정렬: 최신 Task 우선
-        queryset = queryset.order_by('-created_at')
+        # 정렬: 최신 Task 우선 (id로 동률 정렬 → cursor 페이징 키)
+        queryset = queryset.order_by('-created_at', '-id')
+
+        return queryset
+
+    def _filter_by_normalized_date(self, queryset, project_id, search_date_field, search_from, search_to):
+        """
+        정규화된 timestamp side table(ExportTaskTimestamp) 기반 날짜 범위 필터
+
+        (project_id, field_name, value) 인덱스 범위 탐색으로 timestamptz 값을 비교한다.
+        타임존 오프셋이 있는 값/요청도 정확히 비교되며, 파싱 실패 값(value=NULL)은 제외된다.
+
+        side table 행이 아직 없는 Task(동기화 전 bulk 생성 등)는 누락되지 않도록
+        정규화되지 않은 필드와 같은 문자열 비교로 판정한다. (요청은 side table을 읽기만 함)
+        """
+        in_range = {'project_id': project_id, 'field_name': search_date_field}
+        if search_from:
+            in_range['value__gte'] = self._as_utc(search_from)
+        if search_to:
+            in_range['value__lte'] = self._as_utc(search_to)
+        normalized = ExportTaskTimestamp.objects.filter(**in_range).values('task_id')
+
+        synced = ExportTaskTimestamp.objects.filter(task_id=OuterRef('pk'), field_name=search_date_field)
+        queryset = queryset.alias(
+            _raw_date=RawSQL(date_field_sql(search_date_field), [], output_field=TextField())
+        )
+        return queryset.filter(
+            Q(id__in=normalized)
+            | (~Exists(synced) & Q(**self._raw_date_lookups('_raw_date', search_from, search_to)))
+        )
+
+    def _raw_date_lookups(self, alias, search_from, search_to):
+        """
+        task.data 날짜 문자열 범위 조건 (YYYY-MM-DD HH:MI:SS 문자열 비교)
+        """
+        lookups = {}
+        if search_from:
+            lookups[f'{alias}__gte'] = search_from.strftime('%Y-%m-%d %H:%M:%S')
+        if search_to:
+            lookups[f'{alias}__lte'] = search_to.strftime('%Y-%m-%d %H:%M:%S')
+        return lookups
+
+    def _filter_by_raw_date(self, queryset, search_date_field, search_from, search_to):
+        """
+        task.data 날짜 문자열 비교 기반 날짜 범위 필터 (정규화되지 않은 필드)
+
+        필드 표현식은 export_date_indexes로 생성한 expression index와 정확히 같은 SQL을 사용
+        보안: search_date_field는 Serializer와 date_field_sql()에서 정규식 검증됨
+        """
+        date_expression = date_field_sql(search_date_field)
+
+        if search_from:
+            # datetime을 문자열로 변환 (YYYY-MM-DD HH:MI:SS 형식)
+            search_from_str = search_from.strftime('%Y-%m-%d %H:%M:%S')
+            queryset = queryset.extra(
+                where=[f"{date_expression} >= %s"],
+                params=[search_from_str]
+            )
+
+        if search_to:
+            search_to_str = search_to.strftime('%Y-%m-%d %H:%M:%S')
+            queryset = queryset.extra(
+                where=[f"{date_expression} <= %s"],
+                params=[search_to_str]
+            )
+
+        return queryset
+
+    def _as_utc(self, value):
+        """
+        요청 datetime을 UTC aware datetime으로 변환 (타임존 없는 값은 UTC로 간주)
+        """
+        if timezone.is_naive(value):
+            return timezone.make_aware(value, datetime.timezone.utc)
+        return value.astimezone(datetime.timezone.utc)
+
+    def _valid_annotations(self):
+        """
+        검수자(Super User)의 유효한(was_cancelled=False) annotation QuerySet
+        """
+        return valid_annotations()
+
+    def _columnar_response(self, queryset, export_format, project_id, projection=FULL):
+        """
+        Parquet / Arrow IPC 파일 스트리밍 응답
+        """
+        spec = COLUMNAR_FORMATS[export_format]
+        response = StreamingHttpResponse(
+            write_columnar(export_format, self._iter_serialized_chunks(queryset, projection)),
+            content_type=spec['content_type'],
+            status=status.HTTP_200_OK
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="project_{project_id}_export.{spec["extension"]}"'
+        )
+        return response
+
+    def _iter_serialized_chunks(self, queryset, projection=FULL):
+        """
+        직렬화된 Task 목록을 chunk 단위로 반환 (CUSTOM_EXPORT_STREAM_CHUNK_SIZE)
+        """
+        chunk_size = getattr(settings, 'CUSTOM_EXPORT_STREAM_CHUNK_SIZE', 500)
+        chunk = []
+
+        for task in self._task_source(queryset, projection).iterator(chunk_size=chunk_size):
+            chunk.append(task)
+            if len(chunk) >= chunk_size:
+                yield self._serialize_tasks(chunk, projection)
+                chunk = []
+
+        if chunk:
+            yield self._serialize_tasks(chunk, projection)
+
+    def _stream_tasks(self, queryset, projection=FULL):
+        """
+        Task를 NDJSON 형식으로 chunk 단위 스트리밍
+
+        queryset.iterator(chunk_size=...)는 chunk마다 annotations/predictions를
+        prefetch하므로 프로젝트 크기와 무관하게 메모리 사용량이 일정하다.
+
+        Args:
+            queryset: Task QuerySet
+            projection: 응답 필드 projection
+
+        Yields:
+            bytes: chunk에 포함된 Task들의 NDJSON 라인
+        """
+        for tasks_data in self._iter_serialized_chunks(queryset, projection):
+            yield self._to_ndjson(tasks_data)
+
+    def _export_blocks(self, chunks, export_format):
+        """
+        직렬화된 Task chunk → 파일 blocks (NDJSON bytes 또는 컬럼형 파일 bytes)
+        """
+        if export_format in COLUMNAR_FORMATS:
+            return write_columnar(export_format, chunks)
+        return (self._to_ndjson(tasks_data) for tasks_data in chunks)
+
+    def _to_ndjson(self, tasks_data):
+        """
+        직렬화된 Task 목록을 NDJSON bytes로 변환 (JSON 응답과 동일한 인코딩)
+        """
+        return b''.join(
+            export_encoder.dumps(task_data) + b'\n'
+            for task_data in tasks_data
+        )
+
+    def _task_source(self, queryset, projection=FULL):
+        """
+        직렬화 대상 Task 조회용 QuerySet
 
+        fast path(export_encoder)이면 projection에 필요한 Task 컬럼만 .values() 행으로,
+        아니면 prefetch된 Task 인스턴스로 조회
+        """
+        if export_encoder.is_enabled():
+            return export_encoder.task_rows(queryset, projection)
         return queryset
 
-    def _serialize_tasks(self, tasks):
+    def _serialize_tasks(self, tasks, projection=FULL):
+        """
+        Task 목록을 직렬화
+
+        fast path가 활성화되어 있으면 _task_source()가 반환한 .values() 행을 export_encoder로,
+        아니면 Label Studio 오리지널 Serializer로 직렬화한다. (두 경로의 필드 구성은 동일)
+
+        Args:
+            tasks: _task_source()의 QuerySet (또는 그 slice / 목록)
+            projection: 응답 필드 projection
+
+        Returns:
+            list: 직렬화된 Task 목록
+        """
+        if export_encoder.is_enabled():
+            return export_encoder.encode_tasks(tasks, projection)
+        return self._serialize_tasks_with_serializers(tasks, projection)
+
+    def _serialize_tasks_with_serializers(self, tasks, projection=FULL):
         """
-        Task 목록을 직렬화 (Label Studio 오리지널 Serializer 사용)
+        Task 목록을 Label Studio 오리지널 Serializer로 직렬화
 
         Args:
-            tasks: Task QuerySet
+            tasks: annotations/predictions가 prefetch된 Task 목록
+            projection: 응답 필드 projection
 
         Returns:
             list: 직렬화된 Task 목록
         """
-        tasks_data = []
+        # prefetch_related는 목록 평가 시 함께 실행되므로 query에 prefetch 시간 포함
+        with phase('query'):
+            tasks = list(tasks)
+        with phase('serialize'):
+            return [projection.apply(self._serialize_task(task, projection)) for task in tasks]
+
+    def _serialize_task(self, task, projection=FULL):
+        """
+        Task 하나를 직렬화 (Label Studio 오리지널 Serializer 사용)
 
-        for task in tasks:
-            # Predictions 직렬화 - Label Studio 오리지널 Serializer 사용
+        Args:
+            task: annotations/predictions가 prefetch된 Task
+            projection: 응답 필드 projection (제외된 annotations/predictions는 직렬화 생략)
+
+        Returns:
+            dict: 직렬화된 Task
+        """
+        # Predictions 직렬화 - Label Studio 오리지널 Serializer 사용
+        predictions_data = []
+        if projection.includes('predictions'):
             predictions_data = PredictionSerializer(
                 task.predictions.all(),
                 many=True,
                 read_only=True
             ).data
 
-            # Annotations 직렬화 - Label Studio 오리지널 Serializer 사용
-            annotations = task.annotations.all()
-            annotations_data = AnnotationSerializer(
-                annotations,
-                many=True,
-                read_only=True
-            ).data
+        # Annotations 직렬화 - Label Studio 오리지널 Serializer 사용
+        annotations = task.annotations.all() if projection.includes('annotations') else []
+        annotations_data = AnnotationSerializer(
+            annotations,
+            many=True,
+            read_only=True
+        ).data
 
-            # completed_by_info 추가 (MLOps 요구사항: Webhook enrichment와 동일)
-            for i, annotation in enumerate(annotations):
-                if annotation.completed_by:
-                    annotations_data[i]['completed_by_info'] = {
-                        'id': annotation.completed_by.id,
-                        'email': annotation.completed_by.email,
-                        'username': annotation.completed_by.username,
-                        'is_superuser': annotation.completed_by.is_superuser,
-                    }
-
-            # Task 직렬화
-            task_data = {
-                'id': task.id,
-                'project_id': task.project_id,
-                'data': task.data,
-                'meta': task.meta if hasattr(task, 'meta') and task.meta else {},
-                'created_at': task.created_at,
-                'updated_at': task.updated_at,
-                'is_labeled': task.is_labeled,
-                'annotations': annotations_data,
-                'predictions': predictions_data,
-            }
+        # completed_by_info 추가 (MLOps 요구사항: Webhook enrichment와 동일)
+        # normalize_users이면 응답 최상위 users 맵으로 분리 (_users_map)
+        for i, annotation in enumerate(annotations):
+            if annotation.completed_by and not projection.normalize_users:
+                annotations_data[i]['completed_by_info'] = {
+                    'id': annotation.completed_by.id,
+                    'email': annotation.completed_by.email,
+                    'username': annotation.completed_by.username,
+                    'is_superuser': annotation.completed_by.is_superuser,
+                }
+
+        # Task 직렬화
+        return {
+            'id': task.id,
+            'project_id': task.project_id,
+            'data': task.data,
+            'meta': task.meta if hasattr(task, 'meta') and task.meta else {},
+            'created_at': task.created_at,
+            'updated_at': task.updated_at,
+            'is_labeled': task.is_labeled,
+            'annotations': annotations_data,
+            'predictions': predictions_data,
+        }
+
+
+class ExportStatsAPI(CustomExportAPI):
+    """
+    Custom Export 집계 API
+
+    Export와 같은 필터 조건의 Task 수를 group_by 기준별로 GROUP BY 쿼리 1회로 반환
+    (대시보드가 조합마다 response_type='count'를 반복 호출하지 않도록)
+
+    URL: POST /api/custom/export/stats/
+    """
+
+    def post(self, request):
+        """
+        Request Body: Export 필터 파라미터 + group_by
+        {
+            "project_id": 1,                              // 필수
+            "search_from": "2025-01-01 00:00:00",        // 옵션 (Export와 동일한 필터)
+            "model_version": "bert-v1",                  // 옵션
+            "confirm_user_id": 8,                         // 옵션
+            "group_by": ["model_version", "date"],       // 필수 (model_version, confirm_user, date)
+            "date_granularity": "week"                    // 옵션 (day, week, month, 기본값: day)
+        }
+
+        Response:
+        {
+            "group_by": ["model_version", "date"],
+            "date_granularity": "week",
+            "groups": [
+                {"model_version": "bert-v1", "date": "2025-01-06", "count": 42},
+                ...
+            ]
+        }
+        """
+        serializer = CustomExportStatsRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid request parameters", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        validated_data = serializer.validated_data
+
+        watermark = None
+        if validated_data.get('updated_since') or validated_data.get('updated_until'):
+            watermark = high_water_mark(validated_data.get('updated_until'))
+            validated_data = {**validated_data, 'updated_until': watermark}
 
-            tasks_data.append(task_data)
+        project_id = validated_data['project_id']
+
+        # 프로젝트 generation이 같으면 DB 조회 없이 응답 (Export 결과 캐시와 같은 무효화 규칙)
+        cache_key = None
+        if export_cache.is_enabled():
+            cache_key = export_cache.make_key('stats', project_id, validated_data)
+            cached = export_cache.get_result(cache_key)
+            if cached is not None:
+                response = Response(cached, status=status.HTTP_200_OK)
+                response['X-Export-Cache'] = 'HIT'
+                return response
+
+        if not Project.objects.filter(id=project_id).exists():
+            return Response(
+                {"error": f"Project with id {project_id} does not exist"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        search_date_field = validated_data.get('search_date_field', 'source_created_at')
+        groups = export_stats.aggregate(
+            self._queryset_for(validated_data),
+            validated_data['group_by'],
+            model_version=validated_data.get('model_version'),
+            confirm_user_id=validated_data.get('confirm_user_id'),
+            search_date_field=search_date_field,
+            date_granularity=validated_data.get('date_granularity', 'day'),
+        )
+
+        response_data = {"group_by": validated_data['group_by']}
+        if 'date' in validated_data['group_by']:
+            response_data["date_granularity"] = validated_data.get('date_granularity', 'day')
+        response_data["groups"] = groups
+        if watermark:
+            response_data["watermark"] = watermark
+
+        return self._cached_response(cache_key, response_data)
+
+
+class ExportJobAPI(InstrumentedViewMixin, APIView):
+    """
+    비동기 Export 작업 상태 조회 API
+
+    GET /api/custom/export/jobs/<job_id>/
+
+    권한: 작업 요청자 또는 Admin 사용자
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = get_job_for_user(request.user, job_id)
+        if job is None:
+            return Response(
+                {"error": f"Export job {job_id} does not exist"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(job_payload(job), status=status.HTTP_200_OK)
+
+
+class ExportJobDownloadAPI(InstrumentedViewMixin, APIView):
+    """
+    비동기 Export 결과 파일 다운로드 API (HTTP Range 지원 → 끊긴 다운로드 이어받기)
+
+    GET /api/custom/export/jobs/<job_id>/download
+        Range: bytes=1048576-   (옵션)
+        Accept-Encoding: zstd, gzip   (옵션, worker가 미리 압축한 파일을 그대로 제공)
+
+    권한: 작업 요청자 또는 Admin 사용자
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = get_job_for_user(request.user, job_id)
+        if job is None:
+            return Response(
+                {"error": f"Export job {job_id} does not exist"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if job.status != ExportJob.STATUS_COMPLETED:
+            return Response(
+                {"error": f"Export job is not completed (status: {job.status})"},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        if not job.file_path or not os.path.exists(job.file_path):
+            return Response(
+                {"error": "Export file is no longer available"},
+                status=status.HTTP_410_GONE
+            )
+
+        filename = f"project_{job.project_id}_export{os.path.splitext(job.file_path)[1]}"
+        return file_download_response(
+            request, job.file_path, job.content_type, filename, etag=f"{job.id}-{job.file_size}"
+        )
+
+
+class ExportArtifactDownloadAPI(InstrumentedViewMixin, APIView):
+    """
+    로컬 artifact(delivery="artifact") 다운로드 API (HTTP Range 지원)
+
+    GET /api/custom/export/artifacts/<artifact_id>/download
+        Range: bytes=1048576-   (옵션)
+        Accept-Encoding: zstd, gzip   (옵션, 미리 압축된 파일을 그대로 제공)
+
+    CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT가 설정되면 파일 전송(Range 포함)을 nginx(X-Accel-Redirect)에 위임하고,
+    설정되지 않으면 전체 파일은 sendfile, Range 요청은 mmap 구간으로 전송한다.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, artifact_id):
+        path = export_artifacts.find(artifact_id)
+        if path is None:
+            return Response(
+                {"error": "Export artifact does not exist or has expired"},
+                status=status.HTTP_410_GONE
+            )
+
+        spec = export_artifacts.spec_for(path)
+        filename = f"export_{artifact_id[:12]}.{spec['extension']}"
+
+        prefix = export_artifacts.accel_redirect_prefix()
+        if prefix:
+            return accel_redirect_response(prefix, path, spec['content_type'], filename)
+
+        return file_download_response(request, path, spec['content_type'], filename, etag=artifact_id)
+
+
+class ExportDateIndexAPI(InstrumentedViewMixin, APIView):
+    """
+    Export 날짜 필드 Expression Index 관리 API
+
+    GET    /api/admin/export/date-indexes?project_id=1   인덱스 목록
+    POST   /api/admin/export/date-indexes                인덱스 생성 (CONCURRENTLY)
+    DELETE /api/admin/export/date-indexes                인덱스 삭제 (CONCURRENTLY)
+
+    권한: Admin 사용자만 접근 가능
+
+    Request Body (POST/DELETE):
+    {
+        "project_id": 1,
+        "fields": ["source_created_at"]  (optional, defaults to CUSTOM_EXPORT_DATE_FIELDS)
+    }
+
+    Response:
+    {
+        "success": true,
+        "indexes": [
+            {"name": "cexp_date_p1_source_created_at", "project_id": 1, "field": "source_created_at", ...}
+        ]
+    }
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        project_id = request.query_params.get('project_id')
+        try:
+            indexes = list_date_indexes(int(project_id) if project_id else None)
+        except ValueError:
+            return Response(
+                {'success': False, 'error': 'project_id must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except ExportIndexError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'success': True, 'indexes': indexes}, status=status.HTTP_200_OK)
+
+    def post(self, request):
+        return self._apply(request, create_date_index)
+
+    def delete(self, request):
+        return self._apply(request, drop_date_index)
+
+    def _apply(self, request, operation):
+        project_id = request.data.get('project_id')
+        fields = request.data.get('fields') or configured_date_fields()
+
+        if not project_id:
+            return Response(
+                {'success': False, 'error': 'project_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not isinstance(fields, list):
+            return Response(
+                {'success': False, 'error': 'fields must be a list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not Project.objects.filter(id=project_id).exists():
+            return Response(
+                {'success': False, 'error': f'Project with id {project_id} does not exist'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            results = [operation(project_id, field) for field in fields]
+        except ExportIndexError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {'success': False, 'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
-        return tasks_data
+        return Response({'success': True, 'indexes': results}, status=status.HTTP_200_OK)
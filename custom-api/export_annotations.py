@@ -0,0 +1,63 @@
+"""
+Custom Export API annotation 선택 (annotation_mode)
+
+여러 번 재검수된 Task는 검수자 annotation이 누적되어 응답이 커지지만,
+학습에는 보통 가장 최근 검수 결과만 사용한다. annotation_mode로 필요한 annotation만 SQL에서 골라 조회한다.
+
+- all: 검수자(Super User)의 유효한 annotation 전체 (기본값, 최신순)
+- latest: Task별 최신 검수 annotation 1개
+- latest_per_reviewer: Task별 검수자마다 최신 1개
+- confirm_user: confirm_user_id 검수자의 annotation만
+
+Task별 순위는 ROW_NUMBER() OVER (PARTITION BY task_id ...) window 함수로 계산하며,
+fast path(export_encoder)와 Serializer 경로(Prefetch)가 같은 QuerySet을 사용한다.
+Export 대상 Task 판정(검수자 annotation 존재 여부)에는 영향을 주지 않는다.
+"""
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+ANNOTATION_MODES = ('all', 'latest', 'latest_per_reviewer', 'confirm_user')
+
+RANK_ALIAS = '_annotation_rank'
+
+LATEST_ORDER = (F('created_at').desc(), F('id').desc())
+
+
+class AnnotationSelection:
+    """
+    응답에 포함할 annotation 선택 규칙 (검수자의 유효한 annotation QuerySet 기준)
+    """
+
+    def __init__(self, mode='all', confirm_user_id=None):
+        self.mode = mode
+        self.confirm_user_id = confirm_user_id
+
+    @classmethod
+    def from_validated(cls, validated_data):
+        return cls(
+            mode=validated_data.get('annotation_mode') or 'all',
+            confirm_user_id=validated_data.get('confirm_user_id'),
+        )
+
+    def _latest(self, queryset, partition_by):
+        return queryset.annotate(**{
+            RANK_ALIAS: Window(RowNumber(), partition_by=partition_by, order_by=list(LATEST_ORDER))
+        }).filter(**{RANK_ALIAS: 1})
+
+    def apply(self, queryset):
+        """
+        annotation QuerySet에 선택 규칙 + 응답 정렬(최신순) 적용
+        """
+        if self.mode == 'confirm_user':
+            queryset = queryset.filter(completed_by_id=self.confirm_user_id)
+        elif self.mode == 'latest':
+            queryset = self._latest(queryset, [F('task_id')])
+        elif self.mode == 'latest_per_reviewer':
+            queryset = self._latest(queryset, [F('task_id'), F('completed_by_id')])
+        else:
+            return queryset.order_by('-created_at')
+        return queryset.order_by(*LATEST_ORDER)
+
+
+ALL = AnnotationSelection()
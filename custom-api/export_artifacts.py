@@ -0,0 +1,119 @@
+"""
+Custom Export API 로컬 artifact (delivery="artifact")
+
+같은 Export를 여러 번 내려받는 경우(학습 재시도, 여러 consumer) 매번 조회/직렬화하지 않도록
+결과를 Label Studio 데이터 볼륨에 content-addressed 파일로 기록하고 다운로드 URL만 반환한다.
+
+- artifact ID = sha256(검증된 요청 파라미터 해시 + 프로젝트 / global generation) (export_cache.make_key)
+  → 같은 필터 + 같은 generation의 요청은 기록된 파일을 재사용 (DB 조회 없음)
+- 파일: CUSTOM_EXPORT_ARTIFACT_DIR/<artifact_id>.<ndjson|parquet|arrow> (+ 미리 압축된 .gz / .zst)
+- CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS가 지난 파일은 재사용/다운로드하지 않으며
+  run_export_worker가 주기적으로 삭제 (시그널을 거치지 않는 bulk 쓰기도 TTL 이후 반영)
+- 다운로드: FileResponse(wsgi.file_wrapper → sendfile) / Range는 mmap 구간, 또는 CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT 설정 시
+  nginx X-Accel-Redirect로 파일 전송을 웹 서버에 위임 (Range 포함, 본문이 Python을 거치지 않음)
+"""
+
+import datetime
+import hashlib
+import os
+import re
+import time
+
+from django.conf import settings
+
+from . import export_cache
+from .export_formats import COLUMNAR_FORMATS
+from .export_jobs import NDJSON_FORMAT, remove_files, write_export_file
+
+ARTIFACT_ID_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+# 확장자 → 형식 (다운로드 시 content type 결정)
+ARTIFACT_FORMATS = {spec['extension']: spec for spec in (NDJSON_FORMAT, *COLUMNAR_FORMATS.values())}
+
+
+def artifact_dir():
+    default = os.path.join(getattr(settings, 'BASE_DATA_DIR', '/tmp'), 'custom_export_artifacts')
+    return getattr(settings, 'CUSTOM_EXPORT_ARTIFACT_DIR', None) or default
+
+
+def ttl_seconds():
+    return getattr(settings, 'CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS', 3600)
+
+
+def accel_redirect_prefix():
+    return getattr(settings, 'CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT', '')
+
+
+def artifact_id(project_id, validated_data):
+    """
+    요청 파라미터 + 프로젝트 generation → artifact ID (content address)
+    """
+    key = export_cache.make_key('artifact', project_id, validated_data)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _is_fresh(path):
+    return os.path.getmtime(path) + ttl_seconds() > time.time()
+
+
+def find(artifact_id):
+    """
+    만료되지 않은 artifact 파일 경로 (없으면 None)
+    """
+    if not ARTIFACT_ID_PATTERN.match(artifact_id or ''):
+        return None
+    for extension in ARTIFACT_FORMATS:
+        path = os.path.join(artifact_dir(), f"{artifact_id}.{extension}")
+        if os.path.exists(path) and _is_fresh(path):
+            return path
+    return None
+
+
+def store(artifact_id, spec, blocks):
+    """
+    Export 결과 blocks → artifact 파일 (임시 경로 기록 후 rename)
+    """
+    os.makedirs(artifact_dir(), exist_ok=True)
+    path = os.path.join(artifact_dir(), f"{artifact_id}.{spec['extension']}")
+    return write_export_file(path, blocks, spec['content_type'])
+
+
+def spec_for(path):
+    return ARTIFACT_FORMATS[os.path.splitext(path)[1].lstrip('.')]
+
+
+def artifact_payload(artifact_id, path, reused):
+    """
+    artifact 응답 (다운로드 URL + 파일 정보)
+    """
+    expires_at = datetime.datetime.fromtimestamp(os.path.getmtime(path) + ttl_seconds(), tz=datetime.timezone.utc)
+    return {
+        "artifact_id": artifact_id,
+        "reused": reused,
+        "content_type": spec_for(path)['content_type'],
+        "file_size": os.path.getsize(path),
+        "expires_at": expires_at,
+        "download_url": f"/api/custom/export/artifacts/{artifact_id}/download",
+    }
+
+
+def cleanup_expired_artifacts():
+    """
+    TTL이 지난 artifact 파일 삭제
+
+    Returns:
+        int: 삭제된 artifact 수
+    """
+    directory = artifact_dir()
+    if not os.path.isdir(directory):
+        return 0
+
+    deleted = 0
+    for name in os.listdir(directory):
+        stem, _, extension = name.partition('.')
+        path = os.path.join(directory, name)
+        if not ARTIFACT_ID_PATTERN.match(stem) or extension not in ARTIFACT_FORMATS or _is_fresh(path):
+            continue
+        remove_files(path)
+        deleted += 1
+    return deleted
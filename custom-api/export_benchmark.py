@@ -0,0 +1,335 @@
+"""
+Custom Export API 벤치마크
+
+- seed_project: 합성 프로젝트 생성 (Task / annotation / prediction 수, 검수자 비율, payload 크기 지정)
+- run_suite: count / 페이지 / 깊은 페이지 / cursor / 전체 / 스트리밍 Export 시나리오를 실제 View로 실행하여
+  소요 시간, SQL 쿼리 수, 응답 크기, 처리량, 프로세스 최대 RSS를 측정하고 JSON 리포트로 반환
+
+릴리스 간 회귀 비교를 위해 결과 캐시는 끄고 실행하며, 리포트에는 측정 조건(설정 플래그, 데이터 규모)을 함께 기록한다.
+명령: seed_export_benchmark, benchmark_export
+"""
+
+import datetime
+import json
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from organizations.models import Organization
+from projects.models import Project
+from tasks.models import Annotation, Prediction, Task
+
+from .export_eligibility import backfill_project, use_eligibility_table
+from .export_pagination import encode_cursor
+from .export_serializers import CustomExportRequestSerializer
+
+SEED_BATCH_SIZE = 1000
+
+# deep_page / cursor는 같은 마지막 페이지를 OFFSET / keyset으로 읽어 비교
+SCENARIOS = ('count', 'page', 'deep_page', 'cursor', 'full', 'stream')
+
+LABEL_CONFIG = (
+    '<View><Text name="text" value="$text"/>'
+    '<Choices name="label" toName="text"><Choice value="A"/><Choice value="B"/><Choice value="C"/></Choices>'
+    '</View>'
+)
+
+WORDS = ('alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel', 'india', 'juliet')
+
+
+def _payload(rng, size):
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def _result(rng):
+    return [{
+        'from_name': 'label',
+        'to_name': 'text',
+        'type': 'choices',
+        'value': {'choices': [rng.choice(('A', 'B', 'C'))]},
+    }]
+
+
+def _benchmark_users(prefix, reviewers, annotators):
+    """
+    검수자(Super User) / 일반 annotator 계정 (이미 있으면 재사용)
+    """
+    User = get_user_model()
+    users = {'reviewers': [], 'annotators': []}
+    for role, count, is_superuser in (('reviewers', reviewers, True), ('annotators', annotators, False)):
+        for index in range(count):
+            email = f"{prefix}-{role[:-1]}-{index}@benchmark.local"
+            user = User.objects.filter(email=email).first()
+            if user is None:
+                user = User.objects.create_user(username=email, email=email, password=None)
+            if user.is_superuser != is_superuser:
+                user.is_superuser = is_superuser
+                user.save(update_fields=['is_superuser'])
+            users[role].append(user)
+    return users
+
+
+def seed_project(tasks, annotations_per_task=1, predictions_per_task=1, reviewers=3, annotators=5,
+                 reviewer_ratio=0.8, payload_bytes=512, model_versions=3, days=365, seed=0,
+                 batch_size=SEED_BATCH_SIZE, progress=None):
+    """
+    합성 벤치마크 프로젝트 생성
+
+    Args:
+        tasks: Task 수
+        annotations_per_task: Task당 annotation 수
+        predictions_per_task: Task당 prediction 수 (model_version은 순환 배정)
+        reviewers: 검수자(Super User) 수
+        annotators: 일반 annotator 수
+        reviewer_ratio: 검수자가 작성하는 annotation 비율 (나머지는 일반 annotator, Export 대상 비율 결정)
+        payload_bytes: task.data['text'] 크기
+        model_versions: prediction model_version 종류 수
+        days: task.data['source_created_at'] 분포 기간 (오늘 기준 과거 일수)
+        seed: 난수 seed (같은 값이면 같은 데이터)
+        batch_size: bulk_create 단위
+        progress: callable(created_tasks) - 배치마다 호출
+
+    Returns:
+        Project
+    """
+    rng = random.Random(seed)
+    prefix = f"bench{seed}"
+
+    users = _benchmark_users(prefix, max(reviewers, 1), annotators)
+    owner = users['reviewers'][0]
+    organization = Organization.objects.create(title=f"Export Benchmark {prefix}")
+    for user in users['reviewers'] + users['annotators']:
+        organization.add_user(user)
+
+    project = Project.objects.create(
+        title=f"Export Benchmark ({tasks} tasks, seed={seed})",
+        organization=organization,
+        created_by=owner,
+        label_config=LABEL_CONFIG,
+    )
+
+    versions = [f"bench-v{index + 1}" for index in range(max(model_versions, 1))]
+    start = timezone.now() - datetime.timedelta(days=days)
+    span_seconds = days * 86400
+
+    created = 0
+    while created < tasks:
+        count = min(batch_size, tasks - created)
+        with transaction.atomic():
+            batch = Task.objects.bulk_create([
+                Task(project=project, data={
+                    'text': _payload(rng, payload_bytes),
+                    'source_created_at': (
+                        start + datetime.timedelta(seconds=rng.randrange(span_seconds))
+                    ).strftime('%Y-%m-%d %H:%M:%S'),
+                })
+                for _ in range(count)
+            ])
+
+            annotations = []
+            predictions = []
+            for task in batch:
+                for _ in range(annotations_per_task):
+                    pool = users['reviewers'] if not users['annotators'] or rng.random() < reviewer_ratio \
+                        else users['annotators']
+                    annotations.append(Annotation(
+                        task=task, project=project, completed_by=rng.choice(pool), result=_result(rng)
+                    ))
+                for index in range(predictions_per_task):
+                    predictions.append(Prediction(
+                        task=task, project=project, model_version=versions[index % len(versions)],
+                        score=round(rng.random(), 4), result=_result(rng)
+                    ))
+            Annotation.objects.bulk_create(annotations, batch_size=batch_size)
+            Prediction.objects.bulk_create(predictions, batch_size=batch_size)
+
+        created += count
+        if progress:
+            progress(created)
+
+    # bulk_create는 시그널을 거치지 않으므로 비정규화 테이블 사용 시 직접 채움
+    if use_eligibility_table():
+        backfill_project(project.id)
+
+    return project
+
+
+def _peak_rss_mb():
+    # Linux: KB, macOS: bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _request(view, user, body, accept_encoding=None):
+    factory = APIRequestFactory()
+    extra = {'HTTP_ACCEPT_ENCODING': accept_encoding} if accept_encoding else {}
+    request = factory.post('/api/custom/export/', body, format='json', **extra)
+    force_authenticate(request, user=user)
+    return view(request)
+
+
+def _consume(response):
+    """
+    응답 본문 전체 수신 → (bytes 수, JSON 본문 또는 None)
+    """
+    if response.streaming:
+        return sum(len(chunk) for chunk in response.streaming_content), None
+    response.render()
+    content = response.content
+    if response.get('Content-Encoding'):
+        return len(content), None
+    return len(content), json.loads(content)
+
+
+def _last_page_offset(total, page_size):
+    return (max((total + page_size - 1) // page_size, 1) - 1) * page_size
+
+
+def _last_page_cursor(view, project_id, extra_params, offset):
+    """
+    마지막 페이지 직전 Task의 cursor (deep_page와 같은 위치를 keyset으로 조회)
+    """
+    if offset == 0:
+        return None
+    serializer = CustomExportRequestSerializer(data={'project_id': project_id, **extra_params})
+    serializer.is_valid(raise_exception=True)
+    queryset = view.view_class()._queryset_for(serializer.validated_data)
+    return encode_cursor(queryset.only('id', 'created_at')[offset - 1])
+
+
+def _scenario_body(name, project_id, page_size, total, cursor=None):
+    body = {'project_id': project_id}
+    if name == 'count':
+        body['response_type'] = 'count'
+    elif name == 'page':
+        body.update(page=1, page_size=page_size)
+    elif name == 'deep_page':
+        body.update(page=_last_page_offset(total, page_size) // page_size + 1, page_size=page_size)
+    elif name == 'cursor':
+        body.update(pagination='cursor', page_size=page_size)
+        if cursor:
+            body['cursor'] = cursor
+    elif name == 'stream':
+        body['response_type'] = 'stream'
+    return body
+
+
+def _expected_tasks(name, page_size, total):
+    """
+    시나리오 응답의 Task 수 (압축 응답도 본문을 해석하지 않고 처리량 계산)
+    """
+    if name == 'count':
+        return 0
+    if name == 'page':
+        return min(page_size, total)
+    if name in ('deep_page', 'cursor'):
+        return total - _last_page_offset(total, page_size)
+    return total
+
+
+def run_suite(project_id, user, scenarios=SCENARIOS, page_size=1000, repeat=3, accept_encoding=None,
+              extra_params=None):
+    """
+    시나리오별 Export 실행 및 측정
+
+    Args:
+        project_id: 벤치마크 대상 프로젝트
+        user: 요청 사용자 (Super User 권장)
+        scenarios: SCENARIOS 중 실행할 시나리오
+        page_size: page / deep_page / cursor 페이지 크기
+        repeat: 시나리오별 반복 횟수 (시간은 min / median 모두 기록)
+        accept_encoding: 요청 Accept-Encoding (None이면 압축 없음)
+        extra_params: 모든 요청에 추가할 Export 파라미터 (예: {"model_version": "bench-v1"})
+
+    Returns:
+        dict: JSON 리포트
+    """
+    from .export import CustomExportAPI
+
+    view = CustomExportAPI.as_view()
+    extra_params = extra_params or {}
+
+    report = {
+        'generated_at': timezone.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'database': connection.vendor,
+        },
+        'settings': {
+            name: getattr(settings, name, None) for name in (
+                'CUSTOM_EXPORT_FAST_SERIALIZER',
+                'CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE',
+                'CUSTOM_EXPORT_STREAM_CHUNK_SIZE',
+                'CUSTOM_EXPORT_COMPRESSION_ENABLED',
+            )
+        },
+        'dataset': {
+            'project_id': project_id,
+            'tasks': Task.objects.filter(project_id=project_id).count(),
+            'annotations': Annotation.objects.filter(project_id=project_id).count(),
+            'predictions': Prediction.objects.filter(project_id=project_id).count(),
+        },
+        'parameters': {
+            'page_size': page_size,
+            'repeat': repeat,
+            'accept_encoding': accept_encoding,
+            'extra_params': extra_params,
+        },
+        'scenarios': {},
+    }
+
+    # 반복 실행이 결과 캐시에 맞지 않도록 캐시를 끄고 측정
+    with override_settings(CUSTOM_EXPORT_CACHE_ENABLED=False):
+        total = _consume(_request(view, user, {
+            'project_id': project_id, 'response_type': 'count', **extra_params
+        }))[1]['total']
+        report['dataset']['export_tasks'] = total
+        cursor = _last_page_cursor(view, project_id, extra_params, _last_page_offset(total, page_size)) \
+            if 'cursor' in scenarios else None
+
+        for name in scenarios:
+            timings = []
+            queries = 0
+            size = 0
+            tasks = _expected_tasks(name, page_size, total)
+            for _ in range(repeat):
+                body = {**_scenario_body(name, project_id, page_size, total, cursor), **extra_params}
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    response = _request(view, user, body, accept_encoding)
+                    size, payload = _consume(response)
+                    timings.append(time.perf_counter() - started)
+                queries = len(captured)
+
+                if response.status_code != 200:
+                    raise RuntimeError(f"scenario={name} status={response.status_code} body={payload}")
+
+            best = min(timings)
+            report['scenarios'][name] = {
+                'request': body,
+                'seconds_min': round(best, 4),
+                'seconds_median': round(statistics.median(timings), 4),
+                'queries': queries,
+                'response_bytes': size,
+                'tasks': tasks,
+                'tasks_per_second': round(tasks / best, 1) if tasks and best else None,
+                'peak_rss_mb': _peak_rss_mb(),
+            }
+
+    return report
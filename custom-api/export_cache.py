@@ -0,0 +1,172 @@
+"""
+Custom Export API 결과 캐시
+
+count / 페이지 응답을 (검증된 요청 파라미터 해시 + 프로젝트 generation) 키로 캐시한다.
+
+- 결과: 프로세스 로컬 LRU (최대 개수 + TTL 만료)
+- generation: Django cache (CUSTOM_EXPORT_CACHE_ALIAS)에 저장되는 프로젝트별 카운터
+  Task / Annotation / Prediction 저장·삭제 시그널(custom_api.signals)이 증가시키므로
+  쓰기가 발생하면 이전 generation의 캐시 항목은 더 이상 조회되지 않는다.
+- 여러 Pod 환경에서는 CUSTOM_EXPORT_CACHE_ALIAS를 공유 캐시(Redis 등)로 설정해야
+  다른 Pod의 쓰기도 즉시 반영된다. (로컬 캐시이면 TTL만큼 지연될 수 있음)
+- bulk 작업처럼 시그널을 거치지 않는 쓰기는 TTL이 지나면 반영된다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+GENERATION_KEY = 'custom_export:generation:{scope}'
+GLOBAL_SCOPE = 'global'
+
+
+class LRUCache:
+    """
+    TTL 만료를 지원하는 스레드 안전 LRU 캐시
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        캐시 조회 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        캐시 저장 (최대 개수 초과 시 가장 오래 사용되지 않은 항목 제거)
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_results = None
+_results_lock = threading.Lock()
+
+
+def _result_cache():
+    global _results
+    if _results is None:
+        with _results_lock:
+            if _results is None:
+                _results = LRUCache(
+                    max_entries=getattr(settings, 'CUSTOM_EXPORT_CACHE_MAX_ENTRIES', 256),
+                    ttl=getattr(settings, 'CUSTOM_EXPORT_CACHE_TTL', 60),
+                )
+    return _results
+
+
+def is_enabled():
+    return getattr(settings, 'CUSTOM_EXPORT_CACHE_ENABLED', True)
+
+
+def _generation_store():
+    return caches[getattr(settings, 'CUSTOM_EXPORT_CACHE_ALIAS', 'default')]
+
+
+def _initial_generation():
+    # generation 키가 캐시에서 제거(eviction)되어도 이전 값과 겹치지 않도록 시각 기반 초기값 사용
+    return time.time_ns()
+
+
+def get_generation(scope):
+    """
+    프로젝트(또는 global) generation 조회
+    """
+    store = _generation_store()
+    key = GENERATION_KEY.format(scope=scope)
+
+    generation = store.get(key)
+    if generation is None:
+        store.add(key, _initial_generation(), timeout=None)
+        generation = store.get(key)
+    return generation
+
+
+def bump_generation(scope):
+    """
+    프로젝트(또는 global) generation 증가 → 해당 범위의 캐시 항목 무효화
+    """
+    store = _generation_store()
+    key = GENERATION_KEY.format(scope=scope)
+
+    try:
+        store.incr(key)
+    except ValueError:
+        store.set(key, _initial_generation(), timeout=None)
+
+
+def bump_project_generation(project_id):
+    if project_id is not None:
+        bump_generation(f'project:{project_id}')
+
+
+def bump_global_generation():
+    """
+    전체 프로젝트 캐시 무효화 (사용자 superuser 권한 변경 등)
+    """
+    bump_generation(GLOBAL_SCOPE)
+
+
+def make_key(kind, project_id, params):
+    """
+    캐시 키 = kind + 검증된 요청 파라미터 해시 + 프로젝트/global generation
+
+    요청 처리 시작 시점의 generation으로 키를 만들어야 처리 도중 발생한 쓰기가
+    저장되는 결과에 반영되지 않은 경우에도 다음 요청에서 무효화된다.
+    """
+    payload = json.dumps(params, sort_keys=True, default=str, separators=(',', ':'))
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return (
+        f"{kind}:{digest}:"
+        f"{get_generation(f'project:{project_id}')}:{get_generation(GLOBAL_SCOPE)}"
+    )
+
+
+def get_result(key):
+    """
+    캐시된 응답 조회 (없거나 만료되었으면 None)
+    """
+    return _result_cache().get(key)
+
+
+def set_result(key, value):
+    _result_cache().set(key, value)
+
+
+def clear():
+    """
+    프로세스 로컬 결과 캐시 비우기 (테스트/운영 도구용)
+    """
+    _result_cache().clear()
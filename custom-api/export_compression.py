@@ -0,0 +1,222 @@
+"""
+Custom Export API 응답 압축 (gzip / zstd)
+
+Export 응답은 같은 label 이름, completed_by_info, model_version 문자열이 반복되는 JSON이므로
+압축률이 높다. Accept-Encoding 협상 결과에 따라
+
+- 일반 응답(count / data / 페이지): 렌더링된 본문이 CUSTOM_EXPORT_COMPRESSION_MIN_SIZE 이상이면 압축
+- 스트리밍 응답(stream): chunk마다 압축 후 flush하여 클라이언트가 즉시 받을 수 있도록 증분 압축
+- 비동기 작업 결과 파일: worker가 파일을 기록할 때 .gz / .zst 파일을 함께 기록하고
+  다운로드 시 미리 압축된 파일을 그대로 제공 (다운로드마다 다시 압축하지 않음, Range 지원)
+
+zstd는 zstandard 패키지가 설치된 경우에만 사용한다. (없으면 gzip만 협상)
+컬럼형 형식(Parquet / Arrow)은 파일 내부에서 이미 압축되므로 제외한다.
+"""
+
+import os
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from .export_formats import COLUMNAR_FORMATS
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 협상 우선순위 (q 값이 같으면 앞쪽 우선)
+ENCODINGS = ('zstd', 'gzip')
+
+# 미리 압축된 결과 파일 확장자
+ENCODING_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+SKIP_CONTENT_TYPES = {spec['content_type'] for spec in COLUMNAR_FORMATS.values()}
+
+
+def is_enabled():
+    return getattr(settings, 'CUSTOM_EXPORT_COMPRESSION_ENABLED', True)
+
+
+def min_size():
+    return getattr(settings, 'CUSTOM_EXPORT_COMPRESSION_MIN_SIZE', 1024)
+
+
+def available_encodings():
+    return [encoding for encoding in ENCODINGS if encoding != 'zstd' or zstandard is not None]
+
+
+def _level(encoding):
+    if encoding == 'zstd':
+        return getattr(settings, 'CUSTOM_EXPORT_ZSTD_LEVEL', 3)
+    return getattr(settings, 'CUSTOM_EXPORT_GZIP_LEVEL', 6)
+
+
+def _parse_accept_encoding(header):
+    """
+    Accept-Encoding → {coding: q}
+    """
+    accepted = {}
+    for item in (header or '').split(','):
+        parts = [part.strip() for part in item.split(';')]
+        coding = parts[0].lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(request, encodings=None):
+    """
+    요청 Accept-Encoding에서 사용할 압축 방식 선택
+
+    Args:
+        request: HTTP 요청
+        encodings: 후보 목록 (기본값: 설치된 방식 전체, 우선순위 순)
+
+    Returns:
+        str | None: 'zstd' / 'gzip' / None (압축 안 함)
+    """
+    accepted = _parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING'))
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_q = None, 0.0
+    for encoding in (available_encodings() if encodings is None else encodings):
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _GzipStream:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def compressor(encoding):
+    """
+    증분 압축기 (compress(chunk)는 flush까지 수행하여 chunk 단위로 바로 전송 가능)
+    """
+    if encoding == 'zstd':
+        return _ZstdStream(_level(encoding))
+    return _GzipStream(_level(encoding))
+
+
+def compress_bytes(encoding, data):
+    stream = compressor(encoding)
+    return stream.compress(data) + stream.finish()
+
+
+def compress_iter(encoding, chunks):
+    """
+    bytes chunk iterator → 압축된 chunk iterator
+    """
+    stream = compressor(encoding)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        compressed = stream.compress(chunk)
+        if compressed:
+            yield compressed
+    yield stream.finish()
+
+
+def _weaken_etag(response):
+    # 압축된 표현은 원본과 바이트가 다르므로 strong ETag를 weak로 변경 (GZipMiddleware와 동일)
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+
+
+def compress_response(request, response):
+    """
+    응답 본문 압축 (렌더링이 끝난 응답 / 스트리밍 응답)
+    """
+    if not is_enabled() or response.status_code != 200 or response.has_header('Content-Encoding'):
+        return response
+
+    content_type = response.get('Content-Type', '').split(';')[0].strip()
+    if content_type in SKIP_CONTENT_TYPES:
+        return response
+
+    patch_vary_headers(response, ('Accept-Encoding',))
+    encoding = negotiate(request)
+    if encoding is None:
+        return response
+
+    if response.streaming:
+        response.streaming_content = compress_iter(encoding, response.streaming_content)
+        if response.has_header('Content-Length'):
+            del response['Content-Length']
+    else:
+        if len(response.content) < min_size():
+            return response
+        response.content = compress_bytes(encoding, response.content)
+        response['Content-Length'] = str(len(response.content))
+
+    _weaken_etag(response)
+    response['Content-Encoding'] = encoding
+    return response
+
+
+def apply(request, response):
+    """
+    View 응답에 압축 적용 (DRF Response는 렌더링 후 post-render callback에서 압축)
+    """
+    if hasattr(response, 'add_post_render_callback') and not response.is_rendered:
+        response.add_post_render_callback(lambda rendered: compress_response(request, rendered))
+        return response
+    return compress_response(request, response)
+
+
+def precompress_encodings(content_type):
+    """
+    비동기 작업 결과 파일과 함께 기록할 압축 방식 (CUSTOM_EXPORT_JOB_PRECOMPRESS)
+    """
+    if content_type in SKIP_CONTENT_TYPES:
+        return []
+    configured = getattr(settings, 'CUSTOM_EXPORT_JOB_PRECOMPRESS', ['gzip', 'zstd'])
+    return [encoding for encoding in available_encodings() if encoding in configured]
+
+
+def precompressed_path(path, encoding):
+    return f"{path}{ENCODING_SUFFIXES[encoding]}"
+
+
+def existing_precompressed(path):
+    """
+    결과 파일의 미리 압축된 파일이 있는 압축 방식 목록 (협상 우선순위 순)
+    """
+    return [
+        encoding for encoding in available_encodings()
+        if os.path.exists(precompressed_path(path, encoding))
+    ]
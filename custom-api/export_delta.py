@@ -0,0 +1,83 @@
+"""
+Custom Export API 증분(delta) Export
+
+updated_since / updated_until 구간에 Task, 검수자 annotation, prediction 중 하나라도
+수정된 Task만 남긴다. 구간은 (updated_since, updated_until] 반열림 구간이며,
+응답의 watermark를 다음 요청의 updated_since로 사용하면 연속 호출에서 누락/중복이 없다.
+
+- watermark: min(updated_until, 현재 시각 - CUSTOM_EXPORT_DELTA_SAFETY_SECONDS)
+  updated_at은 commit 전에 기록되므로, 진행 중인 트랜잭션이 나중에 commit하는 변경과
+  Pod 간 시계 차이를 안전 구간만큼 다음 호출로 미룬다.
+- 후보 Task ID는 세 테이블의 (project_id, updated_at) 인덱스 범위 탐색 UNION으로 구하므로
+  비용이 프로젝트 크기가 아니라 변경 건수에 비례한다. (인덱스: migrations/0004_delta_indexes)
+- annotation/prediction 삭제는 updated_at이 남지 않으므로 감지하지 못한다.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from tasks.models import Annotation, Prediction, Task
+
+
+def _safety_seconds():
+    return getattr(settings, 'CUSTOM_EXPORT_DELTA_SAFETY_SECONDS', 30)
+
+
+def high_water_mark(updated_until=None):
+    """
+    이번 요청의 상한(watermark) - 요청 updated_until을 안전 시각 이하로 제한
+
+    Returns:
+        datetime: UTC aware datetime
+    """
+    safe = timezone.now() - datetime.timedelta(seconds=_safety_seconds())
+    if updated_until is None:
+        return safe.astimezone(datetime.timezone.utc)
+    if timezone.is_naive(updated_until):
+        updated_until = timezone.make_aware(updated_until, datetime.timezone.utc)
+    return min(updated_until, safe).astimezone(datetime.timezone.utc)
+
+
+def _window(queryset, updated_since, updated_until):
+    if updated_since is not None:
+        queryset = queryset.filter(updated_at__gt=updated_since)
+    if updated_until is not None:
+        queryset = queryset.filter(updated_at__lte=updated_until)
+    return queryset
+
+
+def changed_task_ids_sql(project_id, updated_since, updated_until):
+    """
+    구간 내 변경된 Task ID SELECT (Task ∪ 검수자 annotation ∪ prediction)
+
+    Returns:
+        tuple: (sql, params)
+    """
+    sources = [
+        _window(Task.objects.filter(project_id=project_id), updated_since, updated_until)
+        .values('id'),
+        _window(Annotation.objects.filter(project_id=project_id), updated_since, updated_until)
+        .filter(completed_by__is_superuser=True)
+        .values('task_id'),
+        _window(Prediction.objects.filter(project_id=project_id), updated_since, updated_until)
+        .values('task_id'),
+    ]
+
+    parts = []
+    params = []
+    for source in sources:
+        sql, source_params = source.order_by().query.sql_with_params()
+        parts.append(f"({sql})")
+        params.extend(source_params)
+    return ' UNION '.join(parts), tuple(params)
+
+
+def filter_changed(queryset, project_id, updated_since, updated_until):
+    """
+    구간 내 변경된 Task만 남기는 필터
+    """
+    sql, params = changed_task_ids_sql(project_id, updated_since, updated_until)
+    return queryset.filter(id__in=RawSQL(sql, params))
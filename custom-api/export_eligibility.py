@@ -0,0 +1,162 @@
+"""
+Custom Export API 대상 Task(eligibility) 비정규화 테이블 관리
+
+Export 필수 조건 "검수자(Super User)의 유효한(was_cancelled=False) annotation이 있는 Task"를
+TaskExportEligibility에 Task별로 미리 계산해 둔다.
+
+- 갱신 (CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=true일 때만): Annotation / Prediction 저장·삭제 시그널 (트랜잭션 commit 후),
+  Superuser 승격/해제 API (해당 사용자의 annotation이 달린 Task 전체, run_export_worker 작업으로 실행)
+- 초기 채우기: python manage.py backfill_export_eligibility --all-projects
+- 사용: CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=true 이면 Export/count가
+  annotation ↔ user JOIN 대신 (project_id) WHERE is_eligible partial index를 사용
+"""
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Exists, OuterRef
+
+from tasks.models import Annotation, Prediction, Task
+
+from .models import TaskExportEligibility
+
+REFRESH_BATCH_SIZE = 1000
+
+
+def use_eligibility_table():
+    """
+    Export 필터에 비정규화 테이블 사용 여부 (backfill 완료 후 활성화)
+    """
+    return getattr(settings, 'CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE', False)
+
+
+def valid_annotations():
+    """
+    검수자(Super User)의 유효한(was_cancelled=False) annotation QuerySet
+    """
+    return Annotation.objects.filter(
+        completed_by__is_superuser=True,
+        was_cancelled=False
+    )
+
+
+def _batches(ids, size):
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _refresh_batch(task_ids):
+    tasks = dict(Task.objects.filter(id__in=task_ids).values_list('id', 'project_id'))
+    if not tasks:
+        return 0
+
+    # task별 가장 최근 유효 annotation (task_id 순 → 최신순, 첫 행만 사용)
+    latest = {}
+    reviews = valid_annotations().filter(task_id__in=tasks.keys()).order_by(
+        'task_id', '-created_at', '-id'
+    ).values_list('task_id', 'completed_by_id', 'created_at')
+    for task_id, reviewer_id, reviewed_at in reviews:
+        latest.setdefault(task_id, (reviewer_id, reviewed_at))
+
+    model_versions = {}
+    predictions = Prediction.objects.filter(
+        task_id__in=tasks.keys()
+    ).exclude(model_version__isnull=True).exclude(model_version='').values_list(
+        'task_id', 'model_version'
+    ).distinct()
+    for task_id, model_version in predictions:
+        model_versions.setdefault(task_id, set()).add(model_version)
+
+    rows = []
+    for task_id, project_id in tasks.items():
+        reviewer_id, reviewed_at = latest.get(task_id, (None, None))
+        rows.append(TaskExportEligibility(
+            task_id=task_id,
+            project_id=project_id,
+            is_eligible=task_id in latest,
+            latest_reviewer_id=reviewer_id,
+            latest_reviewed_at=reviewed_at,
+            model_versions=sorted(model_versions.get(task_id, ())),
+        ))
+
+    TaskExportEligibility.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['task'],
+        update_fields=[
+            'project_id', 'is_eligible', 'latest_reviewer_id',
+            'latest_reviewed_at', 'model_versions', 'updated_at',
+        ],
+    )
+    return len(rows)
+
+
+def refresh_tasks(task_ids):
+    """
+    Task 목록의 eligibility 재계산 (삭제된 Task는 건너뜀)
+
+    Returns:
+        int: 갱신된 Task 수
+    """
+    refreshed = 0
+    for batch in _batches(set(task_ids), REFRESH_BATCH_SIZE):
+        refreshed += _refresh_batch(batch)
+    return refreshed
+
+
+def refresh_user_tasks(user_id):
+    """
+    사용자가 작성한 annotation이 달린 Task 전체 재계산 (Superuser 승격/해제 시)
+
+    Returns:
+        int: 갱신된 Task 수
+    """
+    task_ids = Annotation.objects.filter(
+        completed_by_id=user_id
+    ).values_list('task_id', flat=True).distinct()
+    return refresh_tasks(task_ids)
+
+
+def backfill_project(project_id, batch_size=REFRESH_BATCH_SIZE):
+    """
+    프로젝트 전체 Task의 eligibility 계산 (기존 데이터 / 시그널을 거치지 않은 bulk 작업 반영)
+
+    Returns:
+        int: 갱신된 Task 수
+    """
+    task_ids = Task.objects.filter(project_id=project_id).order_by('id').values_list('id', flat=True)
+
+    refreshed = 0
+    batch = []
+    for task_id in task_ids.iterator(chunk_size=batch_size):
+        batch.append(task_id)
+        if len(batch) >= batch_size:
+            refreshed += _refresh_batch(batch)
+            batch = []
+    if batch:
+        refreshed += _refresh_batch(batch)
+    return refreshed
+
+
+def filter_eligible(queryset, model_version=None):
+    """
+    비정규화 테이블 기반 Export 필수 조건 (+ 모델 버전) 필터
+
+    Task와 TaskExportEligibility는 1:1이므로 JOIN해도 행이 늘지 않는다.
+    model_versions JSON 포함 검색(@>)은 PostgreSQL에서만 사용하고,
+    그 외 DB는 prediction EXISTS 서브쿼리로 처리한다.
+    """
+    queryset = queryset.filter(export_eligibility__is_eligible=True)
+
+    if model_version:
+        if connection.vendor == 'postgresql':
+            queryset = queryset.filter(export_eligibility__model_versions__contains=[model_version])
+        else:
+            queryset = queryset.filter(
+                Exists(Prediction.objects.filter(
+                    task_id=OuterRef('pk'),
+                    model_version=model_version
+                ))
+            )
+
+    return queryset
@@ -0,0 +1,417 @@
+"""
+Custom Export API 고속 직렬화 (fast path)
+
+Label Studio PredictionSerializer / AnnotationSerializer는 Task마다 Serializer를 만들고
+annotation/prediction 인스턴스의 필드를 하나씩 DRF Field 객체로 변환하므로,
+큰 페이지에서는 직렬화와 JSON 렌더링이 CPU 시간 대부분을 차지한다.
+
+이 모듈은 같은 Serializer의 필드 구성을 프로세스당 한 번만 분석(plan)하여
+- Task / annotation / prediction을 `.values()` 행으로 조회하고 (모델 인스턴스 생성 없음)
+- plan에 따라 plain dict를 만들며 (datetime은 이 단계에서 한 번만 문자열로 변환)
+- orjson(설치된 경우)으로 렌더링한다.
+
+필드 집합과 순서는 Label Studio Serializer에서 읽으므로 기존 응답과 같다.
+모델 컬럼이나 알려진 계산 필드(created_ago, created_username)로 매핑할 수 없는 필드가 있으면
+fast path를 사용하지 않고 기존 Serializer 경로로 동작한다.
+"""
+
+import logging
+import threading
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from tasks.models import Prediction
+from tasks.serializers import AnnotationSerializer, PredictionSerializer
+
+from .export_annotations import ALL as ALL_ANNOTATIONS
+from .export_eligibility import valid_annotations
+from .instrumentation import phase
+from .export_projection import (
+    DATA_PROJECTION_ALIAS,
+    FULL,
+    data_projection_expression,
+    supports_data_pushdown,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+TASK_COLUMNS = ('id', 'project_id', 'data', 'meta', 'created_at', 'updated_at', 'is_labeled')
+
+# projection과 무관하게 항상 조회하는 컬럼 (annotation/prediction 조회, cursor 키)
+KEY_COLUMNS = ('id', 'created_at')
+
+# completed_by_info 및 created_username 계산에 사용하는 사용자 컬럼
+USER_COLUMNS = ('id', 'email', 'username', 'first_name', 'last_name', 'is_superuser')
+
+# 모델 컬럼이 아닌 Label Studio 계산 필드 → 계산에 필요한 행 속성
+# (모델 property / SerializerMethodField를 그대로 호출하여 Label Studio와 같은 값을 만든다)
+DERIVED_FIELDS = {
+    'created_ago': ('created_at',),
+    'created_username': ('completed_by',),
+}
+
+# to_representation이 DB 값을 그대로 반환하는 필드 타입
+_IDENTITY_FIELDS = (
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+_encoder = JSONEncoder()
+
+
+class UnsupportedSerializer(Exception):
+    """Label Studio Serializer에 fast path로 재현할 수 없는 필드가 있음"""
+
+
+def format_datetime(value):
+    """
+    DRF JSONEncoder와 같은 datetime 표현 (ISO 8601, UTC는 'Z')
+    """
+    representation = value.isoformat()
+    if representation.endswith('+00:00'):
+        representation = representation[:-6] + 'Z'
+    return representation
+
+
+class _FieldPlan:
+    """
+    Serializer 필드 하나 → (출력 키, 값 계산 방법)
+    """
+
+    def __init__(self, name, column=None, convert=None, derive=None, datetime_field=False):
+        self.name = name
+        self.column = column
+        self.convert = convert
+        self.derive = derive
+        self.datetime_field = datetime_field
+
+
+def _is_default_representation(serializer):
+    module = getattr(type(serializer).to_representation, '__module__', '') or ''
+    return module.startswith(('rest_framework', 'rest_flex_fields'))
+
+
+def _is_iso_datetime_field(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return (
+        type(field) is serializers.DateTimeField
+        and isinstance(output_format, str)
+        and output_format.lower() == 'iso-8601'
+        and not hasattr(field, 'timezone')
+    )
+
+
+def _derived(serializer, name, field):
+    """
+    계산 필드의 값 함수 (행 namespace를 받아 Label Studio 코드로 계산)
+    """
+    if isinstance(field, serializers.SerializerMethodField):
+        method = getattr(serializer, field.method_name)
+        return lambda ns: method(ns)
+
+    prop = getattr(serializer.Meta.model, field.source, None)
+    if not isinstance(prop, property):
+        raise UnsupportedSerializer(f"{type(serializer).__name__}.{name}")
+
+    def derive(ns):
+        value = prop.fget(ns)
+        return None if value is None else field.to_representation(value)
+    return derive
+
+
+def build_plan(serializer_class):
+    """
+    Label Studio Serializer의 출력 필드 → _FieldPlan 목록 (Serializer 필드 순서 유지)
+
+    Raises:
+        UnsupportedSerializer: 컬럼/계산 필드로 매핑할 수 없는 필드가 있는 경우
+    """
+    serializer = serializer_class(read_only=True)
+    if not _is_default_representation(serializer):
+        raise UnsupportedSerializer(f"{serializer_class.__name__}.to_representation")
+
+    model = serializer.Meta.model
+    concrete = {f.name: f for f in model._meta.concrete_fields}
+    plan = []
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if name in DERIVED_FIELDS:
+            plan.append(_FieldPlan(name, derive=_derived(serializer, name, field)))
+            continue
+
+        model_field = concrete.get(field.source)
+        if model_field is None:
+            raise UnsupportedSerializer(f"{serializer_class.__name__}.{name}")
+
+        if model_field.is_relation:
+            if not isinstance(field, serializers.PrimaryKeyRelatedField):
+                raise UnsupportedSerializer(f"{serializer_class.__name__}.{name}")
+            plan.append(_FieldPlan(name, column=model_field.attname))
+        elif _is_iso_datetime_field(field):
+            plan.append(_FieldPlan(name, column=model_field.attname, datetime_field=True))
+        elif type(field) in _IDENTITY_FIELDS and not getattr(field, 'binary', False):
+            plan.append(_FieldPlan(name, column=model_field.attname))
+        else:
+            plan.append(_FieldPlan(name, column=model_field.attname, convert=field.to_representation))
+
+    _check_derived(plan)
+    return plan
+
+
+def _check_derived(plan):
+    """
+    계산 필드가 행 namespace의 속성만 사용하는지 샘플 값으로 확인
+    """
+    sample = _namespace(
+        {'created_at': timezone.now()},
+        {'id': 1, 'email': 'user@example.com', 'username': 'user',
+         'first_name': 'First', 'last_name': 'Last', 'is_superuser': True},
+    )
+    for field_plan in plan:
+        if field_plan.derive is None:
+            continue
+        try:
+            field_plan.derive(sample)
+        except (AttributeError, TypeError) as e:
+            raise UnsupportedSerializer(f"{field_plan.name}: {e}")
+
+
+def _namespace(row, user):
+    return SimpleNamespace(
+        created_at=row.get('created_at'),
+        completed_by=SimpleNamespace(**user) if user else None,
+    )
+
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+
+def _plan_for(serializer_class):
+    with _plans_lock:
+        if serializer_class not in _plans:
+            try:
+                _plans[serializer_class] = build_plan(serializer_class)
+            except UnsupportedSerializer as e:
+                logger.warning(f"[Export Encoder] fast path disabled: unsupported field {e}")
+                _plans[serializer_class] = None
+        return _plans[serializer_class]
+
+
+def is_enabled():
+    """
+    fast path 사용 여부 (CUSTOM_EXPORT_FAST_SERIALIZER + Serializer 필드 매핑 가능)
+    """
+    if not getattr(settings, 'CUSTOM_EXPORT_FAST_SERIALIZER', True):
+        return False
+    return (
+        _plan_for(AnnotationSerializer) is not None
+        and _plan_for(PredictionSerializer) is not None
+    )
+
+
+def task_rows(queryset, projection=FULL):
+    """
+    Task QuerySet → Task 컬럼 `.values()` QuerySet (prefetch / select_related 제거, 정렬 유지)
+
+    projection에 포함된 컬럼만 조회하며, PostgreSQL에서는 data_keys를 jsonb projection으로 계산한다.
+    """
+    columns = [c for c in TASK_COLUMNS if c in KEY_COLUMNS or projection.includes(c)]
+    queryset = queryset.prefetch_related(None).select_related(None)
+
+    if 'data' in columns and projection.data_keys is not None and supports_data_pushdown():
+        columns.remove('data')
+        return queryset.values(
+            *columns,
+            **{DATA_PROJECTION_ALIAS: data_projection_expression(projection.data_keys)}
+        )
+    return queryset.values(*columns)
+
+
+def _columns(plan):
+    return [p.column for p in plan if p.column is not None]
+
+
+def _encode_row(plan, row, user, tz):
+    ns = None
+    item = {}
+    for field_plan in plan:
+        if field_plan.derive is not None:
+            if ns is None:
+                ns = _namespace(row, user)
+            item[field_plan.name] = field_plan.derive(ns)
+            continue
+
+        value = row[field_plan.column]
+        if value is None:
+            item[field_plan.name] = None
+        elif field_plan.datetime_field:
+            item[field_plan.name] = format_datetime(value.astimezone(tz) if tz else value)
+        elif field_plan.convert is not None:
+            item[field_plan.name] = field_plan.convert(value)
+        else:
+            item[field_plan.name] = value
+    return item
+
+
+def _group_annotations(task_ids, tz, normalize_users=False, selection=ALL_ANNOTATIONS):
+    plan = _plan_for(AnnotationSerializer)
+
+    # normalize_users이면 completed_by_info를 만들지 않으므로, 계산 필드(created_username)가 없으면 사용자 JOIN 생략
+    with_users = not normalize_users or any(p.derive is not None for p in plan)
+    user_lookups = [f'completed_by__{column}' for column in USER_COLUMNS] if with_users else []
+    rows = selection.apply(valid_annotations().filter(task_id__in=task_ids)).values(
+        'task_id', *_columns(plan), *user_lookups
+    )
+
+    grouped = {}
+    for row in rows:
+        user = None
+        if with_users and row['completed_by__id'] is not None:
+            user = {column: row[f'completed_by__{column}'] for column in USER_COLUMNS}
+
+        item = _encode_row(plan, row, user, tz)
+        if user and not normalize_users:
+            # completed_by_info (MLOps 요구사항: Webhook enrichment와 동일)
+            item['completed_by_info'] = {
+                'id': user['id'],
+                'email': user['email'],
+                'username': user['username'],
+                'is_superuser': user['is_superuser'],
+            }
+        grouped.setdefault(row['task_id'], []).append(item)
+    return grouped
+
+
+def _group_predictions(task_ids, tz, selection):
+    plan = _plan_for(PredictionSerializer)
+    rows = selection.apply(Prediction.objects.filter(task_id__in=task_ids)).values(
+        'task_id', *_columns(plan)
+    )
+
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row['task_id'], []).append(_encode_row(plan, row, None, tz))
+    return grouped
+
+
+def _task_data(row, projection):
+    if DATA_PROJECTION_ALIAS in row:
+        return row[DATA_PROJECTION_ALIAS]
+    return projection.project_data(row['data'])
+
+
+def encode_tasks(rows, projection=FULL):
+    """
+    Task `.values()` 행 목록 → 직렬화된 Task(dict) 목록
+
+    annotation / prediction은 Task 목록당 한 번씩만 조회한다. (prefetch와 같은 쿼리 수)
+    projection에서 제외된 annotation / prediction은 조회하지 않는다.
+
+    Args:
+        rows: task_rows()가 반환한 QuerySet (또는 그 slice / 행 목록)
+        projection: 응답 필드 projection (task_rows()와 같은 값)
+
+    Returns:
+        list: _serialize_task()와 같은 구조의 dict 목록 (projection 적용)
+    """
+    with phase('query'):
+        rows = list(rows)
+    if not rows:
+        return []
+
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    task_ids = [row['id'] for row in rows]
+    with phase('prefetch'):
+        annotations = None
+        if projection.includes('annotations'):
+            annotations = _group_annotations(
+                task_ids, tz, projection.normalize_users, projection.annotation_selection
+            )
+        predictions = None
+        if projection.includes('predictions'):
+            predictions = _group_predictions(task_ids, tz, projection.prediction_selection)
+
+    with phase('serialize'):
+        return _encode_rows(rows, annotations, predictions, projection)
+
+
+def _encode_rows(rows, annotations, predictions, projection):
+    if projection.is_full:
+        return [
+            {
+                'id': row['id'],
+                'project_id': row['project_id'],
+                'data': row['data'],
+                'meta': row['meta'] or {},
+                'created_at': format_datetime(row['created_at']),
+                'updated_at': format_datetime(row['updated_at']),
+                'is_labeled': row['is_labeled'],
+                'annotations': annotations.get(row['id'], []),
+                'predictions': predictions.get(row['id'], []),
+            }
+            for row in rows
+        ]
+
+    columns = {
+        'id': lambda row: row['id'],
+        'project_id': lambda row: row['project_id'],
+        'data': lambda row: _task_data(row, projection),
+        'meta': lambda row: row['meta'] or {},
+        'created_at': lambda row: format_datetime(row['created_at']),
+        'updated_at': lambda row: format_datetime(row['updated_at']),
+        'is_labeled': lambda row: row['is_labeled'],
+        'annotations': lambda row: annotations.get(row['id'], []),
+        'predictions': lambda row: predictions.get(row['id'], []),
+    }
+    selected = [(name, columns[name]) for name in projection.fields]
+    return [{name: value(row) for name, value in selected} for row in rows]
+
+
+def dumps(data):
+    """
+    JSON bytes 렌더링 (orjson 사용, 없거나 지원하지 않는 값이면 DRF JSONEncoder)
+
+    DRF JSONRenderer(UNICODE_JSON, COMPACT_JSON)와 같은 compact UTF-8 출력이며,
+    orjson이 직접 처리하지 않는 값(datetime, Decimal, lazy 문자열 등)은 DRF JSONEncoder에 맡긴다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=_encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+
+    return JSONRenderer().render(data)
+
+
+class ExportJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSONRenderer (indent 요청 시 DRF 기본 렌더링)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
@@ -0,0 +1,106 @@
+"""
+Custom Export API 조건부 요청 (ETag / If-None-Match)
+
+같은 프로젝트와 필터로 주기적으로 다시 Export하면 대부분 이전과 같은 결과를 받는다.
+필터링된 Task 집합의 fingerprint를 집계 쿼리 한 번으로 계산하여 ETag로 반환하고,
+요청 If-None-Match와 같으면 304 Not Modified로 응답한다. (직렬화 / 전송 생략)
+
+- fingerprint: 필터링된 Task와 그 annotation / prediction 각각의 (건수, MAX(updated_at))
+  (task_id / project 인덱스를 사용하는 COUNT / MAX 집계만 실행)
+- ETag = 검증된 요청 파라미터 + fingerprint + global generation(검수자 권한 변경) 해시
+- 추가/수정은 MAX(updated_at), 삭제는 건수로 반영된다.
+- 압축된 응답은 export_compression이 weak ETag로 바꾸며, If-None-Match는 weak 비교
+- 증분 Export(updated_since / updated_until)는 응답마다 watermark가 달라 ETag를 사용하지 않음
+- count / 페이징 없는 전체 JSON 응답에만 적용 (applies_to)
+  페이지 / cursor / 스트리밍 요청은 한 번에 일부만 전송하고 요청 수가 많아 매번 fingerprint 집계를 실행하면
+  304로 절약되는 비용보다 추가 쿼리 비용이 커진다.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import connection
+from django.utils.http import parse_etags
+
+from tasks.models import Annotation, Prediction
+
+from . import export_cache
+
+# 응답 형식이 바뀌면 증가 (이전 ETag 무효화)
+ETAG_VERSION = 1
+
+
+def is_enabled():
+    return getattr(settings, 'CUSTOM_EXPORT_ETAG_ENABLED', True)
+
+
+def applies_to(validated_data):
+    """
+    ETag 대상 응답인지 (count / 페이징 없는 전체 JSON 응답만)
+    """
+    if validated_data.get('format', 'json') != 'json':
+        return False
+    response_type = validated_data.get('response_type', 'data')
+    if response_type == 'count':
+        return True
+    if response_type != 'data' or validated_data.get('pagination', 'page') == 'cursor':
+        return False
+    return not (validated_data.get('page') and validated_data.get('page_size'))
+
+
+def _related_summary_sql(model):
+    table = connection.ops.quote_name(model._meta.db_table)
+    task_id = connection.ops.quote_name(model._meta.get_field('task').column)
+    updated_at = connection.ops.quote_name(model._meta.get_field('updated_at').column)
+    return (
+        f"SELECT COUNT(*) AS n, MAX(r.{updated_at}) AS m FROM {table} r "
+        f"WHERE r.{task_id} IN (SELECT id FROM export_tasks)"
+    )
+
+
+def fingerprint(queryset):
+    """
+    필터링된 Task QuerySet → (Task 수, Task MAX(updated_at), annotation 수, annotation MAX(updated_at),
+    prediction 수, prediction MAX(updated_at))
+    """
+    task_sql, task_params = queryset.order_by().values('id', 'updated_at').query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH export_tasks AS ({task_sql}) "
+            f"SELECT t.n, t.m, a.n, a.m, p.n, p.m FROM "
+            f"(SELECT COUNT(*) AS n, MAX(updated_at) AS m FROM export_tasks) t, "
+            f"({_related_summary_sql(Annotation)}) a, "
+            f"({_related_summary_sql(Prediction)}) p",
+            task_params
+        )
+        return cursor.fetchone()
+
+
+def compute(validated_data, queryset):
+    """
+    요청 파라미터 + 필터링된 Task 집합 fingerprint → strong ETag
+    """
+    payload = json.dumps({
+        'version': ETAG_VERSION,
+        'params': validated_data,
+        'fingerprint': fingerprint(queryset),
+        'global': export_cache.get_generation(export_cache.GLOBAL_SCOPE),
+    }, sort_keys=True, default=str, separators=(',', ':'))
+    return '"' + hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+def _opaque(etag):
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def not_modified(request, etag):
+    """
+    If-None-Match가 etag와 일치하는지 (weak 비교, '*' 포함)
+    """
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header or etag is None:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or _opaque(etag) in {_opaque(candidate) for candidate in etags}
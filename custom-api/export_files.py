@@ -0,0 +1,142 @@
+"""
+Custom Export API 결과 파일 다운로드 (HTTP Range 지원)
+
+끊긴 다운로드를 처음부터 다시 받지 않도록 단일 byte range 요청
+(Range: bytes=start-end / bytes=start- / bytes=-suffix)에 206 Partial Content로 응답한다.
+If-Range의 ETag가 현재 파일과 다르면 Range를 무시하고 전체 파일을 반환한다.
+
+- 전체 파일: FileResponse → WSGI 서버의 wsgi.file_wrapper(sendfile)로 전송
+- Range 요청: 파일을 mmap으로 매핑하여 요청 구간만 잘라 전송 (read() 버퍼를 거치지 않고 page cache에서 바로 복사)
+- X-Accel-Redirect(accel_redirect_response): 전체 / Range 모두 nginx가 파일을 직접 전송 (본문이 Python을 거치지 않음)
+"""
+
+import mmap
+import os
+import re
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+
+from . import export_compression
+
+RANGE_PATTERN = re.compile(r'^bytes=(?P<start>\d*)-(?P<end>\d*)$')
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+def parse_range(header, size):
+    """
+    Range 헤더 → (start, end) (end 포함)
+
+    Returns:
+        tuple | None: 헤더가 없거나 다중 range 등 지원하지 않는 형식이면 None
+
+    Raises:
+        ValueError: 파일 범위를 벗어난 range (416 응답 대상)
+    """
+    match = RANGE_PATTERN.match((header or '').strip())
+    if not match:
+        return None
+
+    start, end = match.group('start'), match.group('end')
+    if not start and not end:
+        return None
+
+    if not start:
+        # 마지막 N바이트 (bytes=-N)
+        length = int(end)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = int(end) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def _read_range(path, start, length):
+    """
+    파일의 [start, start + length) 구간을 READ_BLOCK_SIZE 단위로 (mmap 매핑 영역에서 잘라냄)
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        end = min(start + length, len(mapped))
+        for offset in range(start, end, READ_BLOCK_SIZE):
+            yield mapped[offset:min(offset + READ_BLOCK_SIZE, end)]
+
+
+def ranged_file_response(request, path, content_type, filename, etag=None):
+    """
+    파일 다운로드 응답 (Range 요청이면 206, 아니면 200)
+    """
+    size = os.path.getsize(path)
+    range_header = request.META.get('HTTP_RANGE')
+
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if range_header and if_range and etag and if_range.strip() != etag:
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    if byte_range is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+        response['Content-Length'] = str(size)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            _read_range(path, start, length),
+            content_type=content_type,
+            status=206
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(length)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    if etag:
+        response['ETag'] = etag
+    return response
+
+
+def accel_redirect_response(prefix, path, content_type, filename):
+    """
+    파일 전송을 nginx에 위임 (X-Accel-Redirect: <prefix>/<파일명>)
+
+    Range 요청도 nginx가 internal location의 파일에서 직접 처리한다.
+    """
+    response = HttpResponse(content_type=content_type)
+    response['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{os.path.basename(path)}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def file_download_response(request, path, content_type, filename, etag):
+    """
+    결과 파일 다운로드 응답 (Accept-Encoding이 맞으면 미리 압축된 파일, Range 지원)
+
+    Range는 압축된 표현 기준이므로 Content-Encoding별로 ETag를 구분한다.
+    """
+    encoding = export_compression.negotiate(request, export_compression.existing_precompressed(path))
+
+    if encoding is None:
+        response = ranged_file_response(request, path, content_type=content_type, filename=filename,
+                                        etag=f'"{etag}"')
+    else:
+        response = ranged_file_response(
+            request,
+            export_compression.precompressed_path(path, encoding),
+            content_type=content_type,
+            filename=filename,
+            etag=f'"{etag}-{encoding}"'
+        )
+        response['Content-Encoding'] = encoding
+
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
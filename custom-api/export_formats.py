@@ -0,0 +1,219 @@
+"""
+Custom Export API 컬럼형 출력 형식 (Apache Parquet / Arrow IPC)
+
+JSON 응답과 동일하게 직렬화된 Task를 annotation 단위 행으로 평탄화하여
+row group(= chunk) 단위로 기록하고, 기록된 바이트를 즉시 스트리밍한다.
+
+- parquet: 컬럼 압축(CUSTOM_EXPORT_COLUMNAR_COMPRESSION, 기본값: zstd) 파일
+- arrow:   Arrow IPC file 형식 (memory-map으로 바로 로드 가능)
+
+pyarrow는 선택 의존성이며, 설치되지 않은 환경에서는 ColumnarFormatUnavailable이 발생한다.
+압축 코덱은 형식마다 지원 범위가 다르므로 (Arrow IPC는 lz4/zstd만 지원)
+응답을 시작하기 전에 compression_error()로 확인한다. (스트리밍 도중 실패하면 잘린 200 응답이 됨)
+"""
+
+import json
+
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+COLUMNAR_FORMATS = {
+    'parquet': {
+        'content_type': 'application/vnd.apache.parquet',
+        'extension': 'parquet',
+        'codecs': ('snappy', 'gzip', 'brotli', 'lz4', 'zstd'),
+    },
+    'arrow': {
+        'content_type': 'application/vnd.apache.arrow.file',
+        'extension': 'arrow',
+        'codecs': ('lz4', 'zstd'),
+    },
+}
+
+
+class ColumnarFormatUnavailable(Exception):
+    """pyarrow 미설치 또는 형식이 지원하지 않는 압축 코덱으로 컬럼형 출력 불가"""
+
+
+def is_available():
+    return pa is not None
+
+
+def _schema():
+    timestamp = pa.timestamp('us', tz='UTC')
+    return pa.schema([
+        ('task_id', pa.int64()),
+        ('project_id', pa.int64()),
+        ('task_created_at', timestamp),
+        ('task_updated_at', timestamp),
+        ('is_labeled', pa.bool_()),
+        ('data', pa.string()),
+        ('meta', pa.string()),
+        ('annotation_id', pa.int64()),
+        ('annotation_result', pa.string()),
+        ('annotation_created_at', timestamp),
+        ('annotation_updated_at', timestamp),
+        ('was_cancelled', pa.bool_()),
+        ('lead_time', pa.float64()),
+        ('completed_by_id', pa.int64()),
+        ('completed_by_email', pa.string()),
+        ('completed_by_username', pa.string()),
+        ('completed_by_is_superuser', pa.bool_()),
+        ('prediction_model_versions', pa.list_(pa.string())),
+        ('predictions', pa.string()),
+    ])
+
+
+def _json(value):
+    return json.dumps(value, cls=JSONEncoder, ensure_ascii=False)
+
+
+def _timestamp(value):
+    # Label Studio Serializer는 datetime을 ISO 문자열로 반환
+    if isinstance(value, str):
+        return parse_datetime(value)
+    return value
+
+
+def flatten_task(task_data):
+    """
+    직렬화된 Task(dict) → annotation 단위 행 목록
+
+    task 컬럼은 annotation 수만큼 반복되며, predictions는 task당 하나의 JSON 문자열로 포함한다.
+    """
+    predictions = task_data.get('predictions') or []
+    model_versions = sorted({p['model_version'] for p in predictions if p.get('model_version')})
+    task_columns = {
+        'task_id': task_data['id'],
+        'project_id': task_data['project_id'],
+        'task_created_at': _timestamp(task_data['created_at']),
+        'task_updated_at': _timestamp(task_data['updated_at']),
+        'is_labeled': task_data['is_labeled'],
+        'data': _json(task_data['data']),
+        'meta': _json(task_data['meta']),
+        'prediction_model_versions': model_versions,
+        'predictions': _json(predictions),
+    }
+
+    rows = []
+    for annotation in task_data.get('annotations') or []:
+        user = annotation.get('completed_by_info') or {}
+        rows.append({
+            **task_columns,
+            'annotation_id': annotation['id'],
+            'annotation_result': _json(annotation.get('result')),
+            'annotation_created_at': _timestamp(annotation.get('created_at')),
+            'annotation_updated_at': _timestamp(annotation.get('updated_at')),
+            'was_cancelled': annotation.get('was_cancelled'),
+            'lead_time': annotation.get('lead_time'),
+            'completed_by_id': user.get('id'),
+            'completed_by_email': user.get('email'),
+            'completed_by_username': user.get('username'),
+            'completed_by_is_superuser': user.get('is_superuser'),
+        })
+    return rows
+
+
+class _ChunkSink:
+    """
+    pyarrow writer 출력 버퍼 (row group 기록 후 drain()으로 꺼내 스트리밍)
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _compression():
+    return getattr(settings, 'CUSTOM_EXPORT_COLUMNAR_COMPRESSION', 'zstd') or None
+
+
+def compression_error(export_format):
+    """
+    설정된 압축 코덱(CUSTOM_EXPORT_COLUMNAR_COMPRESSION)을 형식이 지원하지 않으면 오류 메시지
+
+    Returns:
+        str | None: 지원하지 않으면 오류 메시지, 지원하거나 압축 안 함이면 None
+    """
+    codec = _compression()
+    codecs = COLUMNAR_FORMATS[export_format]['codecs']
+    if codec is None or codec in codecs:
+        return None
+    return (
+        f"CUSTOM_EXPORT_COLUMNAR_COMPRESSION={codec!r} is not supported for format='{export_format}' "
+        f"(supported: {', '.join(codecs)})"
+    )
+
+
+def _open_writer(export_format, sink, schema):
+    if export_format == 'parquet':
+        return pq.ParquetWriter(sink, schema, compression=_compression() or 'none')
+    options = pa_ipc.IpcWriteOptions(compression=_compression())
+    return pa_ipc.new_file(sink, schema, options=options)
+
+
+def write_columnar(export_format, task_chunks):
+    """
+    Task chunk iterator → Parquet / Arrow IPC 바이트 스트림
+
+    chunk 하나가 row group(Parquet) / record batch(Arrow) 하나가 되므로
+    메모리 사용량은 chunk 크기에만 비례한다.
+
+    Args:
+        export_format: 'parquet' 또는 'arrow'
+        task_chunks: 직렬화된 Task(dict) 목록을 chunk 단위로 반환하는 iterator
+
+    Yields:
+        bytes: 기록된 파일 조각
+    """
+    if not is_available():
+        raise ColumnarFormatUnavailable("pyarrow가 설치되어 있지 않습니다.")
+    error = compression_error(export_format)
+    if error:
+        raise ColumnarFormatUnavailable(error)
+
+    schema = _schema()
+    sink = _ChunkSink()
+    writer = _open_writer(export_format, pa.PythonFile(sink, mode='w'), schema)
+
+    try:
+        for tasks in task_chunks:
+            rows = [row for task_data in tasks for row in flatten_task(task_data)]
+            if not rows:
+                continue
+            batch = pa.Table.from_pylist(rows, schema=schema)
+            writer.write_table(batch)
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
@@ -0,0 +1,196 @@
+"""
+Custom Export API 날짜 필드 Expression Index 관리
+
+Export 날짜 필터는 task.data의 날짜 필드를 (data ->> '<field>')로 비교하므로
+일반 인덱스를 사용할 수 없어 매번 Task 테이블 전체를 순차 탐색한다.
+
+이 모듈은 프로젝트별 partial expression index
+    ON task (project_id, (data ->> '<field>')) WHERE project_id = <id>
+를 CONCURRENTLY로 생성/삭제하고, Export 쿼리가 인덱스와 정확히 같은
+SQL 표현식을 사용하도록 date_field_sql()을 제공한다.
+
+CUSTOM_EXPORT_TIMESTAMP_FIELDS(정규화 대상) 필드의 날짜 필터는 side table을 조회하므로
+(data ->> '<field>') 인덱스를 사용하지 않는다. 이 필드에 대한 인덱스 생성은 거부한다.
+"""
+
+import hashlib
+import re
+
+from django.conf import settings
+from django.db import connection
+
+from tasks.models import Task
+
+from .export_timestamps import timestamp_fields
+
+# 관리 대상 인덱스 이름 접두사 (다른 인덱스와 구분)
+INDEX_PREFIX = 'cexp_date_'
+
+# PostgreSQL identifier 최대 길이
+MAX_INDEX_NAME_LENGTH = 63
+
+# search_date_field와 동일한 검증 규칙 (Serializer 참고)
+FIELD_NAME_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]{0,63}$')
+
+INDEX_DEF_PATTERN = re.compile(r"->> '(?P<field>[a-zA-Z0-9_]+)'.*WHERE \(project_id = (?P<project_id>\d+)\)")
+
+
+class ExportIndexError(Exception):
+    """Expression index 관리 오류"""
+
+
+def configured_date_fields():
+    """
+    인덱스 대상 날짜 필드 목록 (CUSTOM_EXPORT_DATE_FIELDS 중 정규화 대상이 아닌 필드)
+    """
+    normalized = set(timestamp_fields())
+    return [
+        field for field in getattr(settings, 'CUSTOM_EXPORT_DATE_FIELDS', ['source_created_at'])
+        if field not in normalized
+    ]
+
+
+def _validate_field(field):
+    if not FIELD_NAME_PATTERN.match(field or ''):
+        raise ExportIndexError(f"Invalid date field name: {field!r}")
+
+
+def date_field_sql(field):
+    """
+    task.data 날짜 필드의 SQL 표현식
+
+    필드명을 파라미터(%s)가 아닌 리터럴로 포함해야 PostgreSQL planner가
+    expression index의 표현식과 일치시킬 수 있다.
+    보안: 필드명은 Serializer와 이 함수에서 이중으로 정규식 검증된다.
+
+    Returns:
+        str: 예) ("task"."data" ->> 'source_created_at')
+    """
+    _validate_field(field)
+    return f"(\"{Task._meta.db_table}\".\"data\" ->> '{field}')"
+
+
+def index_name(project_id, field):
+    """
+    프로젝트/필드별 인덱스 이름 (63자 초과 시 필드명을 해시로 대체)
+    """
+    _validate_field(field)
+    name = f"{INDEX_PREFIX}p{int(project_id)}_{field.lower()}"
+    if len(name) > MAX_INDEX_NAME_LENGTH or field != field.lower():
+        digest = hashlib.sha1(field.encode('utf-8')).hexdigest()[:12]
+        name = f"{INDEX_PREFIX}p{int(project_id)}_{digest}"
+    return name
+
+
+def _ensure_postgresql():
+    if connection.vendor != 'postgresql':
+        raise ExportIndexError("Expression index 관리는 PostgreSQL에서만 지원됩니다.")
+
+
+def _ensure_autocommit():
+    # CREATE/DROP INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없음
+    if connection.in_atomic_block:
+        raise ExportIndexError(
+            "CONCURRENTLY 인덱스 작업은 트랜잭션 밖에서 실행해야 합니다."
+        )
+
+
+def list_date_indexes(project_id=None):
+    """
+    관리 대상 expression index 목록
+
+    Returns:
+        list[dict]: name, project_id, field, valid, size_bytes
+    """
+    _ensure_postgresql()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_indexdef(i.indexrelid), i.indisvalid, pg_relation_size(c.oid)
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_class t ON t.oid = i.indrelid
+            WHERE t.relname = %s AND c.relname LIKE %s
+            ORDER BY c.relname
+            """,
+            [Task._meta.db_table, INDEX_PREFIX + '%']
+        )
+        rows = cursor.fetchall()
+
+    indexes = []
+    for name, definition, valid, size in rows:
+        match = INDEX_DEF_PATTERN.search(definition)
+        if not match:
+            continue
+        index_project_id = int(match.group('project_id'))
+        if project_id is not None and index_project_id != int(project_id):
+            continue
+        indexes.append({
+            'name': name,
+            'project_id': index_project_id,
+            'field': match.group('field'),
+            'valid': valid,
+            'size_bytes': size,
+        })
+    return indexes
+
+
+def create_date_index(project_id, field):
+    """
+    프로젝트별 partial expression index를 CONCURRENTLY로 생성
+
+    이전 CONCURRENTLY 생성이 실패하여 INVALID 상태로 남은 인덱스는 삭제 후 재생성한다.
+
+    Returns:
+        dict: name, project_id, field, created (이미 유효한 인덱스가 있으면 False)
+
+    Raises:
+        ExportIndexError: 정규화 대상 필드 (날짜 필터가 side table을 사용하므로 인덱스가 쓰이지 않음)
+    """
+    _validate_field(field)
+    if field in timestamp_fields():
+        raise ExportIndexError(
+            f"{field!r} is normalized (CUSTOM_EXPORT_TIMESTAMP_FIELDS); "
+            f"its date filter uses custom_export_task_timestamp, not an expression index"
+        )
+    _ensure_postgresql()
+    _ensure_autocommit()
+
+    name = index_name(project_id, field)
+    existing = {index['name']: index for index in list_date_indexes(project_id)}
+
+    if name in existing and existing[name]['valid']:
+        return {'name': name, 'project_id': int(project_id), 'field': field, 'created': False}
+
+    with connection.cursor() as cursor:
+        if name in existing:
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+        cursor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+            f'ON "{Task._meta.db_table}" (project_id, {date_field_sql(field)}) '
+            f'WHERE project_id = {int(project_id)}'
+        )
+
+    return {'name': name, 'project_id': int(project_id), 'field': field, 'created': True}
+
+
+def drop_date_index(project_id, field):
+    """
+    프로젝트별 partial expression index를 CONCURRENTLY로 삭제
+
+    Returns:
+        dict: name, project_id, field, dropped (인덱스가 없었으면 False)
+    """
+    _ensure_postgresql()
+    _ensure_autocommit()
+
+    name = index_name(project_id, field)
+    exists = any(index['name'] == name for index in list_date_indexes(project_id))
+
+    if exists:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+    return {'name': name, 'project_id': int(project_id), 'field': field, 'dropped': exists}
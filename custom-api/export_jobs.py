@@ -0,0 +1,403 @@
+"""
+Custom Export API 비동기 작업 (mode="async")
+
+대용량 전체 Export는 ingress / gunicorn timeout을 넘기므로 요청은 job ID만 즉시 반환하고,
+run_export_worker 명령(각 Pod의 worker 컨테이너)이 작업을 실행한다.
+
+- 작업 할당: SELECT ... FOR UPDATE SKIP LOCKED → 여러 Pod의 worker가 같은 작업을 중복 실행하지 않음
+- 중단 복구: heartbeat가 CUSTOM_EXPORT_JOB_STALE_SECONDS 동안 갱신되지 않은 running 작업은
+  다른 worker가 다시 가져감 (최대 CUSTOM_EXPORT_JOB_MAX_ATTEMPTS회)
+- 결과 파일: CUSTOM_EXPORT_JOB_DIR (기본값: <BASE_DATA_DIR>/custom_export_jobs)
+  여러 Pod가 같은 파일을 제공하려면 데이터 볼륨이 공유(ReadWriteMany)되어야 한다.
+"""
+
+import contextlib
+import datetime
+import logging
+import os
+import socket
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from .export_cache import bump_global_generation
+from .export_compression import (
+    compressor,
+    existing_precompressed,
+    precompress_encodings,
+    precompressed_path,
+)
+from .export_eligibility import refresh_user_tasks
+from .export_formats import COLUMNAR_FORMATS
+from .models import ExportJob
+
+logger = logging.getLogger(__name__)
+
+NDJSON_FORMAT = {
+    'content_type': 'application/x-ndjson',
+    'extension': 'ndjson',
+}
+
+
+class JobLost(Exception):
+    """다른 worker가 작업을 다시 가져감 (heartbeat 만료)"""
+
+
+def job_dir():
+    default = os.path.join(getattr(settings, 'BASE_DATA_DIR', '/tmp'), 'custom_export_jobs')
+    return getattr(settings, 'CUSTOM_EXPORT_JOB_DIR', None) or default
+
+
+def _stale_seconds():
+    return getattr(settings, 'CUSTOM_EXPORT_JOB_STALE_SECONDS', 300)
+
+
+def _max_attempts():
+    return getattr(settings, 'CUSTOM_EXPORT_JOB_MAX_ATTEMPTS', 3)
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def create_job(user, project_id, params):
+    """
+    비동기 Export 작업 등록
+
+    params['artifact_id']가 있으면 결과를 작업 디렉터리 대신 해당 로컬 artifact 파일로 기록한다.
+    (delivery="artifact" 요청의 캐시 miss)
+    """
+    return ExportJob.objects.create(
+        project_id=project_id,
+        created_by=user if user and user.is_authenticated else None,
+        params=params,
+    )
+
+
+def create_eligibility_job(user, target_user_id):
+    """
+    사용자 annotation이 달린 Task의 eligibility 재계산 작업 등록 (Superuser 승격/해제)
+
+    재계산 비용이 사용자의 annotation 수에 비례하므로 요청에서 실행하지 않고 run_export_worker가 실행한다.
+    프로젝트 단위 작업이 아니므로 project_id는 0으로 기록한다.
+    """
+    return ExportJob.objects.create(
+        project_id=0,
+        created_by=user if user and user.is_authenticated else None,
+        params={'eligibility_user_id': target_user_id},
+    )
+
+
+def request_params(serializer):
+    """
+    작업에 저장할 요청 파라미터 (worker가 같은 Serializer로 다시 검증)
+
+    form 요청(QueryDict)은 dict(items())로 변환하면 다중 값 필드의 마지막 값만 남으므로
+    ListField는 getlist()로 모든 값을 저장한다.
+    """
+    data = serializer.initial_data
+    if not hasattr(data, 'getlist'):
+        return dict(data)
+    list_fields = {
+        name for name, field in serializer.fields.items() if isinstance(field, serializers.ListField)
+    }
+    return {key: data.getlist(key) if key in list_fields else data.get(key) for key in data}
+
+
+def find_artifact_job(artifact_id):
+    """
+    같은 artifact를 기록 중이거나 대기 중인 작업 (중복 등록 방지)
+    """
+    return ExportJob.objects.filter(
+        params__artifact_id=artifact_id,
+        status__in=[ExportJob.STATUS_PENDING, ExportJob.STATUS_RUNNING],
+    ).order_by('created_at').first()
+
+
+def get_job_for_user(user, job_id):
+    """
+    사용자가 조회할 수 있는 작업 (본인 작업 또는 Admin)
+    """
+    jobs = ExportJob.objects.filter(id=job_id)
+    if not user.is_staff:
+        jobs = jobs.filter(created_by=user)
+    return jobs.first()
+
+
+def job_payload(job):
+    """
+    작업 상태 응답
+    """
+    progress = None
+    if job.total_tasks:
+        progress = round(job.processed_tasks * 100 / job.total_tasks, 1)
+    elif job.status == ExportJob.STATUS_COMPLETED:
+        progress = 100.0
+
+    base_url = f"/api/custom/export/jobs/{job.id}/"
+    download_url = None
+    if job.status == ExportJob.STATUS_COMPLETED and job.file_path:
+        download_url = f"{base_url}download"
+    artifact_id = (job.params or {}).get('artifact_id')
+    if artifact_id and download_url:
+        download_url = f"/api/custom/export/artifacts/{artifact_id}/download"
+
+    payload = {
+        "job_id": str(job.id),
+        "status": job.status,
+        "project_id": job.project_id,
+        "total_tasks": job.total_tasks,
+        "processed_tasks": job.processed_tasks,
+        "progress": progress,
+        "file_size": job.file_size,
+        "error": job.error or None,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "status_url": base_url,
+        "download_url": download_url,
+    }
+    if artifact_id:
+        payload["artifact_id"] = artifact_id
+    return payload
+
+
+def claim_next_job(worker):
+    """
+    실행할 작업 하나를 가져와 running으로 표시
+
+    FOR UPDATE SKIP LOCKED로 다른 worker가 잠근 작업은 건너뛰므로
+    여러 Pod에서 동시에 호출해도 같은 작업이 두 번 할당되지 않는다.
+
+    Returns:
+        ExportJob | None
+    """
+    now = timezone.now()
+    stale_before = now - datetime.timedelta(seconds=_stale_seconds())
+
+    with transaction.atomic():
+        job = ExportJob.objects.select_for_update(skip_locked=True).filter(
+            Q(status=ExportJob.STATUS_PENDING)
+            | Q(status=ExportJob.STATUS_RUNNING, heartbeat_at__lt=stale_before),
+            attempts__lt=_max_attempts(),
+        ).order_by('created_at').first()
+
+        if job is None:
+            return None
+
+        job.status = ExportJob.STATUS_RUNNING
+        job.worker = worker
+        job.attempts += 1
+        job.processed_tasks = 0
+        job.started_at = now
+        job.heartbeat_at = now
+        job.save(update_fields=['status', 'worker', 'attempts', 'processed_tasks', 'started_at', 'heartbeat_at'])
+
+    return job
+
+
+def _report_progress(job, processed):
+    updated = ExportJob.objects.filter(
+        pk=job.pk,
+        status=ExportJob.STATUS_RUNNING,
+        worker=job.worker
+    ).update(processed_tasks=processed, heartbeat_at=timezone.now())
+    if not updated:
+        raise JobLost(f"Export job {job.id} was reclaimed by another worker")
+
+
+def _track_progress(job, task_chunks):
+    processed = 0
+    for tasks in task_chunks:
+        yield tasks
+        processed += len(tasks)
+        _report_progress(job, processed)
+
+
+def _write_file(path, blocks, encodings=()):
+    """
+    결과 파일 기록 (encodings의 미리 압축된 파일도 같은 순회에서 함께 기록)
+
+    파일을 여는 도중이나 기록 중 실패하면 이미 연 파일을 모두 닫고 기록 중이던 파일을 삭제한다.
+    """
+    paths = [path] + [precompressed_path(path, encoding) for encoding in encodings]
+    with contextlib.ExitStack() as stack:
+        # 실패 시 삭제 (닫기보다 나중에 실행되도록 먼저 등록)
+        cleanup = stack.enter_context(contextlib.ExitStack())
+        for part in paths:
+            cleanup.callback(_remove_if_exists, part)
+
+        streams = [(stack.enter_context(open(path, 'wb')), None)] + [
+            (stack.enter_context(open(precompressed_path(path, encoding), 'wb')), compressor(encoding))
+            for encoding in encodings
+        ]
+        for block in blocks:
+            block = block.encode('utf-8') if isinstance(block, str) else block
+            for f, stream in streams:
+                f.write(stream.compress(block) if stream else block)
+        for f, stream in streams:
+            if stream:
+                f.write(stream.finish())
+        # 성공: 삭제 취소
+        cleanup.pop_all()
+
+
+def _remove_if_exists(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def write_export_file(path, blocks, content_type):
+    """
+    결과 파일 기록 (비동기 작업 / 로컬 artifact 공용)
+
+    임시 경로(.part)에 기록한 뒤 rename하므로 다운로드 중인 파일이 바뀌지 않으며,
+    같은 경로를 동시에 기록해도 임시 경로가 겹치지 않는다.
+    NDJSON 결과는 CUSTOM_EXPORT_JOB_PRECOMPRESS 방식(.gz / .zst)으로 압축한 파일도 함께 기록한다.
+    """
+    part = f"{path}.{uuid.uuid4().hex}.part"
+    encodings = precompress_encodings(content_type)
+    try:
+        _write_file(part, blocks, encodings)
+        for encoding in encodings:
+            os.replace(precompressed_path(part, encoding), precompressed_path(path, encoding))
+        os.replace(part, path)
+    finally:
+        # rename 도중 실패한 경우 남은 임시 파일 정리 (기록 실패는 _write_file이 정리)
+        for leftover in [part] + [precompressed_path(part, encoding) for encoding in encodings]:
+            _remove_if_exists(leftover)
+    return path
+
+
+def remove_files(path):
+    """
+    결과 파일과 미리 압축된 파일 삭제
+    """
+    for encoding in existing_precompressed(path):
+        os.remove(precompressed_path(path, encoding))
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _run_eligibility_job(job):
+    """
+    eligibility 재계산 작업 실행 (create_eligibility_job) - 재계산 후 Export 캐시 전체 무효화
+    """
+    try:
+        refreshed = refresh_user_tasks(job.params['eligibility_user_id'])
+        bump_global_generation()
+        ExportJob.objects.filter(pk=job.pk, worker=job.worker).update(
+            status=ExportJob.STATUS_COMPLETED,
+            total_tasks=refreshed,
+            processed_tasks=refreshed,
+            finished_at=timezone.now(),
+        )
+        logger.info(f"[Export Job] Eligibility refreshed: job={job.id} tasks={refreshed}")
+    except Exception as e:
+        logger.exception(f"[Export Job] Eligibility refresh failed: job={job.id}")
+        ExportJob.objects.filter(pk=job.pk, worker=job.worker).update(
+            status=ExportJob.STATUS_FAILED,
+            error=str(e),
+            finished_at=timezone.now(),
+        )
+
+
+def run_job(job):
+    """
+    작업 실행: 요청 파라미터를 다시 검증하여 QuerySet을 만들고 결과 파일 기록 (write_export_file)
+
+    artifact 작업(params['artifact_id'])은 등록 시점의 artifact ID 경로에 기록한다.
+    eligibility 재계산 작업(params['eligibility_user_id'])은 파일을 기록하지 않는다.
+    """
+    if 'eligibility_user_id' in (job.params or {}):
+        return _run_eligibility_job(job)
+
+    from .export import CustomExportAPI
+    from .export_artifacts import store as store_artifact
+    from .export_projection import Projection
+    from .export_serializers import CustomExportRequestSerializer
+
+    try:
+        serializer = CustomExportRequestSerializer(data=job.params)
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+
+        view = CustomExportAPI()
+        queryset = view._queryset_for(validated_data)
+        ExportJob.objects.filter(pk=job.pk).update(total_tasks=queryset.count())
+
+        export_format = validated_data.get('format', 'json')
+        spec = COLUMNAR_FORMATS.get(export_format, NDJSON_FORMAT)
+        projection = Projection.from_validated(validated_data)
+        chunks = _track_progress(job, view._iter_serialized_chunks(queryset, projection))
+        blocks = view._export_blocks(chunks, export_format)
+
+        artifact_id = job.params.get('artifact_id')
+        if artifact_id:
+            path = store_artifact(artifact_id, spec, blocks)
+        else:
+            os.makedirs(job_dir(), exist_ok=True)
+            path = write_export_file(
+                os.path.join(job_dir(), f"{job.id}.{spec['extension']}"), blocks, spec['content_type']
+            )
+
+        ExportJob.objects.filter(pk=job.pk, worker=job.worker).update(
+            status=ExportJob.STATUS_COMPLETED,
+            file_path=path,
+            file_size=os.path.getsize(path),
+            content_type=spec['content_type'],
+            finished_at=timezone.now(),
+        )
+        logger.info(f"[Export Job] Completed: job={job.id} project={job.project_id} path={path}")
+    except JobLost:
+        logger.warning(f"[Export Job] Lost: job={job.id} worker={job.worker}")
+    except Exception as e:
+        logger.exception(f"[Export Job] Failed: job={job.id} project={job.project_id}")
+        ExportJob.objects.filter(pk=job.pk, worker=job.worker).update(
+            status=ExportJob.STATUS_FAILED,
+            error=str(e),
+            finished_at=timezone.now(),
+        )
+
+
+def fail_abandoned_jobs():
+    """
+    최대 시도 횟수를 넘긴 채 heartbeat가 끊긴 작업을 failed로 정리
+    """
+    stale_before = timezone.now() - datetime.timedelta(seconds=_stale_seconds())
+    return ExportJob.objects.filter(
+        status=ExportJob.STATUS_RUNNING,
+        heartbeat_at__lt=stale_before,
+        attempts__gte=_max_attempts(),
+    ).update(
+        status=ExportJob.STATUS_FAILED,
+        error='worker stopped responding',
+        finished_at=timezone.now(),
+    )
+
+
+def cleanup_expired_jobs():
+    """
+    보관 기간(CUSTOM_EXPORT_JOB_RETENTION_HOURS)이 지난 작업과 결과 파일 삭제
+
+    Returns:
+        int: 삭제된 작업 수
+    """
+    hours = getattr(settings, 'CUSTOM_EXPORT_JOB_RETENTION_HOURS', 24)
+    expired = ExportJob.objects.filter(
+        status__in=[ExportJob.STATUS_COMPLETED, ExportJob.STATUS_FAILED],
+        finished_at__lt=timezone.now() - datetime.timedelta(hours=hours),
+    )
+
+    deleted = 0
+    for job in expired.iterator():
+        # artifact 파일은 CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS로 따로 정리 (다른 요청이 재사용 중일 수 있음)
+        if job.file_path and not job.params.get('artifact_id'):
+            remove_files(job.file_path)
+        job.delete()
+        deleted += 1
+    return deleted
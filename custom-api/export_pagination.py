@@ -0,0 +1,77 @@
+"""
+Custom Export API Keyset Pagination
+
+(created_at, id) 기반 cursor 페이징 유틸리티
+
+OFFSET 페이징(queryset[start:end])은 깊은 페이지일수록 PostgreSQL이 앞선 행을
+모두 정렬/폐기해야 하므로 느려진다. cursor 페이징은 마지막 Task의 (created_at, id)
+이후 행만 조회하므로 모든 페이지의 비용이 첫 페이지와 같다.
+"""
+
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    """잘못된 cursor 문자열"""
+
+
+def encode_cursor(task):
+    """
+    Task의 정렬 키 (created_at, id)를 불투명(opaque) cursor 문자열로 인코딩
+
+    Args:
+        task: 페이지의 마지막 Task (모델 인스턴스 또는 .values() 행)
+
+    Returns:
+        str: URL-safe base64 cursor
+    """
+    if isinstance(task, dict):
+        created_at, task_id = task['created_at'], task['id']
+    else:
+        created_at, task_id = task.created_at, task.id
+
+    payload = json.dumps(
+        {'c': created_at.isoformat(), 'i': task_id},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    cursor 문자열을 (created_at, id) 튜플로 디코딩
+
+    Raises:
+        InvalidCursor: 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        created_at = parse_datetime(payload['c'])
+        task_id = int(payload['i'])
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursor(cursor)
+
+    if created_at is None:
+        raise InvalidCursor(cursor)
+
+    return created_at, task_id
+
+
+def apply_cursor(queryset, cursor):
+    """
+    (-created_at, -id) 정렬 기준으로 cursor 이후의 Task만 남기는 필터 적용
+
+    Args:
+        queryset: order_by('-created_at', '-id')로 정렬된 Task QuerySet
+        cursor: decode_cursor()가 반환한 (created_at, id) 튜플
+    """
+    created_at, task_id = cursor
+    return queryset.filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=task_id)
+    )
@@ -0,0 +1,112 @@
+"""
+Custom Export API 다중 프로젝트 병렬 실행 (project_ids)
+
+프로젝트별 쿼리/직렬화를 최대 CUSTOM_EXPORT_MULTI_PROJECT_WORKERS개의 스레드에서 동시에 실행한다.
+Django DB 연결은 스레드마다 따로 열리므로 각 작업이 끝나면 해당 스레드의 연결을 닫는다.
+
+결과는 항상 요청한 project_ids 순서로 합쳐지므로 실행 순서와 무관하게 응답 순서가 일정하다.
+worker 수가 1 이하(기본값)이거나 프로젝트가 하나이면 요청 스레드에서 순서대로 실행한다.
+
+스레드마다 별도 연결(= 별도 트랜잭션/snapshot)로 조회하므로 병합된 결과는 프로젝트 간에
+같은 시점의 데이터가 아니며, 요청 하나가 DB 연결을 최대 worker 수만큼 사용한다.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+# 스트리밍 시 프로젝트별로 미리 만들어 둘 수 있는 chunk 수 (메모리 상한)
+STREAM_BUFFER_CHUNKS = 2
+
+_DONE = object()
+
+
+def max_workers():
+    return getattr(settings, 'CUSTOM_EXPORT_MULTI_PROJECT_WORKERS', 1)
+
+
+def _use_threads(project_ids):
+    return max_workers() > 1 and len(project_ids) > 1
+
+
+def _in_worker_thread(func, *args):
+    try:
+        return func(*args)
+    finally:
+        connections.close_all()
+
+
+def run_per_project(project_ids, func):
+    """
+    프로젝트별 func(project_id) 병렬 실행
+
+    Returns:
+        dict: {project_id: 결과} (project_ids 순서)
+
+    Raises:
+        프로젝트 작업 중 발생한 첫 번째 예외
+    """
+    if not _use_threads(project_ids):
+        return {project_id: func(project_id) for project_id in project_ids}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers(), len(project_ids))) as executor:
+        futures = {
+            project_id: executor.submit(_in_worker_thread, func, project_id)
+            for project_id in project_ids
+        }
+        return {project_id: futures[project_id].result() for project_id in project_ids}
+
+
+def stream_per_project(project_ids, producer):
+    """
+    프로젝트별 producer(project_id) iterator를 병렬로 실행하고 project_ids 순서로 이어서 반환
+
+    앞선 프로젝트를 전송하는 동안 다음 프로젝트의 chunk를 최대 STREAM_BUFFER_CHUNKS개까지 미리 만든다.
+    클라이언트 연결이 끊겨 generator가 닫히면 실행 중인 producer도 중단된다.
+    """
+    if not _use_threads(project_ids):
+        for project_id in project_ids:
+            yield from producer(project_id)
+        return
+
+    cancelled = threading.Event()
+    buffers = {project_id: queue.Queue(maxsize=STREAM_BUFFER_CHUNKS) for project_id in project_ids}
+
+    def put(buffer, item):
+        while not cancelled.is_set():
+            try:
+                buffer.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(project_id):
+        buffer = buffers[project_id]
+        try:
+            for chunk in producer(project_id):
+                if not put(buffer, chunk):
+                    return
+            put(buffer, _DONE)
+        except Exception as e:
+            put(buffer, e)
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers(), len(project_ids)))
+    try:
+        for project_id in project_ids:
+            executor.submit(_in_worker_thread, produce, project_id)
+
+        for project_id in project_ids:
+            while True:
+                item = buffers[project_id].get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=False)
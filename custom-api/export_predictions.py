@@ -0,0 +1,73 @@
+"""
+Custom Export API prediction 선택 (prediction_mode)
+
+Task마다 model_version이 누적되면 응답의 predictions 배열이 다른 필드보다 훨씬 커진다.
+prediction_mode로 필요한 prediction만 SQL에서 골라 조회한다. (Python에서 조회 후 자르지 않음)
+
+- all: 전체 (기본값, 최신순)
+- model_version: 요청 model_version 필터와 같은 버전만
+- latest_per_version: Task별 model_version마다 최신 1개
+- latest: Task별 최신 1개
+- top_k: Task별 score 상위 prediction_top_k개 (score 내림차순, score 없는 prediction은 뒤로)
+- min_score: score >= prediction_min_score
+
+Task별 순위는 ROW_NUMBER() OVER (PARTITION BY task_id ...) window 함수로 계산하며,
+fast path(export_encoder)와 Serializer 경로(Prefetch)가 같은 QuerySet을 사용한다.
+"""
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+PREDICTION_MODES = ('all', 'model_version', 'latest_per_version', 'latest', 'top_k', 'min_score')
+
+RANK_ALIAS = '_prediction_rank'
+
+LATEST_ORDER = (F('created_at').desc(), F('id').desc())
+SCORE_ORDER = (F('score').desc(nulls_last=True), F('created_at').desc(), F('id').desc())
+
+
+class PredictionSelection:
+    """
+    응답에 포함할 prediction 선택 규칙
+    """
+
+    def __init__(self, mode='all', model_version=None, top_k=None, min_score=None):
+        self.mode = mode
+        self.model_version = model_version
+        self.top_k = top_k
+        self.min_score = min_score
+
+    @classmethod
+    def from_validated(cls, validated_data):
+        return cls(
+            mode=validated_data.get('prediction_mode') or 'all',
+            model_version=validated_data.get('model_version'),
+            top_k=validated_data.get('prediction_top_k'),
+            min_score=validated_data.get('prediction_min_score'),
+        )
+
+    def _ranked(self, queryset, partition_by, order_by, limit):
+        return queryset.annotate(**{
+            RANK_ALIAS: Window(RowNumber(), partition_by=partition_by, order_by=list(order_by))
+        }).filter(**{f'{RANK_ALIAS}__lte': limit})
+
+    def apply(self, queryset):
+        """
+        Prediction QuerySet에 선택 규칙 + 응답 정렬 적용
+        """
+        if self.mode == 'model_version':
+            return queryset.filter(model_version=self.model_version).order_by(*LATEST_ORDER)
+        if self.mode == 'min_score':
+            return queryset.filter(score__gte=self.min_score).order_by(*LATEST_ORDER)
+        if self.mode == 'latest':
+            return self._ranked(queryset, [F('task_id')], LATEST_ORDER, 1).order_by(*LATEST_ORDER)
+        if self.mode == 'latest_per_version':
+            return self._ranked(
+                queryset, [F('task_id'), F('model_version')], LATEST_ORDER, 1
+            ).order_by(*LATEST_ORDER)
+        if self.mode == 'top_k':
+            return self._ranked(queryset, [F('task_id')], SCORE_ORDER, self.top_k).order_by(*SCORE_ORDER)
+        return queryset.order_by('-created_at')
+
+
+ALL = PredictionSelection()
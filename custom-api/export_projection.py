@@ -0,0 +1,122 @@
+"""
+Custom Export API 필드 projection
+
+요청 파라미터 fields / data_keys / include_annotations / include_predictions로
+응답에 포함할 Task 필드를 줄인다.
+
+- fast path(export_encoder): 필요한 Task 컬럼만 조회하고, data_keys는 PostgreSQL에서
+  jsonb projection으로 계산하여 큰 task.data(OCR 텍스트 등)를 DB에서부터 읽지 않는다.
+  제외된 annotations / predictions는 조회하지 않는다.
+- Serializer 경로 / PostgreSQL 이외 DB: 직렬화 후 Python에서 같은 규칙으로 필드를 제거한다.
+- normalize_users: annotation의 completed_by_info 대신 응답 최상위 users 맵 (completed_by ID → 사용자 정보)
+- annotation_selection / prediction_selection: annotations / predictions에 포함할 항목 선택 규칙
+  (export_annotations / export_predictions)
+"""
+
+from django.db import connection
+from django.db.models import JSONField
+from django.db.models.expressions import RawSQL
+
+from tasks.models import Task
+
+from .export_annotations import ALL as ALL_ANNOTATIONS, AnnotationSelection
+from .export_predictions import ALL as ALL_PREDICTIONS, PredictionSelection
+
+# 응답 Task 필드 (응답 순서)
+TASK_FIELDS = (
+    'id', 'project_id', 'data', 'meta', 'created_at', 'updated_at', 'is_labeled',
+    'annotations', 'predictions',
+)
+
+# data_keys projection 결과 컬럼 alias (.values() 행 키)
+DATA_PROJECTION_ALIAS = 'data_projection'
+
+
+class Projection:
+    """
+    응답에 포함할 Task 필드 / task.data 키
+    """
+
+    def __init__(self, fields=None, data_keys=None, include_annotations=True, include_predictions=True,
+                 normalize_users=False, annotation_selection=None, prediction_selection=None):
+        selected = set(fields or TASK_FIELDS)
+        if not include_annotations:
+            selected.discard('annotations')
+        if not include_predictions:
+            selected.discard('predictions')
+
+        self.fields = tuple(name for name in TASK_FIELDS if name in selected)
+        self.data_keys = list(dict.fromkeys(data_keys)) if data_keys else None
+        # annotation에 completed_by_info를 넣지 않고 응답 최상위 users 맵으로 분리
+        self.normalize_users = normalize_users
+        self.annotation_selection = annotation_selection or ALL_ANNOTATIONS
+        self.prediction_selection = prediction_selection or ALL_PREDICTIONS
+
+    @classmethod
+    def from_validated(cls, validated_data):
+        return cls(
+            fields=validated_data.get('fields'),
+            data_keys=validated_data.get('data_keys'),
+            include_annotations=validated_data.get('include_annotations', True),
+            include_predictions=validated_data.get('include_predictions', True),
+            normalize_users=validated_data.get('normalize_users', False),
+            annotation_selection=AnnotationSelection.from_validated(validated_data),
+            prediction_selection=PredictionSelection.from_validated(validated_data),
+        )
+
+    @property
+    def is_full(self):
+        return self.fields == TASK_FIELDS and self.data_keys is None
+
+    def includes(self, name):
+        return name in self.fields
+
+    def require(self, name):
+        """
+        fields 선택과 무관하게 항상 포함할 필드 추가 (예: 다중 프로젝트 응답의 project_id 태그)
+        """
+        if name not in self.fields:
+            self.fields = tuple(field for field in TASK_FIELDS if field in self.fields or field == name)
+        return self
+
+    def project_data(self, data):
+        """
+        task.data에서 data_keys만 남김 (DB에서 projection하지 못한 경우)
+        """
+        if self.data_keys is None or not isinstance(data, dict):
+            return data
+        return {key: value for key, value in data.items() if key in self.data_keys}
+
+    def apply(self, task_data):
+        """
+        직렬화된 Task(dict)에 projection 적용
+        """
+        if self.is_full:
+            return task_data
+
+        projected = {name: task_data[name] for name in self.fields if name in task_data}
+        if 'data' in projected:
+            projected['data'] = self.project_data(projected['data'])
+        return projected
+
+
+FULL = Projection()
+
+
+def supports_data_pushdown():
+    return connection.vendor == 'postgresql'
+
+
+def data_projection_expression(data_keys):
+    """
+    task.data에서 data_keys만 남긴 jsonb (없는 키는 생략, 해당 키가 하나도 없으면 {})
+
+    키 목록은 파라미터로 전달되므로 임의 문자열도 안전하다.
+    """
+    return RawSQL(
+        f"COALESCE((SELECT jsonb_object_agg(e.key, e.value) "
+        f"FROM jsonb_each(\"{Task._meta.db_table}\".\"data\") AS e "
+        f"WHERE e.key = ANY(%s)), '{{}}'::jsonb)",
+        (list(data_keys),),
+        output_field=JSONField(),
+    )
@@ -0,0 +1,125 @@
+"""
+Custom Export API 결정적 샘플링 (sample_size / sample_seed / stratify_by)
+
+평가 작업에 필요한 N개 샘플을 전체 Export 후 클라이언트에서 고르지 않도록 SQL에서 샘플링한다.
+
+- 샘플 순서: Task 해시 ring MD5(task.id)를 seed별 시작 위치 MD5('<sample_seed>')부터 한 바퀴
+  (같은 seed + 같은 대상 집합이면 항상 같은 샘플)
+- 전체 샘플: 해시 ≥ 시작 위치인 Task를 해시 순으로 sample_size개, 부족하면 ring 앞쪽(해시 < 시작 위치)에서 채움
+  Task 해시는 seed와 무관하므로 (project_id, md5(id::text)) expression index(0006_sample_hash_index)를
+  순서대로 읽다가 sample_size개에서 멈춘다. (프로젝트 크기가 아니라 샘플 수에 비례, 쿼리 최대 2회)
+- 층화 샘플(stratify_by): 층마다 샘플 순서 상위 sample_size개
+  (ROW_NUMBER() OVER (PARTITION BY 층 ORDER BY 샘플 순서))
+  - model_version: Task의 최신 prediction model_version (prediction 없으면 null 층)
+  - label: Task의 최신 검수자 annotation 첫 번째 result의 첫 번째 label (choices / labels 등)
+  - 모든 Task의 층을 계산해야 하므로 필터링된 Task 전체를 읽는다. (비용이 프로젝트 크기에 비례)
+- 샘플 Task ID 집합으로 필터링하므로 응답 정렬, page / cursor 페이징, stream, format은 그대로 적용
+
+TABLESAMPLE은 Export 대상 필터 전에 물리 페이지 단위로 샘플링하여 필터 후 건수가 보장되지 않고,
+같은 seed도 테이블 물리 배치가 바뀌면 다른 결과가 나오므로 사용하지 않는다.
+"""
+
+import hashlib
+
+from django.db.models import Case, F, IntegerField, OuterRef, Subquery, TextField, Value, When, Window
+from django.db.models.fields.json import KT
+from django.db.models.functions import MD5, Cast, Coalesce, RowNumber
+
+from tasks.models import Prediction
+
+from .export_eligibility import valid_annotations
+
+SAMPLE_STRATA = ('model_version', 'label')
+
+MAX_SAMPLE_SIZE = 100000
+
+# annotation result value에서 label을 찾는 키 (Label Studio control tag 종류, 앞쪽 우선)
+LABEL_VALUE_KEYS = (
+    'choices', 'labels', 'rectanglelabels', 'polygonlabels', 'keypointlabels',
+    'ellipselabels', 'brushlabels', 'taxonomy',
+)
+
+KEY_ALIAS = '_sample_key'
+WRAP_ALIAS = '_sample_wrap'
+STRATUM_ALIAS = '_sample_stratum'
+RANK_ALIAS = '_sample_rank'
+
+
+def sample_key():
+    """
+    Task 해시 ring 위치 (seed와 무관, 0006_sample_hash_index의 md5((id)::text)와 같은 표현식)
+    """
+    return MD5(Cast('id', output_field=TextField()))
+
+
+def seed_offset(seed):
+    """
+    seed별 ring 시작 위치 (MD5 hex와 같은 32자리 소문자 hex → 문자열 비교 = 해시 값 비교)
+    """
+    return hashlib.md5(str(seed).encode('utf-8')).hexdigest()
+
+
+def _latest_model_version():
+    return Subquery(
+        Prediction.objects.filter(task_id=OuterRef('pk')).order_by('-created_at', '-id').values('model_version')[:1]
+    )
+
+
+def _latest_label():
+    label = Coalesce(*[KT(f'result__0__value__{key}__0') for key in LABEL_VALUE_KEYS])
+    return Subquery(
+        valid_annotations().filter(task_id=OuterRef('pk')).order_by('-created_at', '-id')
+        .annotate(_label=label).values('_label')[:1]
+    )
+
+
+STRATUM_EXPRESSIONS = {
+    'model_version': _latest_model_version,
+    'label': _latest_label,
+}
+
+
+def _sample_ids(keyed, offset, sample_size):
+    """
+    ring 순서 상위 sample_size개 Task ID (시작 위치부터, 부족하면 앞쪽에서 채우는 top-up 쿼리)
+    """
+    ids = list(
+        keyed.filter(**{f'{KEY_ALIAS}__gte': offset}).order_by(KEY_ALIAS, 'id')
+        .values_list('id', flat=True)[:sample_size]
+    )
+    if len(ids) < sample_size:
+        ids += list(
+            keyed.filter(**{f'{KEY_ALIAS}__lt': offset}).order_by(KEY_ALIAS, 'id')
+            .values_list('id', flat=True)[:sample_size - len(ids)]
+        )
+    return ids
+
+
+def sample(queryset, sample_size, sample_seed=0, stratify_by=None):
+    """
+    필터링된 Task QuerySet → 샘플 Task만 (sample_size가 없으면 그대로)
+
+    stratify_by가 없으면 샘플 ID를 바로 조회하여 id IN (...)으로 필터링한다.
+    """
+    if not sample_size:
+        return queryset
+
+    offset = seed_offset(sample_seed)
+    keyed = queryset.order_by().alias(**{KEY_ALIAS: sample_key()})
+    if not stratify_by:
+        return queryset.filter(id__in=_sample_ids(keyed, offset, sample_size))
+
+    # ring 순서: 시작 위치 이후(0) → 앞쪽(1), 각각 해시 순
+    wrap = Case(
+        When(**{f'{KEY_ALIAS}__gte': offset}, then=Value(0)), default=Value(1), output_field=IntegerField()
+    )
+    sampled = keyed.alias(**{WRAP_ALIAS: wrap}).annotate(
+        **{STRATUM_ALIAS: STRATUM_EXPRESSIONS[stratify_by]()}
+    ).annotate(**{
+        RANK_ALIAS: Window(
+            RowNumber(), partition_by=[F(STRATUM_ALIAS)],
+            order_by=[F(WRAP_ALIAS).asc(), F(KEY_ALIAS).asc(), F('id').asc()]
+        )
+    }).filter(**{f'{RANK_ALIAS}__lte': sample_size})
+
+    return queryset.filter(id__in=sampled.values('id'))
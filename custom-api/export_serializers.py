@@ -6,6 +6,15 @@ Label Studio 1.20.0 기반 커스텀 Export API의 Request/Response Serializer
 
 from rest_framework import serializers
 
+from .export_pagination import InvalidCursor, decode_cursor
+from .export_annotations import ANNOTATION_MODES
+from .export_predictions import PREDICTION_MODES
+from .export_projection import TASK_FIELDS
+from .export_sampling import MAX_SAMPLE_SIZE, SAMPLE_STRATA
+from .export_shards import MAX_SHARD_COUNT
+from .export_stats import DATE_GRANULARITIES, GROUP_BY_DIMENSIONS
+from .export_timestamps import timestamp_fields
+
 
 class CustomExportRequestSerializer(serializers.Serializer):
     """
@@ -14,12 +23,20 @@ class CustomExportRequestSerializer(serializers.Serializer):
     MLOps 시스템에서 모델 학습 및 성능 계산을 위한 필터링된 Export 요청
     """
 
-    # 필수 필드
+    # 필수 필드 (project_id 또는 project_ids 중 하나)
     project_id = serializers.IntegerField(
-        required=True,
+        required=False,
         help_text="Label Studio 프로젝트 ID"
     )
 
+    project_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=50,
+        help_text="여러 프로젝트 Export (project_id 대신 사용, 프로젝트별 병렬 조회 후 순서대로 병합)"
+    )
+
     # 선택 필드 - 날짜 범위 필터
     search_from = serializers.DateTimeField(
         required=False,
@@ -81,6 +98,58 @@ class CustomExportRequestSerializer(serializers.Serializer):
         help_text="라벨링 승인자 User ID - annotation.completed_by 기준 (Super User)"
     )
 
+    # 선택 필드 - 증분(delta) Export
+    updated_since = serializers.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text="이 시각 이후(미포함) Task / 검수자 annotation / prediction이 수정된 Task만 - "
+                  "이전 응답의 watermark 사용"
+    )
+
+    updated_until = serializers.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text="이 시각까지(포함) 수정분만 - 생략 시 서버 watermark (현재 시각 - 안전 구간)"
+    )
+
+    # 선택 필드 - 샤딩 (여러 worker가 겹치지 않는 Task 부분집합을 병렬 조회)
+    shard_index = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=0,
+        help_text="조회할 shard 번호 (0 ~ shard_count - 1, Task ID 해시 구간 기준)"
+    )
+
+    shard_count = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        max_value=MAX_SHARD_COUNT,
+        help_text=f"전체 shard 수 (최대 {MAX_SHARD_COUNT}, shard_index와 함께 사용)"
+    )
+
+    # 선택 필드 - 결정적 샘플링
+    sample_size = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        max_value=MAX_SAMPLE_SIZE,
+        help_text=f"샘플 Task 수 (최대 {MAX_SAMPLE_SIZE}, stratify_by 사용 시 층별 개수)"
+    )
+
+    sample_seed = serializers.IntegerField(
+        required=False,
+        default=0,
+        help_text="샘플링 seed (같은 seed + 같은 대상이면 같은 샘플, 기본값: 0)"
+    )
+
+    stratify_by = serializers.ChoiceField(
+        choices=SAMPLE_STRATA,
+        required=False,
+        allow_null=True,
+        help_text="층화 샘플링 기준 - 'model_version': 최신 prediction 버전, 'label': 최신 검수 label"
+    )
+
     # 선택 필드 - 페이징
     page = serializers.IntegerField(
         required=False,
@@ -97,27 +166,378 @@ class CustomExportRequestSerializer(serializers.Serializer):
         help_text="페이지당 Task 개수 (최대 10000, 없으면 전체 반환)"
     )
 
+    pagination = serializers.ChoiceField(
+        choices=['page', 'cursor'],
+        required=False,
+        default='page',
+        help_text="페이징 방식 - 'page': page 번호 기반 (기본값), 'cursor': (created_at, id) keyset 기반"
+    )
+
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        help_text="cursor 페이징 위치 (이전 응답의 next_cursor, 없으면 첫 페이지)"
+    )
+
+    include_total = serializers.BooleanField(
+        required=False,
+        default=True,
+        help_text="전체 건수(total) 포함 여부 - false이면 COUNT(*) 쿼리 생략"
+    )
+
+    # 선택 필드 - snapshot 페이징
+    snapshot = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="true이면 첫 요청 시점의 Export 대상 Task 목록을 고정하고 snapshot_token 반환 "
+                  "(page 페이징 전용, 이후 페이지는 snapshot_token으로 고정된 목록에서 조회)"
+    )
+
+    snapshot_token = serializers.UUIDField(
+        required=False,
+        allow_null=True,
+        help_text="snapshot 페이징 위치 고정 토큰 (첫 응답의 snapshot_token)"
+    )
+
+    def validate_cursor(self, value):
+        """
+        cursor 디코딩 → (created_at, id) 튜플
+        """
+        if not value:
+            return None
+
+        try:
+            return decode_cursor(value)
+        except InvalidCursor:
+            raise serializers.ValidationError("유효하지 않은 cursor입니다.")
+
     # 선택 필드 - 응답 타입
     response_type = serializers.ChoiceField(
-        choices=['data', 'count'],
+        choices=['data', 'count', 'stream'],
         required=False,
         default='data',
-        help_text="응답 타입 - 'data': Task 데이터 반환 (기본값), 'count': 건수만 반환"
+        help_text="응답 타입 - 'data': Task 데이터 반환 (기본값), 'count': 건수만 반환, "
+                  "'stream': NDJSON 스트리밍 (한 줄에 Task 하나)"
+    )
+
+    # 선택 필드 - 출력 형식
+    format = serializers.ChoiceField(
+        choices=['json', 'parquet', 'arrow'],
+        required=False,
+        default='json',
+        help_text="출력 형식 - 'json' (기본값), 'parquet': Apache Parquet 파일, "
+                  "'arrow': Arrow IPC 파일 (annotation 단위 행, 전체 Task 스트리밍)"
+    )
+
+    # 선택 필드 - 응답 필드 projection
+    fields = serializers.ListField(
+        child=serializers.ChoiceField(choices=TASK_FIELDS),
+        required=False,
+        allow_empty=False,
+        help_text="응답에 포함할 Task 필드 목록 (기본값: 전체) - "
+                  "id, project_id, data, meta, created_at, updated_at, is_labeled, annotations, predictions"
+    )
+
+    data_keys = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        required=False,
+        allow_empty=False,
+        max_length=100,
+        help_text="응답에 포함할 task.data 키 목록 (기본값: 전체, 없는 키는 생략)"
+    )
+
+    include_annotations = serializers.BooleanField(
+        required=False,
+        default=True,
+        help_text="annotations 포함 여부 - false이면 annotation을 조회하지 않음"
+    )
+
+    include_predictions = serializers.BooleanField(
+        required=False,
+        default=True,
+        help_text="predictions 포함 여부 - false이면 prediction을 조회하지 않음"
+    )
+
+    # 선택 필드 - annotation 선택
+    annotation_mode = serializers.ChoiceField(
+        choices=ANNOTATION_MODES,
+        required=False,
+        default='all',
+        help_text="응답 annotations 선택 - 'all' (기본값): 검수자 annotation 전체, 'latest': 최신 1개, "
+                  "'latest_per_reviewer': 검수자별 최신, 'confirm_user': confirm_user_id 검수자만"
+    )
+
+    # 선택 필드 - prediction 선택
+    prediction_mode = serializers.ChoiceField(
+        choices=PREDICTION_MODES,
+        required=False,
+        default='all',
+        help_text="응답 predictions 선택 - 'all' (기본값), 'model_version': 요청 model_version만, "
+                  "'latest_per_version': model_version별 최신, 'latest': 최신 1개, "
+                  "'top_k': score 상위 prediction_top_k개, 'min_score': score >= prediction_min_score"
+    )
+
+    prediction_top_k = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        max_value=100,
+        help_text="prediction_mode='top_k'의 Task별 prediction 수"
+    )
+
+    prediction_min_score = serializers.FloatField(
+        required=False,
+        allow_null=True,
+        help_text="prediction_mode='min_score'의 최소 score (포함)"
+    )
+
+    normalize_users = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="true이면 annotation에 completed_by_info 대신 completed_by만 포함하고 "
+                  "응답 최상위 users 맵(사용자 ID → 정보)을 반환 (response_type='data', format='json', mode='sync')"
+    )
+
+    # 선택 필드 - 실행 방식
+    mode = serializers.ChoiceField(
+        choices=['sync', 'async'],
+        required=False,
+        default='sync',
+        help_text="실행 방식 - 'sync': 즉시 응답 (기본값), "
+                  "'async': 작업 ID 반환 후 worker가 결과 파일 생성 (전체 Export 전용)"
+    )
+
+    # 선택 필드 - 결과 전달 방식
+    delivery = serializers.ChoiceField(
+        choices=['inline', 'artifact'],
+        required=False,
+        default='inline',
+        help_text="결과 전달 방식 - 'inline': 응답 본문 (기본값), "
+                  "'artifact': 데이터 볼륨에 파일로 기록 후 다운로드 URL 반환 (같은 요청은 파일 재사용)"
     )
 
     def validate(self, data):
         """
         필드 간 유효성 검증
         """
-        # page와 page_size는 함께 제공되어야 함
         page = data.get('page')
         page_size = data.get('page_size')
 
+        if (data.get('project_id') is None) == (not data.get('project_ids')):
+            raise serializers.ValidationError(
+                "project_id 또는 project_ids 중 하나만 제공해야 합니다."
+            )
+
+        # 다중 프로젝트는 전체 Task를 병합하므로 JSON data/count/stream + 페이징 없음 + 동기 실행만 허용
+        if data.get('project_ids'):
+            data['project_ids'] = list(dict.fromkeys(data['project_ids']))
+            if page is not None or page_size is not None or data.get('cursor') or data.get('pagination') == 'cursor':
+                raise serializers.ValidationError(
+                    "project_ids는 페이징과 함께 사용할 수 없습니다."
+                )
+            if data.get('format', 'json') != 'json' or data.get('mode') == 'async':
+                raise serializers.ValidationError(
+                    "project_ids는 format='json', mode='sync'에서만 사용할 수 있습니다."
+                )
+
+        updated_since = data.get('updated_since')
+        updated_until = data.get('updated_until')
+        if updated_since and updated_until and updated_since >= updated_until:
+            raise serializers.ValidationError(
+                "updated_since는 updated_until보다 이전이어야 합니다."
+            )
+
+        shard_index = data.get('shard_index')
+        shard_count = data.get('shard_count')
+        if (shard_index is None) != (shard_count is None):
+            raise serializers.ValidationError(
+                "shard_index와 shard_count는 함께 제공되어야 합니다."
+            )
+        if shard_count is not None and shard_index >= shard_count:
+            raise serializers.ValidationError(
+                "shard_index는 0 이상 shard_count 미만이어야 합니다."
+            )
+
+        if data.get('stratify_by') and not data.get('sample_size'):
+            raise serializers.ValidationError(
+                "stratify_by는 sample_size와 함께 제공되어야 합니다."
+            )
+
+        # 비동기 작업은 전체 Task를 파일로 기록하므로 data/stream 응답 + 페이징 없음만 허용
+        if data.get('mode') == 'async':
+            if data.get('response_type', 'data') == 'count':
+                raise serializers.ValidationError(
+                    "mode='async'는 response_type='count'와 함께 사용할 수 없습니다."
+                )
+            if page is not None or page_size is not None or data.get('cursor') or data.get('pagination') == 'cursor':
+                raise serializers.ValidationError(
+                    "mode='async'는 페이징과 함께 사용할 수 없습니다."
+                )
+
+        if data.get('annotation_mode') == 'confirm_user' and not data.get('confirm_user_id'):
+            raise serializers.ValidationError(
+                "annotation_mode='confirm_user'에는 confirm_user_id가 필요합니다."
+            )
+
+        prediction_mode = data.get('prediction_mode', 'all')
+        if prediction_mode == 'model_version' and not data.get('model_version'):
+            raise serializers.ValidationError(
+                "prediction_mode='model_version'에는 model_version이 필요합니다."
+            )
+        if (prediction_mode == 'top_k') != (data.get('prediction_top_k') is not None):
+            raise serializers.ValidationError(
+                "prediction_top_k는 prediction_mode='top_k'와 함께 제공되어야 합니다."
+            )
+        if (prediction_mode == 'min_score') != (data.get('prediction_min_score') is not None):
+            raise serializers.ValidationError(
+                "prediction_min_score는 prediction_mode='min_score'와 함께 제공되어야 합니다."
+            )
+
+        if data.get('data_keys') and data.get('fields') and 'data' not in data['fields']:
+            raise serializers.ValidationError(
+                "data_keys는 fields에 'data'가 포함된 경우에만 사용할 수 있습니다."
+            )
+
+        # users 맵은 응답 최상위에 포함되므로 단일 JSON 응답에서만 사용 가능
+        if data.get('normalize_users') and (
+            data.get('response_type', 'data') != 'data'
+            or data.get('format', 'json') != 'json'
+            or data.get('mode') == 'async'
+        ):
+            raise serializers.ValidationError(
+                "normalize_users는 response_type='data', format='json', mode='sync'에서만 사용할 수 있습니다."
+            )
+
+        # 컬럼형 형식은 전체 Task를 파일로 스트리밍하므로 data 응답 + 페이징 없음만 허용
+        if data.get('format', 'json') != 'json':
+            # 스키마가 고정된 annotation 단위 행이므로 Task 필드 projection은 data_keys만 지원
+            if data.get('fields') or not data.get('include_annotations', True) \
+                    or not data.get('include_predictions', True):
+                raise serializers.ValidationError(
+                    "format='parquet'/'arrow'는 fields/include_annotations/include_predictions를 "
+                    "지원하지 않습니다. (data_keys만 사용 가능)"
+                )
+            if data.get('response_type', 'data') != 'data':
+                raise serializers.ValidationError(
+                    "format='parquet'/'arrow'는 response_type='data'에서만 사용할 수 있습니다."
+                )
+            if page is not None or page_size is not None or data.get('cursor') or data.get('pagination') == 'cursor':
+                raise serializers.ValidationError(
+                    "format='parquet'/'arrow'는 페이징과 함께 사용할 수 없습니다."
+                )
+
+        # snapshot_token이 제공되면 snapshot 페이징으로 간주
+        if data.get('snapshot_token'):
+            data['snapshot'] = True
+
+        # snapshot은 고정된 Task 목록을 page 단위로 나눠 읽으므로 JSON data + page 페이징 + 동기 실행만 허용
+        if data.get('snapshot'):
+            if page is None or page_size is None or data.get('cursor') or data.get('pagination') == 'cursor':
+                raise serializers.ValidationError(
+                    "snapshot은 page, page_size 페이징에서만 사용할 수 있습니다."
+                )
+            if data.get('response_type', 'data') != 'data' or data.get('format', 'json') != 'json' \
+                    or data.get('mode') == 'async' or data.get('project_ids'):
+                raise serializers.ValidationError(
+                    "snapshot은 response_type='data', format='json', mode='sync', 단일 project_id에서만 "
+                    "사용할 수 있습니다."
+                )
+
+        # artifact는 전체 결과를 파일 하나로 기록하므로 data 응답 + 페이징 없음 + 동기 실행 + 단일 프로젝트만 허용
+        if data.get('delivery') == 'artifact':
+            if data.get('response_type', 'data') != 'data' or data.get('mode') == 'async' \
+                    or data.get('project_ids') or data.get('snapshot') or data.get('normalize_users'):
+                raise serializers.ValidationError(
+                    "delivery='artifact'는 response_type='data', mode='sync', 단일 project_id에서만 "
+                    "사용할 수 있습니다. (snapshot, normalize_users 제외)"
+                )
+            if page is not None or page_size is not None or data.get('cursor') or data.get('pagination') == 'cursor':
+                raise serializers.ValidationError(
+                    "delivery='artifact'는 페이징과 함께 사용할 수 없습니다."
+                )
+
+        # cursor가 제공되면 cursor 페이징으로 간주
+        if data.get('cursor'):
+            data['pagination'] = 'cursor'
+
+        if data.get('pagination') == 'cursor':
+            # cursor 페이징은 page_size만 사용
+            if page is not None:
+                raise serializers.ValidationError(
+                    "cursor 페이징에서는 page를 사용할 수 없습니다."
+                )
+            if page_size is None:
+                raise serializers.ValidationError(
+                    "cursor 페이징에는 page_size가 필요합니다."
+                )
+            if data.get('response_type') == 'stream':
+                raise serializers.ValidationError(
+                    "response_type='stream'은 cursor 페이징과 함께 사용할 수 없습니다."
+                )
+            return data
+
+        # page와 page_size는 함께 제공되어야 함
         if (page is not None) != (page_size is not None):
             raise serializers.ValidationError(
                 "page와 page_size는 함께 제공되어야 합니다."
             )
 
+        # stream 모드는 전체 Task를 스트리밍하므로 페이징과 함께 사용할 수 없음
+        if data.get('response_type') == 'stream' and page is not None:
+            raise serializers.ValidationError(
+                "response_type='stream'은 page/page_size와 함께 사용할 수 없습니다."
+            )
+
+        return data
+
+
+class CustomExportStatsRequestSerializer(CustomExportRequestSerializer):
+    """
+    Custom Export 집계 API Request Serializer
+
+    Export와 같은 필터 + group_by (응답 형식/페이징 파라미터는 사용하지 않음)
+    """
+
+    # Export 응답 형식 관련 파라미터 (집계 요청에서는 허용하지 않음)
+    EXPORT_ONLY_FIELDS = (
+        'project_ids', 'page', 'page_size', 'pagination', 'cursor', 'include_total', 'response_type',
+        'format', 'mode', 'fields', 'data_keys', 'include_annotations', 'include_predictions',
+        'normalize_users', 'snapshot', 'snapshot_token', 'annotation_mode', 'prediction_mode', 'prediction_top_k',
+        'prediction_min_score', 'delivery',
+    )
+
+    group_by = serializers.ListField(
+        child=serializers.ChoiceField(choices=GROUP_BY_DIMENSIONS),
+        allow_empty=False,
+        help_text="집계 기준 (model_version, confirm_user, date)"
+    )
+
+    date_granularity = serializers.ChoiceField(
+        choices=DATE_GRANULARITIES,
+        required=False,
+        default='day',
+        help_text="date 집계 단위 (day, week, month, 기본값: day)"
+    )
+
+    def validate(self, data):
+        unsupported = [name for name in self.EXPORT_ONLY_FIELDS if name in self.initial_data]
+        if unsupported:
+            raise serializers.ValidationError(
+                f"집계 API에서는 {', '.join(unsupported)} 파라미터를 사용할 수 없습니다."
+            )
+
+        data = super().validate(data)
+        data['group_by'] = list(dict.fromkeys(data['group_by']))
+
+        # date bucket은 정규화된 timestamp(UTC)로 계산 (문자열 날짜는 형식이 섞여 있어 bucket 불가)
+        search_date_field = data.get('search_date_field') or 'source_created_at'
+        if 'date' in data['group_by'] and search_date_field not in timestamp_fields():
+            raise serializers.ValidationError(
+                f"group_by='date'는 정규화된 날짜 필드(CUSTOM_EXPORT_TIMESTAMP_FIELDS)에서만 사용할 수 있습니다: "
+                f"{search_date_field}"
+            )
+
         return data
 
 
@@ -165,7 +585,8 @@ class CustomExportResponseSerializer(serializers.Serializer):
     Custom Export API Response Serializer
     """
     total = serializers.IntegerField(
-        help_text="필터링된 전체 Task 개수"
+        required=False,
+        help_text="필터링된 전체 Task 개수 (include_total=false이면 생략)"
     )
 
     page = serializers.IntegerField(
@@ -193,4 +614,31 @@ class CustomExportResponseSerializer(serializers.Serializer):
         help_text="이전 페이지 존재 여부 (페이징 사용 시)"
     )
 
+    next_cursor = serializers.CharField(
+        required=False,
+        allow_null=True,
+        help_text="다음 페이지 cursor (cursor 페이징 사용 시, 마지막 페이지이면 null)"
+    )
+
+    watermark = serializers.DateTimeField(
+        required=False,
+        help_text="증분 Export 상한 (updated_since/updated_until 사용 시, 다음 요청의 updated_since)"
+    )
+
+    snapshot_token = serializers.UUIDField(
+        required=False,
+        help_text="snapshot 페이징 토큰 (snapshot=true인 경우, 다음 페이지 요청에 전달)"
+    )
+
+    snapshot_expires_at = serializers.DateTimeField(
+        required=False,
+        help_text="snapshot 만료 시각"
+    )
+
+    users = serializers.DictField(
+        child=serializers.DictField(),
+        required=False,
+        help_text="annotation completed_by ID → 사용자 정보 (normalize_users=true인 경우)"
+    )
+
     tasks = TaskExportSerializer(many=True)
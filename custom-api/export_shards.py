@@ -0,0 +1,52 @@
+"""
+Custom Export API 해시 샤딩 (shard_index / shard_count)
+
+여러 worker가 페이지 번호를 나눠 갖지 않고도 서로 겹치지 않는 Task 부분집합을 동시에 받을 수 있도록
+Export 대상 Task 집합을 Task ID 해시 기준으로 결정적으로 분할한다.
+
+- shard = MD5(task.id) 해시 공간을 shard_count개의 연속 구간으로 나눈 것 중 shard_index번째
+  (해시가 고르게 분포하므로 shard 크기가 비슷하며, Task 추가/삭제와 무관하게 Task의 shard가 바뀌지 않음)
+- 구간 조건(md5 >= 하한 AND md5 < 상한)은 결정적 샘플링과 같은 (project_id, md5(id::text))
+  expression index(0006_sample_hash_index)로 범위 탐색한다. (MOD(id, N) = i처럼 전체 스캔하지 않음)
+- 각 shard 안에서는 기존 정렬((-created_at, -id)) / page / cursor 페이징을 그대로 사용
+- 같은 필터 + shard_count로 받은 shard 0..N-1의 합집합은 shard 없이 받은 결과와 같다.
+"""
+
+from .export_sampling import sample_key
+
+SHARD_ALIAS = '_export_shard'
+
+MAX_SHARD_COUNT = 1024
+
+# MD5 hex(32자리) 해시 공간 크기
+HASH_SPACE = 16 ** 32
+
+
+def shard_bounds(shard_index, shard_count):
+    """
+    shard의 MD5 hex 구간 [lower, upper) (첫 shard는 하한, 마지막 shard는 상한 없음 → None)
+
+    MD5 hex는 32자리 소문자 hex이므로 문자열 비교 = 해시 값 비교
+    """
+    def boundary(index):
+        return format(index * HASH_SPACE // shard_count, '032x')
+
+    lower = boundary(shard_index) if shard_index > 0 else None
+    upper = boundary(shard_index + 1) if shard_index + 1 < shard_count else None
+    return lower, upper
+
+
+def filter_shard(queryset, shard_index=None, shard_count=None):
+    """
+    Task QuerySet → shard_index번째 shard의 Task만 (shard_count가 없거나 1이면 그대로)
+    """
+    if not shard_count or shard_count == 1:
+        return queryset
+
+    lower, upper = shard_bounds(shard_index, shard_count)
+    lookups = {}
+    if lower is not None:
+        lookups[f'{SHARD_ALIAS}__gte'] = lower
+    if upper is not None:
+        lookups[f'{SHARD_ALIAS}__lt'] = upper
+    return queryset.alias(**{SHARD_ALIAS: sample_key()}).filter(**lookups)
@@ -0,0 +1,125 @@
+"""
+Custom Export API snapshot 페이징 (snapshot=true)
+
+페이지마다 필터 쿼리를 다시 실행하는 OFFSET 페이징은 Export 도중 검수가 진행되면
+페이지 경계의 Task가 밀리거나 당겨져 학습 데이터에 중복/누락이 생긴다.
+
+- 첫 요청: 필터 결과 Task ID를 INSERT ... SELECT 한 번으로 ExportSnapshotTask에 고정하고
+  snapshot_token(= ExportSnapshot.id)을 반환
+- 이후 페이지: snapshot_token으로 (snapshot, position) 범위의 Task ID만 읽은 뒤
+  해당 Task를 id IN (...)으로 조회 (필터 / COUNT 쿼리 재실행 없음)
+- 대상 Task 집합과 순서는 고정되고, Task 내용(annotation 등)은 조회 시점 값
+- CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS 후 만료되며 만료된 snapshot은 새 snapshot 생성 시 삭제
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import ExportSnapshot, ExportSnapshotTask
+
+# snapshot 대상 집합을 결정하는 필터 파라미터 (이후 페이지 요청과 비교)
+SNAPSHOT_FILTER_FIELDS = (
+    'search_from', 'search_to', 'search_date_field', 'model_version', 'confirm_user_id',
+    'updated_since', 'updated_until', 'shard_index', 'shard_count', 'sample_size', 'sample_seed', 'stratify_by',
+)
+
+
+def ttl_seconds():
+    return getattr(settings, 'CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS', 3600)
+
+
+def _as_json(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def snapshot_params(validated_data):
+    """
+    snapshot에 저장할 필터 파라미터 (JSON 직렬화 가능한 값)
+    """
+    return {name: _as_json(validated_data.get(name)) for name in SNAPSHOT_FILTER_FIELDS}
+
+
+def matches(snapshot, validated_data):
+    """
+    이후 페이지 요청의 필터가 snapshot 생성 시 필터와 같은지 확인
+
+    updated_until은 서버 watermark로 매 요청 다시 계산되므로 비교하지 않는다.
+    (snapshot에 고정된 watermark를 사용)
+    """
+    requested = snapshot_params(validated_data)
+    return all(
+        snapshot.params.get(name) == requested[name]
+        for name in SNAPSHOT_FILTER_FIELDS if name != 'updated_until'
+    )
+
+
+def purge_expired():
+    """
+    만료된 snapshot 삭제 (ExportSnapshotTask는 CASCADE로 함께 삭제)
+    """
+    return ExportSnapshot.objects.filter(expires_at__lt=timezone.now()).delete()[0]
+
+
+def create_snapshot(user, project_id, validated_data, queryset):
+    """
+    필터링된 Task QuerySet의 ID 목록을 (-created_at, -id) 순서로 고정
+
+    Returns:
+        ExportSnapshot
+    """
+    purge_expired()
+
+    snapshot_table = ExportSnapshotTask._meta.db_table
+    source_sql, source_params = queryset.order_by().values('id', 'created_at').query.sql_with_params()
+
+    with transaction.atomic():
+        snapshot = ExportSnapshot.objects.create(
+            project_id=project_id,
+            created_by=user if user.is_authenticated else None,
+            params=snapshot_params(validated_data),
+            expires_at=timezone.now() + datetime.timedelta(seconds=ttl_seconds()),
+        )
+        snapshot_id = ExportSnapshot._meta.pk.get_db_prep_value(snapshot.id, connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {snapshot_table} (snapshot_id, position, task_id) "
+                f"SELECT %s, ROW_NUMBER() OVER (ORDER BY s.created_at DESC, s.id DESC), s.id "
+                f"FROM ({source_sql}) s",
+                (snapshot_id, *source_params)
+            )
+            snapshot.total = cursor.rowcount
+
+        snapshot.save(update_fields=['total'])
+
+    return snapshot
+
+
+def get_snapshot(token, user, project_id):
+    """
+    요청자의 만료되지 않은 snapshot 조회 (없으면 None)
+    """
+    return ExportSnapshot.objects.filter(
+        id=token,
+        project_id=project_id,
+        created_by=user,
+        expires_at__gte=timezone.now(),
+    ).first()
+
+
+def page_task_ids(snapshot, start, page_size):
+    """
+    snapshot의 [start, start + page_size) 구간 Task ID (Export 순서)
+    """
+    return list(
+        ExportSnapshotTask.objects.filter(
+            snapshot=snapshot,
+            position__gt=start,
+            position__lte=start + page_size,
+        ).order_by('position').values_list('task_id', flat=True)
+    )
@@ -0,0 +1,80 @@
+"""
+Custom Export API 집계 (group_by)
+
+Export 필터와 같은 조건의 Task를 model_version / 검수자 / 날짜 bucket별로 세어
+대시보드가 response_type='count'를 조합마다 반복 호출하지 않도록 GROUP BY 쿼리 1회로 응답한다.
+
+- model_version: prediction.model_version (model_version 필터가 있으면 해당 버전만)
+- confirm_user: 검수자(Super User)의 유효한 annotation의 completed_by (confirm_user_id 필터가 있으면 해당 사용자만)
+- date: 정규화된 날짜 필드(ExportTaskTimestamp, UTC)의 day / week(월요일 시작) / month bucket
+
+Task 하나가 여러 model_version / 검수자에 속하면 각 그룹에 한 번씩 포함되고,
+그룹 안에서는 COUNT(DISTINCT task.id)로 중복 없이 센다.
+"""
+
+import datetime
+
+from django.db.models import Count, DateField, F
+from django.db.models.functions import Trunc
+
+GROUP_BY_DIMENSIONS = ('model_version', 'confirm_user', 'date')
+DATE_GRANULARITIES = ('day', 'week', 'month')
+
+# 응답 그룹의 키 이름 (dimension → 컬럼 alias)
+DIMENSION_KEYS = {
+    'model_version': 'model_version',
+    'confirm_user': 'confirm_user_id',
+    'date': 'date',
+}
+
+
+def aggregate(queryset, group_by, model_version=None, confirm_user_id=None,
+              search_date_field='source_created_at', date_granularity='day'):
+    """
+    필터링된 Task QuerySet을 dimension별로 집계
+
+    Args:
+        queryset: Export 필터가 적용된 Task QuerySet
+        group_by: GROUP_BY_DIMENSIONS 중 집계 기준 목록 (응답 키 순서)
+        model_version: model_version 필터 (model_version 그룹을 해당 버전으로 제한)
+        confirm_user_id: 승인자 필터 (confirm_user 그룹을 해당 사용자로 제한)
+        search_date_field: date 그룹 기준 날짜 필드 (정규화 대상 필드)
+        date_granularity: date bucket 단위 (day / week / month)
+
+    Returns:
+        list: [{"model_version": ..., "confirm_user_id": ..., "date": "YYYY-MM-DD", "count": n}, ...]
+    """
+    queryset = queryset.order_by()
+    columns = {}
+
+    if 'model_version' in group_by:
+        if model_version:
+            queryset = queryset.filter(predictions__model_version=model_version)
+        columns['model_version'] = F('predictions__model_version')
+
+    if 'confirm_user' in group_by:
+        reviewer_filter = {
+            'annotations__completed_by__is_superuser': True,
+            'annotations__was_cancelled': False,
+        }
+        if confirm_user_id:
+            reviewer_filter['annotations__completed_by_id'] = confirm_user_id
+        queryset = queryset.filter(**reviewer_filter)
+        columns['confirm_user_id'] = F('annotations__completed_by_id')
+
+    if 'date' in group_by:
+        queryset = queryset.filter(export_timestamps__field_name=search_date_field)
+        columns['date'] = Trunc(
+            'export_timestamps__value',
+            date_granularity,
+            output_field=DateField(),
+            tzinfo=datetime.timezone.utc,
+        )
+
+    keys = [DIMENSION_KEYS[dimension] for dimension in group_by]
+    rows = queryset.values(**columns).annotate(count=Count('id', distinct=True)).order_by(*keys)
+
+    return [
+        {**{key: row[key] for key in keys}, 'count': row['count']}
+        for row in rows
+    ]
@@ -0,0 +1,265 @@
+"""
+Custom Export API 날짜 필드 정규화
+
+task.data의 날짜 문자열을 timestamptz로 파싱하여 ExportTaskTimestamp side table에 저장한다.
+
+- 형식: 'YYYY-MM-DD HH:MM:SS', ISO 8601 ('T' 구분자, 마이크로초, 'Z'/±HH:MM 오프셋), 'YYYY-MM-DD'
+- 타임존 없는 값은 UTC로 간주 (기존 문자열 비교 동작과 동일)
+- 파싱할 수 없는 값은 parse_error=True로 기록되어 요청마다 다시 스캔하지 않고 리포트로 조회
+- 갱신: Task post_save 시그널(개별 저장), Label Studio import 후처리(task_import, bulk_create),
+  마이그레이션 0007(기존 Task), run_export_worker 주기 동기화 / sync_export_timestamps 명령
+- Export 요청은 side table을 읽기만 하며, 행이 아직 없는 Task는 문자열 비교로 판정한다.
+"""
+
+import contextlib
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from tasks.models import Task
+
+from .models import ExportTaskTimestamp
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 1000
+
+# run_export_worker 주기 동기화를 한 worker만 실행하기 위한 PostgreSQL advisory lock 키
+SYNC_LOCK_KEY = 0x63657870_7473  # 'cexp' 'ts'
+
+
+def timestamp_fields():
+    """
+    정규화 대상 날짜 필드 목록 (CUSTOM_EXPORT_TIMESTAMP_FIELDS, 기본값: source_created_at)
+    """
+    return list(getattr(settings, 'CUSTOM_EXPORT_TIMESTAMP_FIELDS', ['source_created_at']))
+
+
+def parse_date_value(raw):
+    """
+    날짜 문자열을 UTC aware datetime으로 변환
+
+    Returns:
+        tuple: (value, parse_error) - 값이 없으면 (None, False), 파싱 실패면 (None, True)
+    """
+    if raw is None or raw == '':
+        return None, False
+
+    text = str(raw).strip()
+    try:
+        value = parse_datetime(text)
+        if value is None:
+            date_value = parse_date(text)
+            if date_value is not None:
+                value = datetime.datetime.combine(date_value, datetime.time.min)
+    except ValueError:
+        # 형식은 맞지만 존재하지 않는 날짜 (예: 2025-02-30)
+        value = None
+
+    if value is None:
+        return None, True
+
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, datetime.timezone.utc)
+
+    return value.astimezone(datetime.timezone.utc), False
+
+
+def _build_rows(rows, field):
+    """
+    (task_id, project_id, raw, task_updated_at) 목록 → ExportTaskTimestamp 인스턴스 목록
+    """
+    instances = []
+    for task_id, project_id, raw, task_updated_at in rows:
+        value, parse_error = parse_date_value(raw)
+        if parse_error:
+            logger.warning(
+                f"[Export Timestamp] Unparseable date: task={task_id} field={field} value={raw!r}"
+            )
+        instances.append(ExportTaskTimestamp(
+            task_id=task_id,
+            project_id=project_id,
+            field_name=field,
+            raw_value=None if raw is None else str(raw),
+            value=value,
+            parse_error=parse_error,
+            task_updated_at=task_updated_at,
+        ))
+    return instances
+
+
+def _upsert(instances):
+    ExportTaskTimestamp.objects.bulk_create(
+        instances,
+        batch_size=SYNC_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['task', 'field_name'],
+        update_fields=['project_id', 'raw_value', 'value', 'parse_error', 'task_updated_at', 'updated_at'],
+    )
+
+
+def sync_task_timestamps(task, fields=None):
+    """
+    Task 하나의 날짜 필드 정규화 값 갱신 (Task post_save 시그널에서 호출)
+    """
+    fields = fields or timestamp_fields()
+    data = task.data if isinstance(task.data, dict) else {}
+
+    instances = []
+    for field in fields:
+        instances.extend(_build_rows(
+            [(task.id, task.project_id, data.get(field), task.updated_at)],
+            field
+        ))
+    _upsert(instances)
+
+
+def sync_imported_tasks(project_id, task_ids, fields=None):
+    """
+    import(bulk_create)로 생성된 Task의 날짜 필드 정규화 값 저장 (시그널을 거치지 않는 import 경로)
+
+    Returns:
+        int: 동기화된 Task 수
+    """
+    fields = fields or timestamp_fields()
+    synced = 0
+    for start in range(0, len(task_ids), SYNC_BATCH_SIZE):
+        batch_ids = task_ids[start:start + SYNC_BATCH_SIZE]
+        instances = []
+        for field in fields:
+            rows = Task.objects.filter(project_id=project_id, id__in=batch_ids).annotate(
+                _raw_date=KeyTextTransform(field, 'data')
+            ).values_list('id', 'project_id', '_raw_date', 'updated_at')
+            instances.extend(_build_rows(rows, field))
+        with transaction.atomic():
+            _upsert(instances)
+        synced += len(batch_ids)
+    return synced
+
+
+def _stale_tasks(project_id, field, verify=False):
+    """
+    side table 값이 없거나 Task보다 오래된 Task
+
+    - side table 행 없음: 시그널을 거치지 않은 생성 (bulk import, 늦게 commit된 동시 import 포함)
+    - task_updated_at != task.updated_at: 시그널 이후 다시 수정된 Task
+    - verify=True: raw_value와 현재 task.data 값도 비교 (updated_at을 바꾸지 않는 QuerySet.update() 반영)
+    """
+    fresh = ExportTaskTimestamp.objects.filter(
+        task_id=OuterRef('pk'),
+        field_name=field,
+        task_updated_at=OuterRef('updated_at'),
+    )
+    if verify:
+        # 값 없음(NULL)과 빈 문자열은 같은 정규화 결과(value=NULL)이므로 같은 값으로 비교
+        fresh = fresh.alias(_stored_raw=Coalesce('raw_value', Value(''))).filter(
+            _stored_raw=Coalesce(OuterRef('_raw_date'), Value(''))
+        )
+
+    return Task.objects.filter(project_id=project_id).annotate(
+        _raw_date=KeyTextTransform(field, 'data')
+    ).filter(~Exists(fresh))
+
+
+def sync_project_timestamps(project_id, field, rebuild=False, updated_since=None):
+    """
+    프로젝트의 날짜 필드 정규화 값 동기화 (side table 값이 없거나 오래된 Task만)
+
+    동기화 위치를 따로 기록하지 않고 매번 side table과 Task를 비교하므로
+    늦게 commit된 Task도 다음 실행에서 반영되며, batch마다 commit되어 중단되어도 처음부터 다시 하지 않는다.
+    Export 요청에서는 호출하지 않는다. (run_export_worker 주기 실행 / sync_export_timestamps 명령)
+    rebuild=True이면 원본 값도 비교하여 updated_at 없이 수정된 Task(QuerySet.update())까지 반영한다.
+    updated_since가 있으면 그 이후 수정된 Task만 비교한다. ((project_id, updated_at) 인덱스 범위 탐색)
+
+    Returns:
+        int: 동기화된 Task 수
+    """
+    rows = _stale_tasks(project_id, field, verify=rebuild)
+    if updated_since is not None:
+        rows = rows.filter(updated_at__gte=updated_since)
+    rows = rows.order_by('id').values_list('id', 'project_id', '_raw_date', 'updated_at')
+
+    synced = 0
+    last_task_id = 0
+    while True:
+        batch = list(rows.filter(id__gt=last_task_id)[:SYNC_BATCH_SIZE])
+        if not batch:
+            return synced
+        with transaction.atomic():
+            _upsert(_build_rows(batch, field))
+        synced += len(batch)
+        last_task_id = batch[-1][0]
+
+
+@contextlib.contextmanager
+def _sync_lock():
+    """
+    주기 동기화 lock (PostgreSQL session advisory lock, 다른 DB는 항상 획득)
+
+    Yields:
+        bool: lock 획득 여부 - 다른 worker가 실행 중이면 False
+    """
+    if connection.vendor != 'postgresql':
+        yield True
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_try_advisory_lock(%s)', [SYNC_LOCK_KEY])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_unlock(%s)', [SYNC_LOCK_KEY])
+
+
+def sync_all_project_timestamps(fields=None, lookback_seconds=None):
+    """
+    최근 수정된 Task의 정규화 대상 날짜 필드 동기화 (run_export_worker 주기 실행)
+
+    - 범위: 최근 lookback_seconds(CUSTOM_EXPORT_TIMESTAMP_SYNC_LOOKBACK_SECONDS, 기본값 3600초) 안에
+      생성/수정된 Task만 비교 (updated_at 인덱스 범위 탐색, 전체 Task anti-join 없음)
+    - 여러 worker가 동시에 실행해도 advisory lock을 얻은 worker 하나만 동기화
+    - 원본 값은 비교하지 않으므로 updated_at을 바꾸지 않는 QuerySet.update()와
+      lookback보다 오래 전에 수정된 Task는 sync_export_timestamps --rebuild로 반영한다.
+
+    Returns:
+        int: 동기화된 Task 수 (다른 worker가 실행 중이면 0)
+    """
+    fields = fields or timestamp_fields()
+    if lookback_seconds is None:
+        lookback_seconds = getattr(settings, 'CUSTOM_EXPORT_TIMESTAMP_SYNC_LOOKBACK_SECONDS', 3600)
+    updated_since = timezone.now() - datetime.timedelta(seconds=lookback_seconds)
+
+    with _sync_lock() as acquired:
+        if not acquired:
+            return 0
+
+        project_ids = Task.objects.filter(updated_at__gte=updated_since).order_by(
+            'project_id'
+        ).values_list('project_id', flat=True).distinct()
+
+        synced = 0
+        for project_id in project_ids:
+            for field in fields:
+                synced += sync_project_timestamps(project_id, field, updated_since=updated_since)
+        return synced
+
+
+def parse_errors(project_id, field):
+    """
+    날짜로 파싱할 수 없는 Task 목록 (parse_error partial index 사용)
+    """
+    return ExportTaskTimestamp.objects.filter(
+        project_id=project_id,
+        field_name=field,
+        parse_error=True
+    ).order_by('task_id')
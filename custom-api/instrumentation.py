@@ -0,0 +1,206 @@
+"""
+Custom API 요청 계측 (Server-Timing + SQL)
+
+느린 Export / Admin 요청에서 시간이 어디에 쓰였는지(count 쿼리, 본 쿼리, prefetch, 직렬화, 렌더링)
+확인할 수 있도록 요청 단계(phase)별 소요 시간, SQL 쿼리 수, SQL 시간을 기록한다.
+
+- 결과: Server-Timing 응답 헤더 + 구조화 로그 한 줄 (logger: custom_api.timing, JSON)
+- SQL 측정: connection.execute_wrapper (DEBUG / CaptureQueriesContext 없이 쿼리당 시간 측정만 추가)
+- 샘플링: CUSTOM_API_TIMING_SAMPLE_RATE (0~1) 비율의 요청만 계측, 나머지는 phase()가 no-op
+- 스트리밍 응답: 헤더는 본문 전송 전에 보내므로 그 시점까지의 값만 포함되고,
+  로그는 본문 전송이 끝난 뒤 stream 단계를 포함하여 기록
+- 요청 스레드의 DB 연결만 측정 (project_ids 병렬 worker 스레드의 쿼리는 제외)
+
+View는 InstrumentedViewMixin을 상속하고, 코드에서는 with phase('count'): ... 로 단계를 표시한다.
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger('custom_api.timing')
+
+_current = contextvars.ContextVar('custom_api_request_timing', default=None)
+
+_NOOP = contextlib.nullcontext()
+
+
+def sample_rate():
+    return getattr(settings, 'CUSTOM_API_TIMING_SAMPLE_RATE', 1.0)
+
+
+def slow_ms():
+    return getattr(settings, 'CUSTOM_API_TIMING_SLOW_MS', 1000)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+class RequestTiming:
+    """
+    요청 하나의 단계별 wall time / SQL 쿼리 수 / SQL 시간
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        # phase 이름 → [wall, queries, sql] (같은 이름은 누적, 기록 순서 유지)
+        self.phases = {}
+        self.queries = 0
+        self.sql = 0.0
+        self._stack = []
+
+    def _entry(self, name):
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = [0.0, 0, 0.0]
+        return entry
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.sql += elapsed
+            # SQL은 가장 안쪽 phase에만 집계
+            if self._stack:
+                entry = self._entry(self._stack[-1])
+                entry[1] += 1
+                entry[2] += elapsed
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        self._stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._entry(name)[0] += time.perf_counter() - started
+            self._stack.pop()
+
+    def add(self, name, seconds):
+        self._entry(name)[0] += seconds
+
+    @property
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self):
+        """
+        Server-Timing 헤더 값 (phase별 dur + desc에 SQL 수/시간, 전체 sql, total)
+        """
+        metrics = [
+            f'{name};dur={_ms(wall)};desc="sql={queries}/{_ms(sql)}ms"'
+            for name, (wall, queries, sql) in self.phases.items()
+        ]
+        metrics.append(f'sql;dur={_ms(self.sql)};desc="queries={self.queries}"')
+        metrics.append(f'total;dur={_ms(self.total)}')
+        return ', '.join(metrics)
+
+    def as_dict(self, status_code=None):
+        return {
+            'view': self.name,
+            'status': status_code,
+            'total_ms': _ms(self.total),
+            'sql_queries': self.queries,
+            'sql_ms': _ms(self.sql),
+            'phases': {
+                name: {'ms': _ms(wall), 'sql_queries': queries, 'sql_ms': _ms(sql)}
+                for name, (wall, queries, sql) in self.phases.items()
+            },
+        }
+
+    def log(self, status_code=None):
+        record = self.as_dict(status_code)
+        level = logging.WARNING if record['total_ms'] >= slow_ms() else logging.INFO
+        logger.log(level, json.dumps(record, separators=(',', ':')))
+
+    @contextlib.contextmanager
+    def activate(self):
+        token = _current.set(self)
+        try:
+            with connection.execute_wrapper(self.execute_wrapper):
+                yield self
+        finally:
+            _current.reset(token)
+
+
+def current():
+    """
+    현재 요청의 RequestTiming (계측 대상이 아니면 None)
+    """
+    return _current.get()
+
+
+def phase(name):
+    """
+    현재 요청의 단계 측정 (계측 대상이 아니면 no-op)
+
+    사용:
+        with phase('count'):
+            total = queryset.count()
+    """
+    timing = _current.get()
+    if timing is None:
+        return _NOOP
+    return timing.phase(name)
+
+
+def _instrument_stream(timing, content, status_code):
+    """
+    스트리밍 본문 전송 구간을 stream phase로 측정하고 전송이 끝나면 로그 기록
+    """
+    # 본문은 요청 context 밖에서 소비되므로 context 변수 없이 SQL만 stream phase에 집계
+    try:
+        with connection.execute_wrapper(timing.execute_wrapper), timing.phase('stream'):
+            yield from content
+    finally:
+        timing.log(status_code)
+
+
+class InstrumentedViewMixin:
+    """
+    APIView 요청 계측 (CUSTOM_API_TIMING_SAMPLE_RATE 비율)
+
+    dispatch 전체를 계측하고, DRF Response는 렌더링(+ 압축 등 post-render callback)까지
+    render phase로 측정한 뒤 Server-Timing 헤더를 추가한다.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        rate = sample_rate()
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return super().dispatch(request, *args, **kwargs)
+
+        timing = RequestTiming(type(self).__name__)
+        with timing.activate():
+            response = super().dispatch(request, *args, **kwargs)
+
+        if response.streaming:
+            response['Server-Timing'] = timing.server_timing()
+            response.streaming_content = _instrument_stream(timing, response.streaming_content, response.status_code)
+            return response
+
+        if hasattr(response, 'add_post_render_callback') and not response.is_rendered:
+            rendered_from = time.perf_counter()
+
+            def finish(rendered):
+                timing.add('render', time.perf_counter() - rendered_from)
+                rendered['Server-Timing'] = timing.server_timing()
+                timing.log(rendered.status_code)
+                return rendered
+
+            response.add_post_render_callback(finish)
+            return response
+
+        response['Server-Timing'] = timing.server_timing()
+        timing.log(response.status_code)
+        return response
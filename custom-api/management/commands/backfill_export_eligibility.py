@@ -0,0 +1,39 @@
+"""
+Export 대상(eligibility) 비정규화 테이블 채우기 명령
+
+사용 예:
+    python manage.py backfill_export_eligibility --all-projects
+    python manage.py backfill_export_eligibility --project 1 --project 2
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+
+from custom_api.export_eligibility import REFRESH_BATCH_SIZE, backfill_project
+from custom_api.models import TaskExportEligibility
+
+
+class Command(BaseCommand):
+    help = "Task별 Export 대상 여부(검수자 annotation, model_version)를 custom_export_task_eligibility에 계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects', help="프로젝트 ID (여러 번 지정 가능)")
+        parser.add_argument('--all-projects', action='store_true', help="모든 프로젝트 대상")
+        parser.add_argument(
+            '--batch-size', type=int, default=REFRESH_BATCH_SIZE,
+            help=f"한 번에 계산할 Task 수 (기본값: {REFRESH_BATCH_SIZE})"
+        )
+
+    def handle(self, *args, **options):
+        project_ids = options['projects'] or []
+
+        if options['all_projects']:
+            project_ids = list(Project.objects.order_by('id').values_list('id', flat=True))
+        if not project_ids:
+            raise CommandError("--project 또는 --all-projects를 지정해야 합니다.")
+
+        for project_id in project_ids:
+            refreshed = backfill_project(project_id, batch_size=options['batch_size'])
+            eligible = TaskExportEligibility.objects.filter(project_id=project_id, is_eligible=True).count()
+            self.stdout.write(f"project={project_id} refreshed={refreshed} eligible={eligible}")
@@ -0,0 +1,79 @@
+"""
+Custom Export API 벤치마크 명령
+
+count / 첫 페이지 / 마지막 페이지(OFFSET) / 마지막 페이지(cursor) / 전체 / 스트리밍 Export의
+소요 시간, SQL 쿼리 수, 응답 크기, 처리량, 최대 RSS를 측정하여 JSON 리포트로 출력한다.
+릴리스 간 리포트를 비교하여 성능 회귀를 확인한다.
+
+사용 예:
+    python manage.py seed_export_benchmark --tasks 100000
+    python manage.py benchmark_export --project 12 --output export-bench-1.20.0-sso.45.json
+    python manage.py benchmark_export --project 12 --scenario count --scenario deep_page --page-size 500
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+
+from custom_api.export_benchmark import SCENARIOS, run_suite
+
+
+class Command(BaseCommand):
+    help = "Custom Export API 시나리오별 소요 시간 / 쿼리 수 / 처리량 / 최대 RSS 측정 (JSON 리포트)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, required=True, help="프로젝트 ID (seed_export_benchmark로 생성)")
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios', choices=SCENARIOS,
+            help=f"실행할 시나리오 (여러 번 지정 가능, 기본값: 전체 {', '.join(SCENARIOS)})"
+        )
+        parser.add_argument('--page-size', type=int, default=1000, help="페이지 크기 (기본값: 1000)")
+        parser.add_argument('--repeat', type=int, default=3, help="시나리오별 반복 횟수 (기본값: 3)")
+        parser.add_argument('--accept-encoding', help="요청 Accept-Encoding (예: gzip, 기본값: 압축 없음)")
+        parser.add_argument('--params', help="모든 요청에 추가할 Export 파라미터 JSON (예: '{\"model_version\": \"bench-v1\"}')")
+        parser.add_argument('--user', help="요청 사용자 이메일 (기본값: 첫 번째 Super User)")
+        parser.add_argument('--output', help="리포트 파일 경로 (기본값: 표준 출력)")
+
+    def handle(self, *args, **options):
+        if not Project.objects.filter(id=options['project']).exists():
+            raise CommandError(f"project={options['project']}가 없습니다.")
+
+        User = get_user_model()
+        users = User.objects.filter(email=options['user']) if options['user'] \
+            else User.objects.filter(is_superuser=True).order_by('id')
+        user = users.first()
+        if user is None:
+            raise CommandError("요청 사용자를 찾을 수 없습니다. (--user 또는 Super User 필요)")
+
+        try:
+            extra_params = json.loads(options['params']) if options['params'] else {}
+        except ValueError as e:
+            raise CommandError(f"--params가 올바른 JSON이 아닙니다: {e}")
+
+        report = run_suite(
+            options['project'],
+            user,
+            scenarios=options['scenarios'] or SCENARIOS,
+            page_size=options['page_size'],
+            repeat=options['repeat'],
+            accept_encoding=options['accept_encoding'],
+            extra_params=extra_params,
+        )
+
+        for name, result in report['scenarios'].items():
+            self.stderr.write(
+                f"{name:<10} best={result['seconds_min'] * 1000:.1f}ms queries={result['queries']} "
+                f"bytes={result['response_bytes']} tasks/s={result['tasks_per_second']} "
+                f"peak_rss={result['peak_rss_mb']}MB"
+            )
+
+        output = json.dumps(report, indent=2, ensure_ascii=False, default=str)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+            self.stderr.write(f"report → {options['output']}")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,65 @@
+"""
+Export 직렬화 벤치마크 (Label Studio Serializer 경로 vs export_encoder fast path)
+
+프로젝트의 Export 대상 Task를 두 경로로 직렬화 + JSON 렌더링하여
+Task 10,000건당 소요 시간과 속도 향상 배율을 출력한다.
+
+사용 예:
+    python manage.py benchmark_export_serializer --project 1
+    python manage.py benchmark_export_serializer --project 1 --tasks 10000 --repeat 5
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from custom_api import export_encoder
+from custom_api.export import CustomExportAPI
+
+PER_TASKS = 10000
+
+
+class Command(BaseCommand):
+    help = "Export 직렬화 경로별(Label Studio Serializer / fast path) Task 10,000건당 소요 시간 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, required=True, help="프로젝트 ID")
+        parser.add_argument('--tasks', type=int, default=PER_TASKS, help=f"직렬화할 Task 수 (기본값: {PER_TASKS})")
+        parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (최솟값 사용, 기본값: 3)")
+
+    def handle(self, *args, **options):
+        if export_encoder.orjson is None:
+            self.stderr.write("orjson이 설치되어 있지 않아 fast path도 DRF 렌더러를 사용합니다.")
+
+        view = CustomExportAPI()
+        queryset = view._queryset_for({'project_id': options['project']})
+        limit = options['tasks']
+
+        count = queryset[:limit].count()
+        if not count:
+            raise CommandError(f"project={options['project']}에 Export 대상 Task가 없습니다.")
+
+        def serializer_path():
+            tasks = view._serialize_tasks_with_serializers(queryset[:limit])
+            return JSONRenderer().render({'tasks': tasks})
+
+        def fast_path():
+            tasks = export_encoder.encode_tasks(export_encoder.task_rows(queryset)[:limit])
+            return export_encoder.dumps({'tasks': tasks})
+
+        results = {}
+        for name, run in (('serializer', serializer_path), ('fast', fast_path)):
+            timings = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                size = len(run())
+                timings.append(time.perf_counter() - started)
+            results[name] = min(timings)
+            per_10k = results[name] * PER_TASKS / count
+            self.stdout.write(
+                f"{name:<10} tasks={count} bytes={size} "
+                f"best={results[name] * 1000:.1f}ms per_10k_tasks={per_10k * 1000:.1f}ms"
+            )
+
+        self.stdout.write(f"speedup={results['serializer'] / results['fast']:.2f}x")
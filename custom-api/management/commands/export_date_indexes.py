@@ -0,0 +1,70 @@
+"""
+Export 날짜 필드 Expression Index 관리 명령
+
+사용 예:
+    python manage.py export_date_indexes list
+    python manage.py export_date_indexes create --project 1
+    python manage.py export_date_indexes create --all-projects --field source_created_at --field mesure_at
+    python manage.py export_date_indexes drop --project 1 --field mesure_at
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+
+from custom_api.export_indexes import (
+    ExportIndexError,
+    configured_date_fields,
+    create_date_index,
+    drop_date_index,
+    list_date_indexes,
+)
+
+
+class Command(BaseCommand):
+    help = "Custom Export API 날짜 필터용 프로젝트별 expression index 생성/삭제/조회 (CONCURRENTLY)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['list', 'create', 'drop'])
+        parser.add_argument('--project', type=int, action='append', dest='projects', help="프로젝트 ID (여러 번 지정 가능)")
+        parser.add_argument('--all-projects', action='store_true', help="모든 프로젝트 대상")
+        parser.add_argument(
+            '--field', action='append', dest='fields',
+            help="task.data 날짜 필드명 (여러 번 지정 가능, 기본값: CUSTOM_EXPORT_DATE_FIELDS 중 정규화 대상이 아닌 필드)"
+        )
+
+    def handle(self, *args, **options):
+        action = options['action']
+        project_ids = options['projects'] or []
+        fields = options['fields'] or configured_date_fields()
+
+        try:
+            if action == 'list':
+                for index in list_date_indexes():
+                    if project_ids and index['project_id'] not in project_ids:
+                        continue
+                    self.stdout.write(
+                        f"{index['name']}  project={index['project_id']}  field={index['field']}  "
+                        f"valid={index['valid']}  size={index['size_bytes']}"
+                    )
+                return
+
+            if options['all_projects']:
+                project_ids = list(Project.objects.order_by('id').values_list('id', flat=True))
+            if not project_ids:
+                raise CommandError("--project 또는 --all-projects를 지정해야 합니다.")
+            if not fields:
+                self.stdout.write("대상 필드 없음 (CUSTOM_EXPORT_DATE_FIELDS가 모두 CUSTOM_EXPORT_TIMESTAMP_FIELDS로 정규화됨)")
+                return
+
+            for project_id in project_ids:
+                for field in fields:
+                    if action == 'create':
+                        result = create_date_index(project_id, field)
+                        state = 'created' if result['created'] else 'exists'
+                    else:
+                        result = drop_date_index(project_id, field)
+                        state = 'dropped' if result['dropped'] else 'missing'
+                    self.stdout.write(f"[{state}] {result['name']} (project={project_id}, field={field})")
+        except ExportIndexError as e:
+            raise CommandError(str(e))
@@ -0,0 +1,68 @@
+"""
+비동기 Export 작업 worker
+
+각 Pod에서 실행하면 작업 테이블을 SELECT ... FOR UPDATE SKIP LOCKED로 나눠 가져간다.
+
+사용 예:
+    python manage.py run_export_worker
+    python manage.py run_export_worker --once
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from custom_api.export_artifacts import cleanup_expired_artifacts
+from custom_api.export_timestamps import sync_all_project_timestamps
+from custom_api.export_jobs import (
+    claim_next_job,
+    cleanup_expired_jobs,
+    fail_abandoned_jobs,
+    run_job,
+    worker_name,
+)
+
+CLEANUP_INTERVAL_SECONDS = 600
+
+
+class Command(BaseCommand):
+    help = "Custom Export API 비동기 작업(mode=async) 실행 worker"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="대기 중인 작업을 모두 처리한 뒤 종료")
+        parser.add_argument('--poll-interval', type=float, default=5.0, help="작업이 없을 때 대기 시간(초, 기본값: 5)")
+
+    def handle(self, *args, **options):
+        worker = worker_name()
+        last_cleanup = None
+        self.stdout.write(f"[Export Worker] Started: {worker}")
+
+        while True:
+            close_old_connections()
+
+            if last_cleanup is None or time.monotonic() - last_cleanup >= CLEANUP_INTERVAL_SECONDS:
+                fail_abandoned_jobs()
+                deleted = cleanup_expired_jobs()
+                if deleted:
+                    self.stdout.write(f"[Export Worker] Removed {deleted} expired job(s)")
+                deleted = cleanup_expired_artifacts()
+                if deleted:
+                    self.stdout.write(f"[Export Worker] Removed {deleted} expired artifact(s)")
+                # 시그널/import 후처리를 거치지 않은 최근 Task의 날짜 필드 정규화 값 동기화 (advisory lock으로 한 worker만)
+                synced = sync_all_project_timestamps()
+                if synced:
+                    self.stdout.write(f"[Export Worker] Synced export timestamps for {synced} task(s)")
+                last_cleanup = time.monotonic()
+
+            job = claim_next_job(worker)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f"[Export Worker] Running job={job.id} project={job.project_id}")
+            run_job(job)
+
+        self.stdout.write(f"[Export Worker] Stopped: {worker}")
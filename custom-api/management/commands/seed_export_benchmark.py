@@ -0,0 +1,63 @@
+"""
+Export 벤치마크용 합성 프로젝트 생성 명령
+
+사용 예:
+    python manage.py seed_export_benchmark --tasks 10000
+    python manage.py seed_export_benchmark --tasks 1000000 --annotations-per-task 2 --predictions-per-task 3 \
+        --reviewer-ratio 0.5 --payload-bytes 4096 --seed 1
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from custom_api.export_benchmark import SEED_BATCH_SIZE, seed_project
+
+
+class Command(BaseCommand):
+    help = "Export 벤치마크용 합성 프로젝트 생성 (Task / annotation / prediction 수, 검수자 비율, payload 크기)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, required=True, help="Task 수 (예: 10000 ~ 1000000)")
+        parser.add_argument('--annotations-per-task', type=int, default=1, help="Task당 annotation 수 (기본값: 1)")
+        parser.add_argument('--predictions-per-task', type=int, default=1, help="Task당 prediction 수 (기본값: 1)")
+        parser.add_argument('--reviewers', type=int, default=3, help="검수자(Super User) 수 (기본값: 3)")
+        parser.add_argument('--annotators', type=int, default=5, help="일반 annotator 수 (기본값: 5)")
+        parser.add_argument(
+            '--reviewer-ratio', type=float, default=0.8,
+            help="검수자가 작성하는 annotation 비율 (0~1, 기본값: 0.8)"
+        )
+        parser.add_argument('--payload-bytes', type=int, default=512, help="task.data['text'] 크기 (기본값: 512)")
+        parser.add_argument('--model-versions', type=int, default=3, help="model_version 종류 수 (기본값: 3)")
+        parser.add_argument('--days', type=int, default=365, help="source_created_at 분포 기간 (기본값: 365)")
+        parser.add_argument('--seed', type=int, default=0, help="난수 seed (기본값: 0)")
+        parser.add_argument(
+            '--batch-size', type=int, default=SEED_BATCH_SIZE,
+            help=f"bulk_create 단위 (기본값: {SEED_BATCH_SIZE})"
+        )
+
+    def handle(self, *args, **options):
+        if options['tasks'] < 1:
+            raise CommandError("--tasks는 1 이상이어야 합니다.")
+        if not 0 <= options['reviewer_ratio'] <= 1:
+            raise CommandError("--reviewer-ratio는 0~1 사이여야 합니다.")
+
+        report_every = max(options['tasks'] // 10, options['batch_size'])
+
+        def progress(created):
+            if created % report_every < options['batch_size'] or created == options['tasks']:
+                self.stdout.write(f"  {created}/{options['tasks']} tasks")
+
+        project = seed_project(
+            tasks=options['tasks'],
+            annotations_per_task=options['annotations_per_task'],
+            predictions_per_task=options['predictions_per_task'],
+            reviewers=options['reviewers'],
+            annotators=options['annotators'],
+            reviewer_ratio=options['reviewer_ratio'],
+            payload_bytes=options['payload_bytes'],
+            model_versions=options['model_versions'],
+            days=options['days'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(f"project={project.id} title={project.title!r}"))
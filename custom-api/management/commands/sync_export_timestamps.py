@@ -0,0 +1,54 @@
+"""
+Export 날짜 필드 정규화 값 동기화 명령
+
+기존 Task는 마이그레이션 0007_backfill_export_timestamps가 채우고, import된 Task는 import 직후 저장된다.
+필드를 추가했거나 시그널/import 후처리를 거치지 않고 Task를 만든 경우 이 명령으로 동기화한다.
+
+사용 예:
+    python manage.py sync_export_timestamps --all-projects
+    python manage.py sync_export_timestamps --project 1 --rebuild
+    python manage.py sync_export_timestamps --project 1 --report
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.models import Project
+
+from custom_api.export_timestamps import parse_errors, sync_project_timestamps, timestamp_fields
+
+
+class Command(BaseCommand):
+    help = "task.data 날짜 필드를 timestamptz로 정규화하여 Export side table에 동기화"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects', help="프로젝트 ID (여러 번 지정 가능)")
+        parser.add_argument('--all-projects', action='store_true', help="모든 프로젝트 대상")
+        parser.add_argument(
+            '--field', action='append', dest='fields',
+            help="task.data 날짜 필드명 (여러 번 지정 가능, 기본값: CUSTOM_EXPORT_TIMESTAMP_FIELDS)"
+        )
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help="원본 값도 비교하여 updated_at 없이 수정된 Task(QuerySet.update())까지 재동기화"
+        )
+        parser.add_argument('--report', action='store_true', help="날짜로 파싱할 수 없는 Task 목록 출력")
+
+    def handle(self, *args, **options):
+        project_ids = options['projects'] or []
+        fields = options['fields'] or timestamp_fields()
+
+        if options['all_projects']:
+            project_ids = list(Project.objects.order_by('id').values_list('id', flat=True))
+        if not project_ids:
+            raise CommandError("--project 또는 --all-projects를 지정해야 합니다.")
+
+        for project_id in project_ids:
+            for field in fields:
+                if options['report']:
+                    for row in parse_errors(project_id, field):
+                        self.stdout.write(f"project={project_id} task={row.task_id} field={field} value={row.raw_value!r}")
+                    continue
+
+                synced = sync_project_timestamps(project_id, field, rebuild=options['rebuild'])
+                errors = parse_errors(project_id, field).count()
+                self.stdout.write(f"project={project_id} field={field} synced={synced} parse_errors={errors}")
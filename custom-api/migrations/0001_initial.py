@@ -0,0 +1,47 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tasks', '__first__'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportTaskTimestamp',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.IntegerField(help_text='Task의 프로젝트 ID (비정규화)')),
+                ('field_name', models.CharField(help_text='task.data 내의 날짜 필드명', max_length=64)),
+                ('raw_value', models.TextField(blank=True, help_text='task.data의 원본 값', null=True)),
+                ('value', models.DateTimeField(blank=True, help_text='UTC로 정규화된 값 (파싱 실패/값 없음이면 NULL)', null=True)),
+                ('parse_error', models.BooleanField(default=False, help_text='원본 값이 있지만 날짜로 파싱할 수 없는 경우 True')),
+                ('task_updated_at', models.DateTimeField(blank=True, help_text='동기화 시점의 task.updated_at', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('task', models.ForeignKey(help_text='대상 Task', on_delete=django.db.models.deletion.CASCADE, related_name='export_timestamps', to='tasks.task')),
+            ],
+            options={
+                'db_table': 'custom_export_task_timestamp',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='exporttasktimestamp',
+            constraint=models.UniqueConstraint(fields=('task', 'field_name'), name='cexp_ts_task_field_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='exporttasktimestamp',
+            index=models.Index(fields=['project_id', 'field_name', 'value'], name='cexp_ts_proj_field_value'),
+        ),
+        migrations.AddIndex(
+            model_name='exporttasktimestamp',
+            index=models.Index(fields=['project_id', 'field_name', 'task'], name='cexp_ts_proj_field_task'),
+        ),
+        migrations.AddIndex(
+            model_name='exporttasktimestamp',
+            index=models.Index(condition=models.Q(('parse_error', True)), fields=['project_id', 'field_name'], name='cexp_ts_parse_error'),
+        ),
+    ]
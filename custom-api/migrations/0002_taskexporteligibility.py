@@ -0,0 +1,32 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '__first__'),
+        ('custom_api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskExportEligibility',
+            fields=[
+                ('task', models.OneToOneField(help_text='대상 Task', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='export_eligibility', serialize=False, to='tasks.task')),
+                ('project_id', models.IntegerField(help_text='Task의 프로젝트 ID (비정규화)')),
+                ('is_eligible', models.BooleanField(default=False, help_text='검수자의 유효한 annotation 존재 여부')),
+                ('latest_reviewer_id', models.IntegerField(blank=True, help_text='가장 최근 유효 annotation의 검수자 ID', null=True)),
+                ('latest_reviewed_at', models.DateTimeField(blank=True, help_text='가장 최근 유효 annotation 생성 시각', null=True)),
+                ('model_versions', models.JSONField(default=list, help_text='Task에 달린 prediction의 model_version 목록')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'custom_export_task_eligibility',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='taskexporteligibility',
+            index=models.Index(condition=models.Q(('is_eligible', True)), fields=['project_id'], name='cexp_elig_proj_eligible'),
+        ),
+    ]
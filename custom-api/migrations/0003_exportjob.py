@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('custom_api', '0002_taskexporteligibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('project_id', models.IntegerField(help_text='Export 대상 프로젝트 ID')),
+                ('params', models.JSONField(default=dict, help_text='Export 요청 파라미터 (worker에서 다시 검증)')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('total_tasks', models.IntegerField(blank=True, help_text='Export 대상 Task 수', null=True)),
+                ('processed_tasks', models.IntegerField(default=0, help_text='기록된 Task 수')),
+                ('attempts', models.IntegerField(default=0, help_text='실행 시도 횟수')),
+                ('worker', models.CharField(blank=True, default='', help_text='실행 중인 worker (host:pid)', max_length=255)),
+                ('file_path', models.CharField(blank=True, default='', help_text='결과 파일 경로', max_length=1024)),
+                ('file_size', models.BigIntegerField(blank=True, null=True)),
+                ('content_type', models.CharField(blank=True, default='', max_length=128)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, help_text='worker 마지막 진행 보고 시각', null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(help_text='작업 요청자', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='custom_export_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'custom_export_job',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='exportjob',
+            index=models.Index(fields=['status', 'created_at'], name='cexp_job_status_created'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# 증분(delta) Export 후보 Task 조회용 (project_id, updated_at) 인덱스 (custom_api.export_delta)
+DELTA_INDEXES = [
+    ('tasks', 'Task', 'cexp_delta_task_updated'),
+    ('tasks', 'Annotation', 'cexp_delta_annotation_updated'),
+    ('tasks', 'Prediction', 'cexp_delta_prediction_updated'),
+]
+
+
+def _has_updated_at(schema_editor, table):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            return False
+        columns = connection.introspection.get_table_description(cursor, table)
+    return any(column.name == 'updated_at' for column in columns)
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for app_label, model_name, index_name in DELTA_INDEXES:
+        table = apps.get_model(app_label, model_name)._meta.db_table
+        # tasks 마이그레이션 의존성으로 보장되는 컬럼이므로 없으면 인덱스 없이 넘어가지 않고 중단
+        if not _has_updated_at(schema_editor, table):
+            raise RuntimeError(f'"{table}".updated_at does not exist; cannot create "{index_name}"')
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index_name}" ON "{table}" (project_id, updated_at)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, _, index_name in DELTA_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+    atomic = False
+
+    dependencies = [
+        # Prediction.project 추가 (Task/Annotation/Prediction 모두 project_id, updated_at 보유)
+        ('tasks', '0041_prediction_project'),
+        ('custom_api', '0003_exportjob'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('custom_api', '0004_delta_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('project_id', models.IntegerField(help_text='Export 대상 프로젝트 ID')),
+                ('params', models.JSONField(default=dict, help_text='snapshot 생성 시 필터 파라미터')),
+                ('total', models.IntegerField(default=0, help_text='고정된 Task 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(help_text='만료 시각 (CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS)')),
+                ('created_by', models.ForeignKey(help_text='snapshot 생성자 (생성자만 조회 가능)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='custom_export_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'custom_export_snapshot',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='exportsnapshot',
+            index=models.Index(fields=['expires_at'], name='cexp_snap_expires'),
+        ),
+        migrations.CreateModel(
+            name='ExportSnapshotTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.IntegerField(help_text='Export 순서 (1부터)')),
+                ('task_id', models.IntegerField(help_text='Task ID (Task가 삭제되어도 snapshot 행은 유지)')),
+                ('snapshot', models.ForeignKey(help_text='소속 snapshot', on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='custom_api.exportsnapshot')),
+            ],
+            options={
+                'db_table': 'custom_export_snapshot_task',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='exportsnapshottask',
+            constraint=models.UniqueConstraint(fields=('snapshot', 'position'), name='cexp_snap_task_position_uniq'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# 결정적 샘플링(sample_size) 해시 ring 순서 / 해시 샤딩(shard_index) 구간 조회용
+# (project_id, md5(id)) expression index (custom_api.export_sampling, custom_api.export_shards)
+SAMPLE_HASH_INDEX = 'cexp_sample_task_hash'
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('tasks', 'Task')._meta.db_table
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{SAMPLE_HASH_INDEX}" ON "{table}" (project_id, md5((id)::text))'
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{SAMPLE_HASH_INDEX}"')
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0041_prediction_project'),
+        ('custom_api', '0005_exportsnapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations
+from django.db.models.fields.json import KeyTextTransform
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill(apps, schema_editor):
+    """
+    기존 Task의 날짜 필드 정규화 값 채우기 (CUSTOM_EXPORT_TIMESTAMP_FIELDS)
+
+    batch마다 commit되며(atomic=False) 이미 있는 행은 건너뛰므로 중단 후 다시 실행해도 이어서 채운다.
+    """
+    from custom_api.export_timestamps import parse_date_value, timestamp_fields
+
+    Task = apps.get_model('tasks', 'Task')
+    ExportTaskTimestamp = apps.get_model('custom_api', 'ExportTaskTimestamp')
+    fields = timestamp_fields()
+    if not fields:
+        return
+
+    aliases = {f'_raw_{index}': field for index, field in enumerate(fields)}
+    tasks = Task.objects.order_by('id').annotate(
+        **{alias: KeyTextTransform(field, 'data') for alias, field in aliases.items()}
+    ).values_list('id', 'project_id', 'updated_at', *aliases)
+
+    last_task_id = 0
+    while True:
+        batch = list(tasks.filter(id__gt=last_task_id)[:BACKFILL_BATCH_SIZE])
+        if not batch:
+            return
+        rows = []
+        for task_id, project_id, updated_at, *raw_values in batch:
+            for field, raw in zip(aliases.values(), raw_values):
+                value, parse_error = parse_date_value(raw)
+                rows.append(ExportTaskTimestamp(
+                    task_id=task_id,
+                    project_id=project_id,
+                    field_name=field,
+                    raw_value=raw,
+                    value=value,
+                    parse_error=parse_error,
+                    task_updated_at=updated_at,
+                ))
+        ExportTaskTimestamp.objects.bulk_create(rows, ignore_conflicts=True)
+        last_task_id = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    # batch 단위 commit (대형 Task 테이블에서 긴 트랜잭션 방지)
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0041_prediction_project'),
+        ('custom_api', '0006_sample_hash_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
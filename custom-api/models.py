@@ -0,0 +1,201 @@
+"""
+Custom API Models
+
+Custom Export API 성능 최적화를 위한 보조 테이블
+"""
+
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+
+class ExportTaskTimestamp(models.Model):
+    """
+    Task 날짜 필드의 정규화된 timestamp 값 (Export 날짜 필터용 side table)
+
+    task.data 내의 날짜 문자열(CUSTOM_EXPORT_DATE_FIELDS)을 timestamptz로 파싱하여 저장한다.
+    Export 날짜 필터는 JSON 문자열 비교 대신 (project_id, field_name, value) 인덱스 범위 탐색을 사용한다.
+    """
+
+    task = models.ForeignKey(
+        'tasks.Task',
+        on_delete=models.CASCADE,
+        related_name='export_timestamps',
+        help_text="대상 Task"
+    )
+    project_id = models.IntegerField(help_text="Task의 프로젝트 ID (비정규화)")
+    field_name = models.CharField(max_length=64, help_text="task.data 내의 날짜 필드명")
+    raw_value = models.TextField(null=True, blank=True, help_text="task.data의 원본 값")
+    value = models.DateTimeField(null=True, blank=True, help_text="UTC로 정규화된 값 (파싱 실패/값 없음이면 NULL)")
+    parse_error = models.BooleanField(default=False, help_text="원본 값이 있지만 날짜로 파싱할 수 없는 경우 True")
+    task_updated_at = models.DateTimeField(null=True, blank=True, help_text="동기화 시점의 task.updated_at")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'custom_export_task_timestamp'
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'field_name'], name='cexp_ts_task_field_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['project_id', 'field_name', 'value'], name='cexp_ts_proj_field_value'),
+            models.Index(fields=['project_id', 'field_name', 'task'], name='cexp_ts_proj_field_task'),
+            models.Index(
+                fields=['project_id', 'field_name'],
+                condition=Q(parse_error=True),
+                name='cexp_ts_parse_error'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id} {self.field_name}={self.value}"
+
+
+class TaskExportEligibility(models.Model):
+    """
+    Task별 Export 대상 여부 (비정규화 테이블)
+
+    "검수자(Super User)의 유효한 annotation이 있는 Task" 판정을 Export 요청마다
+    annotation ↔ user JOIN으로 다시 계산하지 않도록 미리 계산해 둔다.
+    Annotation / Prediction 시그널과 Superuser 승격/해제 API가 갱신하며,
+    기존 데이터는 backfill_export_eligibility 명령으로 채운다.
+    """
+
+    task = models.OneToOneField(
+        'tasks.Task',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='export_eligibility',
+        help_text="대상 Task"
+    )
+    project_id = models.IntegerField(help_text="Task의 프로젝트 ID (비정규화)")
+    is_eligible = models.BooleanField(default=False, help_text="검수자의 유효한 annotation 존재 여부")
+    latest_reviewer_id = models.IntegerField(null=True, blank=True, help_text="가장 최근 유효 annotation의 검수자 ID")
+    latest_reviewed_at = models.DateTimeField(null=True, blank=True, help_text="가장 최근 유효 annotation 생성 시각")
+    model_versions = models.JSONField(default=list, help_text="Task에 달린 prediction의 model_version 목록")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'custom_export_task_eligibility'
+        indexes = [
+            models.Index(
+                fields=['project_id'],
+                condition=Q(is_eligible=True),
+                name='cexp_elig_proj_eligible'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id} eligible={self.is_eligible}"
+
+
+class ExportJob(models.Model):
+    """
+    비동기 Export 작업 (mode="async")
+
+    요청은 즉시 job ID를 반환하고, run_export_worker 프로세스가
+    SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가 결과 파일을 데이터 볼륨에 기록한다.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project_id = models.IntegerField(help_text="Export 대상 프로젝트 ID")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='custom_export_jobs',
+        help_text="작업 요청자"
+    )
+    params = models.JSONField(default=dict, help_text="Export 요청 파라미터 (worker에서 다시 검증)")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    total_tasks = models.IntegerField(null=True, blank=True, help_text="Export 대상 Task 수")
+    processed_tasks = models.IntegerField(default=0, help_text="기록된 Task 수")
+    attempts = models.IntegerField(default=0, help_text="실행 시도 횟수")
+    worker = models.CharField(max_length=255, blank=True, default='', help_text="실행 중인 worker (host:pid)")
+    file_path = models.CharField(max_length=1024, blank=True, default='', help_text="결과 파일 경로")
+    file_size = models.BigIntegerField(null=True, blank=True)
+    content_type = models.CharField(max_length=128, blank=True, default='')
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, help_text="worker 마지막 진행 보고 시각")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'custom_export_job'
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='cexp_job_status_created'),
+        ]
+
+    def __str__(self):
+        return f"ExportJob {self.id} ({self.status})"
+
+
+class ExportSnapshot(models.Model):
+    """
+    snapshot 페이징(snapshot=true)의 고정된 Export 대상 Task 목록
+
+    첫 페이지 요청 시점의 필터 결과 Task ID를 (-created_at, -id) 순서의 position과 함께
+    ExportSnapshotTask에 기록한다. 이후 페이지는 필터 쿼리를 다시 실행하지 않고
+    (snapshot, position) 범위 탐색으로 Task ID를 가져오므로 작업 중 Task가 추가/변경되어도
+    페이지 사이에 중복이나 누락이 생기지 않는다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project_id = models.IntegerField(help_text="Export 대상 프로젝트 ID")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='custom_export_snapshots',
+        help_text="snapshot 생성자 (생성자만 조회 가능)"
+    )
+    params = models.JSONField(default=dict, help_text="snapshot 생성 시 필터 파라미터")
+    total = models.IntegerField(default=0, help_text="고정된 Task 수")
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(help_text="만료 시각 (CUSTOM_EXPORT_SNAPSHOT_TTL_SECONDS)")
+
+    class Meta:
+        db_table = 'custom_export_snapshot'
+        indexes = [
+            models.Index(fields=['expires_at'], name='cexp_snap_expires'),
+        ]
+
+    def __str__(self):
+        return f"ExportSnapshot {self.id} (project={self.project_id}, total={self.total})"
+
+
+class ExportSnapshotTask(models.Model):
+    """
+    ExportSnapshot에 고정된 Task ID (position: 1부터 시작하는 Export 순서)
+    """
+
+    snapshot = models.ForeignKey(
+        ExportSnapshot,
+        on_delete=models.CASCADE,
+        related_name='tasks',
+        help_text="소속 snapshot"
+    )
+    position = models.IntegerField(help_text="Export 순서 (1부터)")
+    task_id = models.IntegerField(help_text="Task ID (Task가 삭제되어도 snapshot 행은 유지)")
+
+    class Meta:
+        db_table = 'custom_export_snapshot_task'
+        constraints = [
+            models.UniqueConstraint(fields=['snapshot', 'position'], name='cexp_snap_task_position_uniq'),
+        ]
+
+    def __str__(self):
+        return f"Snapshot {self.snapshot_id} #{self.position} → Task {self.task_id}"
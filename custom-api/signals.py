@@ -3,12 +3,21 @@ Custom Signals for Label Studio
 
 자동화 기능:
 - OrganizationMember 생성 시 active_organization 자동 설정
+- Task 저장 시 Export 날짜 필드 정규화 값 갱신
+- Task / Annotation / Prediction 저장·삭제 시 Export 결과 캐시 무효화
+- Annotation / Prediction 저장·삭제 시 Export 대상(eligibility) 재계산
 """
 
 import logging
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from organizations.models import OrganizationMember
+from tasks.models import Annotation, Prediction, Task
+
+from custom_api.export_cache import bump_project_generation
+from custom_api.export_eligibility import refresh_tasks, use_eligibility_table
+from custom_api.export_timestamps import sync_task_timestamps, timestamp_fields
 
 logger = logging.getLogger(__name__)
 
@@ -45,3 +54,82 @@ def set_active_organization_on_membership(sender, instance, created, **kwargs):
                 f"[Signal] Set active_organization for {user.email} "
                 f"→ {organization.title}"
             )
+
+
+@receiver(post_save, sender=Task)
+def sync_export_timestamps_on_task_save(sender, instance, raw=False, **kwargs):
+    """
+    Task 생성/수정 시 Export 날짜 필드(CUSTOM_EXPORT_TIMESTAMP_FIELDS) 정규화 값 갱신
+
+    import(bulk_create)된 Task는 task_import.ExportTaskSerializerBulk가 import 직후 반영하고,
+    그 밖에 시그널을 거치지 않은 Task는 run_export_worker 주기 동기화 또는 sync_export_timestamps 명령이 반영한다.
+
+    Args:
+        sender: Task 모델 클래스
+        instance: 생성/업데이트된 Task 인스턴스
+        raw: fixture 로딩 여부 (True이면 건너뜀)
+        **kwargs: 추가 인자
+    """
+    if raw:
+        return
+
+    fields = timestamp_fields()
+    if fields:
+        sync_task_timestamps(instance, fields)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=Annotation)
+@receiver(post_delete, sender=Annotation)
+@receiver(post_save, sender=Prediction)
+@receiver(post_delete, sender=Prediction)
+def invalidate_export_cache(sender, instance, **kwargs):
+    """
+    Task / Annotation / Prediction 변경 시 해당 프로젝트의 Export 결과 캐시 무효화
+
+    프로젝트 generation을 증가시켜 이전 generation으로 만든 캐시 키가 더 이상 조회되지 않게 한다.
+
+    Args:
+        sender: 변경된 모델 클래스
+        instance: 저장/삭제된 인스턴스
+        **kwargs: 추가 인자
+    """
+    project_id = getattr(instance, 'project_id', None)
+    if project_id is None and getattr(instance, 'task_id', None):
+        project_id = Task.objects.filter(id=instance.task_id).values_list('project_id', flat=True).first()
+    bump_project_generation(project_id)
+
+
+@receiver(post_save, sender=Annotation)
+@receiver(post_delete, sender=Annotation)
+@receiver(post_save, sender=Prediction)
+@receiver(post_delete, sender=Prediction)
+def refresh_export_eligibility(sender, instance, raw=False, **kwargs):
+    """
+    Annotation / Prediction 변경 시 Task의 Export 대상 여부(TaskExportEligibility) 재계산
+
+    CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE이 꺼져 있으면 테이블을 읽지 않으므로 갱신하지 않는다.
+    (전환 후 backfill_export_eligibility로 그 사이 변경을 반영)
+
+    트랜잭션 commit 후 실행한다. Task 삭제 cascade 도중 annotation post_delete에서
+    바로 재계산하면 삭제 중인 Task의 eligibility 행을 다시 만들게 되기 때문이다.
+
+    Args:
+        sender: Annotation 또는 Prediction 모델 클래스
+        instance: 저장/삭제된 인스턴스
+        raw: fixture 로딩 여부 (True이면 건너뜀)
+        **kwargs: 추가 인자
+    """
+    if raw or not instance.task_id or not use_eligibility_table():
+        return
+
+    task_id = instance.task_id
+    project_id = getattr(instance, 'project_id', None)
+
+    def refresh():
+        refresh_tasks([task_id])
+        # commit ~ 재계산 사이에 캐시된 응답 무효화
+        bump_project_generation(project_id)
+
+    transaction.on_commit(refresh)
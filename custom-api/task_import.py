@@ -0,0 +1,33 @@
+"""
+Label Studio task import 후처리 (settings.TASK_SERIALIZER_BULK)
+
+import는 Task.objects.bulk_create()로 Task를 만들어 post_save 시그널이 발생하지 않는다.
+Label Studio가 import 직후 호출하는 post_process_tasks() 확장 지점에서
+Export 날짜 필드 정규화 값(custom_export_task_timestamp)을 바로 저장한다.
+"""
+
+import logging
+
+from django.db import transaction
+
+from tasks.serializers import BaseTaskSerializerBulk
+
+logger = logging.getLogger(__name__)
+
+
+class ExportTaskSerializerBulk(BaseTaskSerializerBulk):
+    """Label Studio 기본 bulk import Serializer + Export side table 갱신"""
+
+    @staticmethod
+    def post_process_tasks(project_id, task_ids):
+        # tasks.serializers 로딩 중 import되므로 지연 import
+        from .export_timestamps import sync_imported_tasks
+
+        def sync():
+            try:
+                sync_imported_tasks(project_id, list(task_ids))
+            except Exception:
+                # 동기화 실패는 import를 막지 않음 (run_export_worker / sync_export_timestamps가 다시 반영)
+                logger.exception(f"[Export Timestamp] Import sync failed: project={project_id}")
+
+        transaction.on_commit(sync)
@@ -6,19 +6,48 @@ Label Studio 1.20.0 기반 커스텀 API 테스트
 - Custom SSO Token Validation API
 """
 
-from django.test import TestCase
+from django.db import connection, connections
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 from rest_framework import status
 from projects.models import Project
 from tasks.models import Task, Annotation, Prediction
 from organizations.models import Organization
+import gzip
+import hashlib
 import json
-from datetime import datetime
+import os
+import tempfile
+from datetime import datetime, timedelta
+from io import BytesIO, StringIO
 import pytz
+from unittest import skipUnless
 from unittest.mock import patch
 
+from custom_api import export_cache, export_compression, export_encoder
+from custom_api.export import CustomExportAPI
+from custom_api.export_benchmark import SCENARIOS as BENCHMARK_SCENARIOS, run_suite, seed_project
+from custom_api.export_files import parse_range
+from custom_api.export_formats import compression_error, is_available as columnar_available
+from custom_api.export_jobs import claim_next_job, run_job, write_export_file
+from custom_api.models import ExportJob, ExportTaskTimestamp, TaskExportEligibility
+from custom_api.export_shards import shard_bounds
+from custom_api.export_timestamps import parse_date_value, sync_all_project_timestamps, sync_project_timestamps
+from custom_api.task_import import ExportTaskSerializerBulk
+from custom_api.export_indexes import (
+    ExportIndexError,
+    configured_date_fields,
+    create_date_index,
+    date_field_sql,
+    drop_date_index,
+    index_name,
+    list_date_indexes,
+)
+
 User = get_user_model()
 
 
@@ -65,6 +94,9 @@ class CustomExportAPITest(TestCase):
         # URL
         self.export_url = '/api/custom/export/'
 
+        # 테스트 간 프로세스 로컬 Export 캐시 공유 방지
+        export_cache.clear()
+
     def _create_task(self, data, source_created_at=None):
         """Task 생성 헬퍼"""
         task_data = data.copy()
@@ -621,6 +653,1624 @@ class CustomExportAPITest(TestCase):
         self.assertEqual(data['total'], 1)  # task2만
         self.assertNotIn('tasks', data)
 
+    def test_export_response_type_stream(self):
+        """response_type='stream'으로 NDJSON 스트리밍"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(1, 4):
+            task = self._create_task({'text': f'Task {i}'})
+            self._create_annotation(task, self.admin_user, result)
+            self._create_prediction(task, 'bert-v1', result)
+        self._create_task({'text': 'No annotation'})
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'response_type': 'stream'
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        tasks = [json.loads(line) for line in lines]
+        self.assertEqual(len(tasks), 3)
+        self.assertEqual(
+            [t['data']['text'] for t in tasks],
+            ['Task 3', 'Task 2', 'Task 1']
+        )
+        for task_data in tasks:
+            self.assertEqual(len(task_data['annotations']), 1)
+            self.assertEqual(len(task_data['predictions']), 1)
+            self.assertIn('completed_by_info', task_data['annotations'][0])
+
+    def test_export_stream_matches_data_response(self):
+        """stream 응답과 data 응답의 Task 내용 일치"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(1, 6):
+            task = self._create_task({'text': f'Task {i}'})
+            self._create_annotation(task, self.admin_user, result)
+
+        data_response = self.client.post(self.export_url, {'project_id': self.project.id})
+        stream_response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'response_type': 'stream'
+        })
+
+        lines = b''.join(stream_response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], data_response.json()['tasks'])
+
+    def test_export_stream_rejects_pagination(self):
+        """stream 모드는 페이징과 함께 사용 불가"""
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'response_type': 'stream',
+            'page': 1,
+            'page_size': 10
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_with_cursor_pagination(self):
+        """cursor 페이징으로 전체 Task 순회 (중복/누락 없음)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(1, 6):
+            task = self._create_task({'text': f'Task {i}'})
+            self._create_annotation(task, self.admin_user, result)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            payload = {
+                'project_id': self.project.id,
+                'pagination': 'cursor',
+                'page_size': 2
+            }
+            if cursor:
+                payload['cursor'] = cursor
+            response = self.client.post(self.export_url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertEqual(data['total'], 5)
+            self.assertNotIn('page', data)
+            seen.extend(t['data']['text'] for t in data['tasks'])
+            pages += 1
+
+            if not data['has_next']:
+                self.assertIsNone(data['next_cursor'])
+                break
+            cursor = data['next_cursor']
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, ['Task 5', 'Task 4', 'Task 3', 'Task 2', 'Task 1'])
+
+    def test_export_cursor_pagination_without_total(self):
+        """include_total=false이면 total 생략"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(1, 4):
+            task = self._create_task({'text': f'Task {i}'})
+            self._create_annotation(task, self.admin_user, result)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'pagination': 'cursor',
+            'page_size': 2,
+            'include_total': False
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertNotIn('total', data)
+        self.assertTrue(data['has_next'])
+        self.assertEqual(len(data['tasks']), 2)
+
+        # page 페이징에서도 total 생략 가능
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'page': 2,
+            'page_size': 2,
+            'include_total': False
+        }, format='json')
+        data = response.json()
+        self.assertNotIn('total', data)
+        self.assertNotIn('total_pages', data)
+        self.assertFalse(data['has_next'])
+        self.assertEqual(len(data['tasks']), 1)
+
+    def test_export_cursor_validation(self):
+        """cursor 페이징 파라미터 검증"""
+        # 잘못된 cursor
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'cursor': 'not-a-cursor',
+            'page_size': 10
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # cursor 페이징에 page 사용 불가
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'pagination': 'cursor',
+            'page': 1,
+            'page_size': 10
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # cursor 페이징에는 page_size 필수
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'pagination': 'cursor'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_with_timezone_offset_dates(self):
+        """오프셋이 포함된 날짜 값도 timestamptz로 정규화하여 비교"""
+        # 2025-01-15 10:00 KST = 2025-01-15 01:00 UTC
+        task1 = self._create_task({'text': 'Task 1'}, source_created_at='2025-01-15T10:00:00+09:00')
+        # 타임존 없는 값은 UTC로 간주
+        task2 = self._create_task({'text': 'Task 2'}, source_created_at='2025-01-15 03:00:00')
+
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task1, self.admin_user, result)
+        self._create_annotation(task2, self.admin_user, result)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'search_from': '2025-01-15T02:00:00Z',
+            'search_to': '2025-01-15T23:59:59Z'
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['tasks'][0]['data']['text'], 'Task 2')
+
+        # KST 기준 요청 (2025-01-15 09:00 KST = 00:00 UTC) → 두 Task 모두 포함
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'search_from': '2025-01-15T09:00:00+09:00',
+            'response_type': 'count'
+        }, format='json')
+        self.assertEqual(response.json()['total'], 2)
+
+    def test_export_reports_unparseable_dates(self):
+        """날짜로 파싱할 수 없는 값은 제외하고 건수를 리포트"""
+        task1 = self._create_task({'text': 'Task 1'}, source_created_at='2025-01-20 10:00:00')
+        task2 = self._create_task({'text': 'Task 2'}, source_created_at='not-a-date')
+
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task1, self.admin_user, result)
+        self._create_annotation(task2, self.admin_user, result)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'search_from': '2025-01-01 00:00:00'
+        }, format='json')
+
+        data = response.json()
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['date_parse_errors'], 1)
+
+        # 날짜 필터 없으면 리포트 생략
+        response = self.client.post(self.export_url, {'project_id': self.project.id}, format='json')
+        self.assertNotIn('date_parse_errors', response.json())
+
+    def test_export_date_filter_includes_bulk_created_tasks(self):
+        """시그널 없이 bulk 생성된 Task도 동기화 전부터 날짜 필터에 포함 (side table 행이 없으면 문자열 비교)"""
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, data={'text': f'Bulk {i}', 'source_created_at': f'2025-01-1{i} 10:00:00'})
+            for i in range(1, 4)
+        ])
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for task in tasks:
+            self._create_annotation(task, self.admin_user, result)
+
+        payload = {
+            'project_id': self.project.id,
+            'search_from': '2025-01-12 00:00:00',
+            'response_type': 'count'
+        }
+        response = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(response.json()['total'], 2)
+        self.assertFalse(ExportTaskTimestamp.objects.filter(task__in=tasks).exists())
+
+        call_command('sync_export_timestamps', '--project', str(self.project.id), stdout=StringIO())
+        export_cache.clear()
+        response = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(response.json()['total'], 2)
+
+    def test_task_import_syncs_timestamps(self):
+        """Label Studio import 후처리(post_process_tasks)에서 bulk 생성 Task의 정규화 값 저장"""
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, data={'text': 'Imported', 'source_created_at': '2025-01-15T19:00:00+09:00'}),
+            Task(project=self.project, data={'text': 'Broken', 'source_created_at': 'yesterday'}),
+        ])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExportTaskSerializerBulk.post_process_tasks(self.project.id, [task.id for task in tasks])
+
+        imported = ExportTaskTimestamp.objects.get(task=tasks[0], field_name='source_created_at')
+        self.assertEqual(imported.value, datetime(2025, 1, 15, 10, 0, tzinfo=pytz.UTC))
+        self.assertTrue(ExportTaskTimestamp.objects.get(task=tasks[1]).parse_error)
+
+    def test_sync_timestamps_picks_up_late_and_updated_tasks(self):
+        """늦게 commit된 낮은 id Task와 QuerySet.update()로 바뀐 값도 재동기화"""
+        late, newer = Task.objects.bulk_create([
+            Task(project=self.project, data={'text': 'Late', 'source_created_at': '2025-01-11 10:00:00'}),
+            Task(project=self.project, data={'text': 'Newer', 'source_created_at': '2025-01-12 10:00:00'}),
+        ])
+        # 낮은 id Task의 side table 행이 없는 상태 (동시 import가 늦게 commit된 경우)
+        sync_project_timestamps(self.project.id, 'source_created_at')
+        ExportTaskTimestamp.objects.filter(task=late).delete()
+        self.assertEqual(sync_project_timestamps(self.project.id, 'source_created_at'), 1)
+        self.assertTrue(ExportTaskTimestamp.objects.filter(task=late, field_name='source_created_at').exists())
+
+        # updated_at이 바뀌지 않는 QuerySet.update()는 rebuild에서 원본 값 비교로 반영
+        Task.objects.filter(pk=newer.pk).update(data={'text': 'Newer', 'source_created_at': '2025-03-01 00:00:00'})
+        self.assertEqual(sync_project_timestamps(self.project.id, 'source_created_at'), 0)
+        self.assertEqual(sync_project_timestamps(self.project.id, 'source_created_at', rebuild=True), 1)
+        stored = ExportTaskTimestamp.objects.get(task=newer, field_name='source_created_at')
+        self.assertEqual(stored.value, datetime(2025, 3, 1, tzinfo=pytz.UTC))
+
+    def test_sync_all_project_timestamps_only_scans_recent_tasks(self):
+        """worker 주기 동기화는 lookback 안에 수정된 Task만 비교"""
+        recent, old = Task.objects.bulk_create([
+            Task(project=self.project, data={'text': 'Recent', 'source_created_at': '2025-01-11 10:00:00'}),
+            Task(project=self.project, data={'text': 'Old', 'source_created_at': '2025-01-12 10:00:00'}),
+        ])
+        Task.objects.filter(pk=old.pk).update(updated_at=timezone.now() - timedelta(days=1))
+        ExportTaskTimestamp.objects.filter(task__in=[recent, old]).delete()
+
+        self.assertEqual(sync_all_project_timestamps(lookback_seconds=3600), 1)
+        self.assertTrue(ExportTaskTimestamp.objects.filter(task=recent).exists())
+        self.assertFalse(ExportTaskTimestamp.objects.filter(task=old).exists())
+
+    def test_parse_date_value(self):
+        """날짜 문자열 정규화 규칙"""
+        utc = pytz.UTC
+        self.assertEqual(parse_date_value('2025-01-15 10:00:00'), (datetime(2025, 1, 15, 10, 0, tzinfo=utc), False))
+        self.assertEqual(parse_date_value('2025-01-15T10:00:00Z'), (datetime(2025, 1, 15, 10, 0, tzinfo=utc), False))
+        self.assertEqual(parse_date_value('2025-01-15T19:00:00+09:00'), (datetime(2025, 1, 15, 10, 0, tzinfo=utc), False))
+        self.assertEqual(parse_date_value('2025-01-15'), (datetime(2025, 1, 15, 0, 0, tzinfo=utc), False))
+        self.assertEqual(parse_date_value(None), (None, False))
+        self.assertEqual(parse_date_value('2025-02-30 00:00:00'), (None, True))
+        self.assertEqual(parse_date_value('yesterday'), (None, True))
+
+    def test_export_cache_hit_skips_database(self):
+        """같은 요청 반복 시 캐시 응답 (DB 조회 없음)"""
+        task = self._create_task({'text': 'Task 1'})
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task, self.admin_user, result)
+
+        payload = {'project_id': self.project.id, 'response_type': 'count'}
+        response = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(response['X-Export-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):
+            cached = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(cached['X-Export-Cache'], 'HIT')
+        self.assertEqual(cached.data, response.data)
+
+    def test_export_cache_invalidated_on_write(self):
+        """Annotation 추가 시 프로젝트 캐시 무효화"""
+        task1 = self._create_task({'text': 'Task 1'})
+        task2 = self._create_task({'text': 'Task 2'})
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task1, self.admin_user, result)
+
+        payload = {'project_id': self.project.id, 'page': 1, 'page_size': 10}
+        response = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(response.data['total'], 1)
+
+        self._create_annotation(task2, self.admin_user, result)
+
+        response = self.client.post(self.export_url, payload, format='json')
+        self.assertEqual(response['X-Export-Cache'], 'MISS')
+        self.assertEqual(response.data['total'], 2)
+
+    def test_export_cache_skips_full_export(self):
+        """전체 반환(페이징 없음) 응답은 캐시하지 않음"""
+        response = self.client.post(self.export_url, {'project_id': self.project.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('X-Export-Cache', response)
+
+    def test_lru_cache_eviction_and_ttl(self):
+        """LRUCache 최대 개수 초과 시 제거 및 TTL 만료"""
+        cache = export_cache.LRUCache(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+        expired = export_cache.LRUCache(max_entries=2, ttl=0)
+        expired.set('a', 1)
+        self.assertIsNone(expired.get('a'))
+
+    def test_eligibility_table_matches_exists_filters(self):
+        """비정규화 eligibility 테이블 사용 시 EXISTS 필터와 동일한 결과"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        with override_settings(CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=True), self.captureOnCommitCallbacks(execute=True):
+            task1 = self._create_task({'text': 'Task 1'})
+            task2 = self._create_task({'text': 'Task 2'})
+            task3 = self._create_task({'text': 'Task 3'})
+            self._create_task({'text': 'Task 4'})
+            self._create_annotation(task1, self.admin_user, result)
+            self._create_annotation(task2, self.regular_user, result)
+            cancelled = self._create_annotation(task3, self.admin_user, result)
+            cancelled.was_cancelled = True
+            cancelled.save()
+            self._create_prediction(task1, 'bert-v1', result)
+            self._create_prediction(task3, 'bert-v1', result)
+
+        eligibility = TaskExportEligibility.objects.get(task=task1)
+        self.assertTrue(eligibility.is_eligible)
+        self.assertEqual(eligibility.latest_reviewer_id, self.admin_user.id)
+        self.assertEqual(eligibility.model_versions, ['bert-v1'])
+        self.assertFalse(TaskExportEligibility.objects.get(task=task3).is_eligible)
+
+        for payload in [
+            {'project_id': self.project.id},
+            {'project_id': self.project.id, 'model_version': 'bert-v1'},
+        ]:
+            expected = self.client.post(self.export_url, payload, format='json').json()
+            with override_settings(CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=True):
+                actual = self.client.post(self.export_url, payload, format='json').json()
+            self.assertEqual(
+                [t['id'] for t in actual['tasks']],
+                [t['id'] for t in expected['tasks']]
+            )
+            self.assertEqual([t['id'] for t in actual['tasks']], [task1.id])
+
+    @override_settings(CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=True)
+    def test_eligibility_refreshed_on_superuser_promotion(self):
+        """Superuser 승격/해제 시 사용자 annotation이 달린 Task의 eligibility를 worker 작업으로 재계산"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        with self.captureOnCommitCallbacks(execute=True):
+            task = self._create_task({'text': 'Task 1'})
+            self._create_annotation(task, self.regular_user, result)
+        self.assertFalse(TaskExportEligibility.objects.get(task=task).is_eligible)
+
+        response = self.client.post(f'/api/admin/users/{self.regular_user.id}/promote-to-superuser')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 요청에서는 재계산하지 않고 작업만 등록
+        self.assertFalse(TaskExportEligibility.objects.get(task=task).is_eligible)
+        job = ExportJob.objects.get(id=response.json()['eligibility_job_id'])
+        run_job(claim_next_job('test-worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExportJob.STATUS_COMPLETED)
+        self.assertEqual(job.total_tasks, 1)
+        self.assertTrue(TaskExportEligibility.objects.get(task=task).is_eligible)
+
+        response = self.client.post(f'/api/admin/users/{self.regular_user.id}/demote-from-superuser')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        run_job(claim_next_job('test-worker'))
+        self.assertFalse(TaskExportEligibility.objects.get(task=task).is_eligible)
+
+    def test_eligibility_not_refreshed_when_table_disabled(self):
+        """CUSTOM_EXPORT_USE_ELIGIBILITY_TABLE=false이면 시그널/승격 API가 eligibility를 갱신하지 않음"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        with self.captureOnCommitCallbacks(execute=True):
+            task = self._create_task({'text': 'Task 1'})
+            self._create_annotation(task, self.regular_user, result)
+        self.assertFalse(TaskExportEligibility.objects.filter(task=task).exists())
+
+        response = self.client.post(f'/api/admin/users/{self.regular_user.id}/promote-to-superuser')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.json()['eligibility_job_id'])
+        self.assertFalse(ExportJob.objects.exists())
+
+    def test_backfill_export_eligibility_command(self):
+        """backfill 명령이 시그널 없이 생성된 annotation을 반영"""
+        task = self._create_task({'text': 'Task 1'})
+        Annotation.objects.bulk_create([Annotation(
+            task=task,
+            project=self.project,
+            completed_by=self.admin_user,
+            result=[{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        )])
+        self.assertFalse(TaskExportEligibility.objects.filter(task=task).exists())
+
+        out = StringIO()
+        call_command('backfill_export_eligibility', projects=[self.project.id], stdout=out)
+
+        self.assertTrue(TaskExportEligibility.objects.get(task=task).is_eligible)
+        self.assertIn('eligible=1', out.getvalue())
+
+    @skipUnless(columnar_available(), 'pyarrow가 설치된 환경에서만 실행')
+    def test_export_format_parquet(self):
+        """format='parquet' - annotation 단위 행의 Parquet 파일"""
+        import pyarrow.parquet as pq
+
+        task = self._create_task({'text': '한글 Task'})
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        annotation = self._create_annotation(task, self.admin_user, result)
+        self._create_prediction(task, 'bert-v1', result)
+
+        response = self.client.post(
+            self.export_url, {'project_id': self.project.id, 'format': 'parquet'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/vnd.apache.parquet')
+        table = pq.read_table(BytesIO(b''.join(response.streaming_content)))
+        rows = table.to_pylist()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['task_id'], task.id)
+        self.assertEqual(rows[0]['annotation_id'], annotation.id)
+        self.assertEqual(rows[0]['completed_by_email'], 'admin@test.com')
+        self.assertEqual(rows[0]['prediction_model_versions'], ['bert-v1'])
+        self.assertEqual(json.loads(rows[0]['data'])['text'], '한글 Task')
+
+    @skipUnless(columnar_available(), 'pyarrow가 설치된 환경에서만 실행')
+    def test_export_format_arrow(self):
+        """format='arrow' - Arrow IPC 파일"""
+        import pyarrow as pa
+        import pyarrow.ipc as pa_ipc
+
+        task = self._create_task({'text': 'Task 1'})
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task, self.admin_user, result)
+
+        response = self.client.post(
+            self.export_url, {'project_id': self.project.id, 'format': 'arrow'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        reader = pa_ipc.open_file(pa.BufferReader(b''.join(response.streaming_content)))
+        self.assertEqual(reader.read_all().column('task_id').to_pylist(), [task.id])
+
+    def test_export_format_validation(self):
+        """format='parquet'/'arrow'는 페이징/count와 함께 사용 불가"""
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'format': 'parquet', 'response_type': 'count'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'format': 'arrow', 'page': 1, 'page_size': 10
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(CUSTOM_EXPORT_COLUMNAR_COMPRESSION='snappy')
+    def test_export_format_rejects_unsupported_codec(self):
+        """Arrow IPC가 지원하지 않는 코덱은 스트리밍 시작 전 501 (잘린 200 응답 방지)"""
+        self.assertIsNone(compression_error('parquet'))
+        self.assertIn('lz4', compression_error('arrow'))
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'format': 'arrow'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+
+    def test_export_async_job(self):
+        """mode='async' - job 등록 → worker 실행 → 상태 조회 → Range 다운로드"""
+        task1 = self._create_task({'text': 'Task 1'})
+        task2 = self._create_task({'text': 'Task 2'})
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(task1, self.admin_user, result)
+        self._create_annotation(task2, self.admin_user, result)
+
+        response = self.client.post(
+            self.export_url, {'project_id': self.project.id, 'mode': 'async'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], ExportJob.STATUS_PENDING)
+        status_url = response.data['status_url']
+
+        with tempfile.TemporaryDirectory() as job_dir, self.settings(CUSTOM_EXPORT_JOB_DIR=job_dir):
+            job = claim_next_job('test-worker')
+            self.assertIsNotNone(job)
+            self.assertIsNone(claim_next_job('other-worker'))
+            run_job(job)
+
+            response = self.client.get(status_url)
+            self.assertEqual(response.data['status'], ExportJob.STATUS_COMPLETED)
+            self.assertEqual(response.data['processed_tasks'], 2)
+            self.assertEqual(response.data['progress'], 100.0)
+
+            download = self.client.get(response.data['download_url'])
+            self.assertEqual(download.status_code, status.HTTP_200_OK)
+            content = b''.join(download.streaming_content)
+            lines = content.decode('utf-8').splitlines()
+            self.assertEqual([json.loads(line)['id'] for line in lines], [task2.id, task1.id])
+
+            partial = self.client.get(response.data['download_url'], HTTP_RANGE='bytes=10-')
+            self.assertEqual(partial.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(b''.join(partial.streaming_content), content[10:])
+            self.assertEqual(partial['Content-Range'], f'bytes 10-{len(content) - 1}/{len(content)}')
+
+            invalid = self.client.get(response.data['download_url'], HTTP_RANGE=f'bytes={len(content)}-')
+            self.assertEqual(invalid.status_code, 416)
+
+        other = APIClient()
+        other.force_authenticate(user=self.regular_user)
+        self.assertEqual(other.get(status_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_async_validation(self):
+        """mode='async'는 count/페이징과 함께 사용 불가"""
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'mode': 'async', 'page': 1, 'page_size': 10
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_parse_range(self):
+        """Range 헤더 파싱"""
+        self.assertEqual(parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range('bytes=900-', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=900-5000', 1000), (900, 999))
+        self.assertIsNone(parse_range(None, 1000))
+        self.assertIsNone(parse_range('bytes=0-1,5-6', 1000))
+        with self.assertRaises(ValueError):
+            parse_range('bytes=1000-', 1000)
+
+    def _create_serializer_fixture(self):
+        """fast path 비교용 Task (검수자/일반 사용자 annotation, prediction, meta 포함)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(1, 4):
+            task = self._create_task({'text': f'Task {i} 한글'})
+            task.meta = {'source': f'sensor-{i}'}
+            task.save()
+            self._create_annotation(task, self.admin_user, result)
+            self._create_annotation(task, self.regular_user, result)
+            self._create_prediction(task, 'bert-v1', result, score=0.5 + i / 10)
+        self._create_prediction(task, 'bert-v2', result, score=None)
+
+    def test_fast_serializer_matches_label_studio_serializers(self):
+        """export_encoder fast path와 Label Studio Serializer 경로의 필드/값 동일"""
+        self._create_serializer_fixture()
+
+        view = CustomExportAPI()
+        queryset = view._queryset_for({'project_id': self.project.id})
+
+        self.assertTrue(export_encoder.is_enabled())
+        expected = json.loads(JSONRenderer().render(view._serialize_tasks_with_serializers(queryset)))
+        actual = json.loads(export_encoder.dumps(
+            export_encoder.encode_tasks(export_encoder.task_rows(queryset))
+        ))
+
+        self.assertEqual(len(actual), 3)
+        for fast_task, task in zip(actual, expected):
+            self.assertEqual(list(fast_task), list(task))
+            for fast_annotation, annotation in zip(fast_task['annotations'], task['annotations']):
+                self.assertEqual(list(fast_annotation), list(annotation))
+            for fast_prediction, prediction in zip(fast_task['predictions'], task['predictions']):
+                self.assertEqual(list(fast_prediction), list(prediction))
+        self.assertEqual(actual, expected)
+
+    def test_export_response_same_without_fast_serializer(self):
+        """CUSTOM_EXPORT_FAST_SERIALIZER 설정과 무관하게 응답 동일 (전체 / cursor / stream)"""
+        self._create_serializer_fixture()
+        requests = [
+            {'project_id': self.project.id},
+            {'project_id': self.project.id, 'pagination': 'cursor', 'page_size': 2},
+        ]
+
+        for body in requests:
+            fast = self.client.post(self.export_url, body, format='json').json()
+            export_cache.clear()
+            with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=False):
+                legacy = self.client.post(self.export_url, body, format='json').json()
+            export_cache.clear()
+            self.assertEqual(fast, legacy)
+
+        stream_body = {'project_id': self.project.id, 'response_type': 'stream'}
+        fast = b''.join(self.client.post(self.export_url, stream_body).streaming_content)
+        with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=False):
+            legacy = b''.join(self.client.post(self.export_url, stream_body).streaming_content)
+        self.assertEqual(
+            [json.loads(line) for line in fast.splitlines()],
+            [json.loads(line) for line in legacy.splitlines()]
+        )
+
+    def test_export_field_projection(self):
+        """fields / data_keys / include_* projection (fast path / Serializer 경로 동일)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        task = self._create_task({'image': 'a.jpg', 'ocr_text': 'x' * 1000}, source_created_at='2025-01-15 10:00:00')
+        self._create_annotation(task, self.admin_user, result)
+        self._create_prediction(task, 'bert-v1', result)
+
+        body = {
+            'project_id': self.project.id,
+            'fields': ['id', 'data', 'annotations', 'predictions'],
+            'data_keys': ['image', 'source_created_at', 'missing'],
+            'include_predictions': False,
+        }
+        for fast_serializer in (True, False):
+            with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=fast_serializer):
+                response = self.client.post(self.export_url, body, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            task_data = response.json()['tasks'][0]
+            self.assertEqual(list(task_data), ['id', 'data', 'annotations'])
+            self.assertEqual(task_data['data'], {'image': 'a.jpg', 'source_created_at': '2025-01-15 10:00:00'})
+            self.assertEqual(len(task_data['annotations']), 1)
+            self.assertIn('completed_by_info', task_data['annotations'][0])
+
+    def test_export_field_projection_with_cursor(self):
+        """projection에서 created_at을 제외해도 cursor 페이징 동작"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(3):
+            self._create_annotation(self._create_task({'text': f'Task {i}'}), self.admin_user, result)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'pagination': 'cursor',
+            'page_size': 2,
+            'fields': ['id'],
+        }, format='json')
+
+        data = response.json()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([list(t) for t in data['tasks']], [['id'], ['id']])
+        self.assertIsNotNone(data['next_cursor'])
+
+    @override_settings(CUSTOM_EXPORT_DELTA_SAFETY_SECONDS=0)
+    def test_export_delta_with_watermark(self):
+        """updated_since + watermark로 연속 증분 Export (누락/중복 없음)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        tasks = [self._create_task({'text': f'Task {i}'}) for i in range(3)]
+        annotations = [self._create_annotation(task, self.admin_user, result) for task in tasks]
+
+        first = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'updated_since': '2000-01-01T00:00:00Z'
+        }, format='json').json()
+        self.assertEqual(first['total'], 3)
+        self.assertIn('watermark', first)
+
+        annotations[1].result = [{'type': 'choices', 'value': {'choices': ['Negative']}}]
+        annotations[1].save()
+        self._create_prediction(tasks[2], 'bert-v2', result)
+        self._create_annotation(tasks[0], self.regular_user, result)  # 일반 사용자 annotation은 변경으로 보지 않음
+
+        second = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'updated_since': first['watermark']
+        }, format='json').json()
+        self.assertEqual({t['id'] for t in second['tasks']}, {tasks[1].id, tasks[2].id})
+
+        third = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'updated_since': second['watermark'], 'response_type': 'count'
+        }, format='json').json()
+        self.assertEqual(third['total'], 0)
+
+    def test_export_delta_validation(self):
+        """updated_since는 updated_until보다 이전이어야 함"""
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id,
+            'updated_since': '2025-02-01T00:00:00Z',
+            'updated_until': '2025-01-01T00:00:00Z',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_stream_gzip_compression(self):
+        """Accept-Encoding: gzip - stream 응답 증분 압축"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(3):
+            self._create_annotation(self._create_task({'text': f'Task {i}'}), self.admin_user, result)
+
+        body = {'project_id': self.project.id, 'response_type': 'stream'}
+        plain = b''.join(self.client.post(self.export_url, body).streaming_content)
+        response = self.client.post(self.export_url, body, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), plain)
+
+    @override_settings(CUSTOM_EXPORT_COMPRESSION_MIN_SIZE=512)
+    def test_export_compression_min_size(self):
+        """CUSTOM_EXPORT_COMPRESSION_MIN_SIZE 미만 응답은 압축하지 않음"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(5):
+            self._create_annotation(self._create_task({'text': f'Task {i}'}), self.admin_user, result)
+
+        count = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'response_type': 'count'
+        }, format='json', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(count.has_header('Content-Encoding'))
+
+        data = self.client.post(self.export_url, {'project_id': self.project.id}, format='json',
+                                HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(data['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(data.content))['total'], 5)
+
+    def test_negotiate_accept_encoding(self):
+        """Accept-Encoding q 값 협상"""
+        factory = RequestFactory()
+
+        def negotiate(header, encodings=None):
+            return export_compression.negotiate(factory.get('/', HTTP_ACCEPT_ENCODING=header), encodings)
+
+        self.assertEqual(negotiate('gzip, deflate'), 'gzip')
+        self.assertIsNone(negotiate('identity'))
+        self.assertIsNone(negotiate('gzip;q=0'))
+        self.assertEqual(negotiate('*', ['gzip']), 'gzip')
+        self.assertEqual(negotiate('zstd;q=0.5, gzip', ['zstd', 'gzip']), 'gzip')
+        self.assertEqual(negotiate('zstd, gzip', ['zstd', 'gzip']), 'zstd')
+
+    def test_export_async_job_keeps_multi_valued_form_fields(self):
+        """form 요청의 다중 값 필드(fields 등)가 작업 파라미터에 모두 저장"""
+        response = self.client.post(
+            self.export_url,
+            {'project_id': self.project.id, 'mode': 'async', 'fields': ['id', 'data']},
+            format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        job = ExportJob.objects.get(id=response.data['job_id'])
+        self.assertEqual(job.params['fields'], ['id', 'data'])
+        self.assertEqual(job.params['mode'], 'async')
+
+    def test_export_async_job_precompressed_download(self):
+        """비동기 작업 결과의 미리 압축된 파일 제공 (Range 포함)"""
+        task = self._create_task({'text': 'Task 1'})
+        self._create_annotation(task, self.admin_user, [{'type': 'choices', 'value': {'choices': ['Positive']}}])
+
+        response = self.client.post(
+            self.export_url, {'project_id': self.project.id, 'mode': 'async'}, format='json'
+        )
+
+        with tempfile.TemporaryDirectory() as job_dir, \
+                self.settings(CUSTOM_EXPORT_JOB_DIR=job_dir, CUSTOM_EXPORT_JOB_PRECOMPRESS=['gzip']):
+            run_job(claim_next_job('test-worker'))
+            download_url = self.client.get(response.data['status_url']).data['download_url']
+
+            plain = b''.join(self.client.get(download_url).streaming_content)
+            compressed = self.client.get(download_url, HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(compressed['Content-Encoding'], 'gzip')
+            body = b''.join(compressed.streaming_content)
+            self.assertEqual(gzip.decompress(body), plain)
+
+            partial = self.client.get(download_url, HTTP_ACCEPT_ENCODING='gzip', HTTP_RANGE='bytes=5-')
+            self.assertEqual(partial.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(b''.join(partial.streaming_content), body[5:])
+
+    def test_write_export_file_removes_partial_files_on_failure(self):
+        """기록 중 실패하면 임시 파일(.part)과 미리 압축된 임시 파일을 모두 삭제"""
+        def blocks():
+            yield b'{"id": 1}\n'
+            raise RuntimeError('serialization failed')
+
+        with tempfile.TemporaryDirectory() as job_dir, self.settings(CUSTOM_EXPORT_JOB_PRECOMPRESS=['gzip']):
+            with self.assertRaises(RuntimeError):
+                write_export_file(os.path.join(job_dir, 'result.ndjson'), blocks(), 'application/x-ndjson')
+            self.assertEqual(os.listdir(job_dir), [])
+
+    def test_export_normalize_users(self):
+        """normalize_users=true - completed_by_info 대신 최상위 users 맵 (fast path / Serializer 경로 동일)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(3):
+            self._create_annotation(self._create_task({'text': f'Task {i}'}), self.admin_user, result)
+
+        for fast_serializer in (True, False):
+            with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=fast_serializer):
+                response = self.client.post(self.export_url, {
+                    'project_id': self.project.id, 'normalize_users': True
+                }, format='json')
+
+            data = response.json()
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(data['users'], {
+                str(self.admin_user.id): {
+                    'id': self.admin_user.id,
+                    'email': 'admin@test.com',
+                    'username': 'admin',
+                    'is_superuser': True,
+                }
+            })
+            for task_data in data['tasks']:
+                annotation = task_data['annotations'][0]
+                self.assertNotIn('completed_by_info', annotation)
+                self.assertEqual(annotation['completed_by'], self.admin_user.id)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'normalize_users': True, 'response_type': 'stream'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(CUSTOM_EXPORT_MULTI_PROJECT_WORKERS=1)
+    def test_export_multi_project(self):
+        """project_ids - project_ids 순서로 병합, project_id 태그, 프로젝트별 건수"""
+        other_project = Project.objects.create(
+            title='Other Project',
+            organization=self.org,
+            created_by=self.admin_user,
+            label_config=self.project.label_config
+        )
+        first = self._create_task({'text': 'Task A'})
+        second = Task.objects.create(project=other_project, data={'text': 'Task B'})
+
+        response = self.client.post(self.export_url, {
+            'project_ids': [other_project.id, self.project.id, other_project.id], 'fields': ['id']
+        }, format='json')
+        data = response.json()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data['total'], 2)
+        self.assertEqual(data['project_totals'], {str(other_project.id): 1, str(self.project.id): 1})
+        self.assertEqual(data['tasks'], [
+            {'id': second.id, 'project_id': other_project.id},
+            {'id': first.id, 'project_id': self.project.id},
+        ])
+
+        response = self.client.post(self.export_url, {
+            'project_ids': [self.project.id, other_project.id], 'response_type': 'count'
+        }, format='json')
+        self.assertEqual(response.json()['project_totals'], {str(self.project.id): 1, str(other_project.id): 1})
+
+        response = self.client.post(self.export_url, {
+            'project_ids': [self.project.id, other_project.id], 'response_type': 'stream'
+        }, format='json')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [first.id, second.id])
+
+        response = self.client.post(self.export_url, {
+            'project_ids': [self.project.id, 999999]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_multi_project_validation(self):
+        """project_id / project_ids 중 하나만, 페이징 / 비동기 / 컬럼형 형식 불가"""
+        for params in (
+            {'project_id': self.project.id, 'project_ids': [self.project.id]},
+            {'project_ids': []},
+            {'project_ids': [self.project.id], 'page': 1, 'page_size': 10},
+            {'project_ids': [self.project.id], 'mode': 'async'},
+            {'project_ids': [self.project.id], 'format': 'parquet'},
+        ):
+            response = self.client.post(self.export_url, params, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_export_stats_group_by(self):
+        """집계 API - model_version / 검수자 / 날짜 bucket별 distinct Task 수"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i, (created, versions) in enumerate((
+            ('2025-01-06 10:00:00', ['v1', 'v2']),
+            ('2025-01-07 10:00:00', ['v1']),
+            ('2025-02-03 10:00:00', ['v2']),
+        )):
+            task = self._create_task({'text': f'Task {i}'}, source_created_at=created)
+            self._create_annotation(task, self.admin_user, result)
+            for version in versions:
+                self._create_prediction(task, version, [])
+        # 검수자 annotation이 없는 Task는 집계 제외
+        self._create_prediction(self._create_task({'text': 'Draft'}, '2025-01-06 11:00:00'), 'v1', [])
+
+        stats_url = '/api/custom/export/stats/'
+        response = self.client.post(stats_url, {
+            'project_id': self.project.id, 'group_by': ['model_version']
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['groups'], [
+            {'model_version': 'v1', 'count': 2},
+            {'model_version': 'v2', 'count': 2},
+        ])
+
+        response = self.client.post(stats_url, {
+            'project_id': self.project.id, 'group_by': ['date', 'confirm_user'], 'date_granularity': 'month'
+        }, format='json')
+        self.assertEqual(response.json()['groups'], [
+            {'date': '2025-01-01', 'confirm_user_id': self.admin_user.id, 'count': 2},
+            {'date': '2025-02-01', 'confirm_user_id': self.admin_user.id, 'count': 1},
+        ])
+
+        response = self.client.post(stats_url, {
+            'project_id': self.project.id, 'group_by': ['date'], 'date_granularity': 'week',
+            'model_version': 'v2'
+        }, format='json')
+        self.assertEqual(response.json()['groups'], [
+            {'date': '2025-01-06', 'count': 1},
+            {'date': '2025-02-03', 'count': 1},
+        ])
+
+        # 같은 요청은 캐시에서 응답
+        cached = self.client.post(stats_url, {
+            'project_id': self.project.id, 'group_by': ['model_version']
+        }, format='json')
+        self.assertEqual(cached['X-Export-Cache'], 'HIT')
+
+    def test_export_stats_validation(self):
+        """집계 API - group_by 필수, Export 응답 형식 파라미터 / 정규화되지 않은 날짜 필드 불가"""
+        stats_url = '/api/custom/export/stats/'
+        for params in (
+            {'project_id': self.project.id},
+            {'project_id': self.project.id, 'group_by': ['unknown']},
+            {'project_id': self.project.id, 'group_by': ['model_version'], 'page': 1, 'page_size': 10},
+            {'project_id': self.project.id, 'group_by': ['date'], 'search_date_field': 'not_normalized'},
+        ):
+            response = self.client.post(stats_url, params, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_export_snapshot_paging(self):
+        """snapshot=true - 첫 페이지 이후 추가된 Task는 이후 페이지에 섞이지 않음"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for i in range(5):
+            self._create_annotation(self._create_task({'text': f'Task {i}'}), self.admin_user, result)
+
+        first = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'page': 1, 'page_size': 2, 'snapshot': True
+        }, format='json').json()
+        self.assertEqual(first['total'], 5)
+        self.assertIn('snapshot_token', first)
+
+        # 첫 페이지 이후 최신 Task 추가 → OFFSET 페이징이면 2페이지가 한 칸씩 밀림
+        self._create_annotation(self._create_task({'text': 'New Task'}), self.admin_user, result)
+
+        seen = [task['id'] for task in first['tasks']]
+        for page in (2, 3):
+            response = self.client.post(self.export_url, {
+                'project_id': self.project.id, 'page': page, 'page_size': 2,
+                'snapshot_token': first['snapshot_token']
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()['total'], 5)
+            seen.extend(task['id'] for task in response.json()['tasks'])
+
+        expected = list(Task.objects.filter(project=self.project).exclude(data__text='New Task')
+                        .order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+        # 다른 필터로 같은 snapshot 사용 불가
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'page': 2, 'page_size': 2, 'model_version': 'v1',
+            'snapshot_token': first['snapshot_token']
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 만료 / 다른 사용자 → 410
+        client = APIClient()
+        client.force_authenticate(user=self.regular_user)
+        response = client.post(self.export_url, {
+            'project_id': self.project.id, 'page': 2, 'page_size': 2,
+            'snapshot_token': first['snapshot_token']
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'snapshot': True
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_server_timing(self):
+        """Server-Timing 헤더 - 단계별 시간 + SQL 통계, 샘플링 0이면 생략"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        self._create_annotation(self._create_task({'text': 'Task'}), self.admin_user, result)
+
+        with self.assertLogs('custom_api.timing', level='INFO') as logs, \
+                override_settings(CUSTOM_API_TIMING_SLOW_MS=0):
+            response = self.client.post(self.export_url, {
+                'project_id': self.project.id, 'page': 1, 'page_size': 10
+            }, format='json')
+        timing = response['Server-Timing']
+        for metric in ('validate;dur=', 'count;dur=', 'query;dur=', 'serialize;dur=', 'render;dur=', 'total;dur='):
+            self.assertIn(metric, timing)
+        self.assertRegex(timing, r'sql;dur=[\d.]+;desc="queries=[1-9]\d*"')
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record['view'], 'CustomExportAPI')
+        self.assertGreater(record['sql_queries'], 0)
+
+        with override_settings(CUSTOM_API_TIMING_SAMPLE_RATE=0):
+            response = self.client.post(self.export_url, {'project_id': self.project.id}, format='json')
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    def test_export_prediction_modes(self):
+        """prediction_mode - SQL에서 선택한 prediction만 포함 (fast path / Serializer 경로 동일)"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        task = self._create_task({'text': 'Task'})
+        self._create_annotation(task, self.admin_user, result)
+        oldest = self._create_prediction(task, 'v1', result, score=0.2)
+        middle = self._create_prediction(task, 'v2', result, score=0.9)
+        newest = self._create_prediction(task, 'v1', result, score=0.6)
+
+        cases = (
+            ({}, [newest, middle, oldest]),
+            ({'prediction_mode': 'model_version', 'model_version': 'v1'}, [newest, oldest]),
+            ({'prediction_mode': 'latest_per_version'}, [newest, middle]),
+            ({'prediction_mode': 'latest'}, [newest]),
+            ({'prediction_mode': 'top_k', 'prediction_top_k': 2}, [middle, newest]),
+            ({'prediction_mode': 'min_score', 'prediction_min_score': 0.5}, [newest, middle]),
+        )
+        for fast_serializer in (True, False):
+            for params, expected in cases:
+                with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=fast_serializer):
+                    response = self.client.post(self.export_url, {
+                        'project_id': self.project.id, **params
+                    }, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK, params)
+                predictions = response.json()['tasks'][0]['predictions']
+                self.assertEqual(
+                    [p['id'] for p in predictions], [p.id for p in expected], (fast_serializer, params)
+                )
+
+        for params in (
+            {'prediction_mode': 'model_version'},
+            {'prediction_mode': 'top_k'},
+            {'prediction_top_k': 2},
+            {'prediction_mode': 'min_score'},
+        ):
+            response = self.client.post(self.export_url, {'project_id': self.project.id, **params}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_export_annotation_modes(self):
+        """annotation_mode - SQL에서 선택한 검수자 annotation만 포함 (fast path / Serializer 경로 동일)"""
+        reviewer = User.objects.create_user(username='reviewer', email='reviewer@test.com', password='testpass123')
+        reviewer.is_superuser = True
+        reviewer.save()
+        self.org.add_user(reviewer)
+
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        task = self._create_task({'text': 'Task'})
+        first = self._create_annotation(task, self.admin_user, result)
+        second = self._create_annotation(task, reviewer, result)
+        third = self._create_annotation(task, self.admin_user, result)
+        self._create_annotation(task, self.regular_user, result)
+
+        cases = (
+            ({}, [third, second, first]),
+            ({'annotation_mode': 'latest'}, [third]),
+            ({'annotation_mode': 'latest_per_reviewer'}, [third, second]),
+            ({'annotation_mode': 'confirm_user', 'confirm_user_id': reviewer.id}, [second]),
+        )
+        for fast_serializer in (True, False):
+            for params, expected in cases:
+                with override_settings(CUSTOM_EXPORT_FAST_SERIALIZER=fast_serializer):
+                    response = self.client.post(self.export_url, {
+                        'project_id': self.project.id, **params
+                    }, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK, params)
+                annotations = response.json()['tasks'][0]['annotations']
+                self.assertEqual(
+                    [a['id'] for a in annotations], [a.id for a in expected], (fast_serializer, params)
+                )
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'annotation_mode': 'confirm_user'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_etag_not_modified(self):
+        """ETag / If-None-Match - 필터링된 Task 집합이 같으면 304, 변경되면 새 ETag"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        task = self._create_task({'text': 'Task'})
+        self._create_annotation(task, self.admin_user, result)
+
+        for params in ({}, {'response_type': 'count'}):
+            body = {'project_id': self.project.id, **params}
+            response = self.client.post(self.export_url, body, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response['ETag']
+
+            # count 응답은 캐시 HIT에서도 캐시된 ETag로 비교
+            response = self.client.post(self.export_url, body, format='json', HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, params)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(response.content, b'')
+
+            response = self.client.post(self.export_url, body, format='json', HTTP_IF_NONE_MATCH=f'W/{etag}')
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, params)
+
+        # 다른 파라미터는 다른 ETag
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'fields': ['id']
+        }, format='json', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # annotation 추가 → ETag 변경
+        body = {'project_id': self.project.id}
+        etag = self.client.post(self.export_url, body, format='json')['ETag']
+        self._create_annotation(task, self.admin_user, result)
+        response = self.client.post(self.export_url, body, format='json', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.json()['tasks'][0]['annotations']), 2)
+
+        with override_settings(CUSTOM_EXPORT_ETAG_ENABLED=False):
+            response = self.client.post(self.export_url, body, format='json', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header('ETag'))
+
+        # 페이지 / cursor / 스트리밍 요청은 fingerprint를 계산하지 않음
+        for params in (
+            {'page': 1, 'page_size': 10},
+            {'pagination': 'cursor', 'page_size': 10},
+            {'response_type': 'stream'},
+        ):
+            with patch('custom_api.export_etag.fingerprint') as fingerprint:
+                response = self.client.post(self.export_url, {
+                    'project_id': self.project.id, **params
+                }, format='json', HTTP_IF_NONE_MATCH='*')
+            self.assertEqual(response.status_code, status.HTTP_200_OK, params)
+            self.assertFalse(response.has_header('ETag'), params)
+            fingerprint.assert_not_called()
+
+    def test_export_shards(self):
+        """shard_index / shard_count - shard는 서로 겹치지 않고 합집합이 전체 결과와 같음"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        for index in range(7):
+            task = self._create_task({'text': f'Task {index}'})
+            self._create_annotation(task, self.admin_user, result)
+
+        response = self.client.post(self.export_url, {'project_id': self.project.id}, format='json')
+        expected = [task['id'] for task in response.json()['tasks']]
+
+        shards = []
+        for shard_index in range(3):
+            response = self.client.post(self.export_url, {
+                'project_id': self.project.id, 'shard_index': shard_index, 'shard_count': 3
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids = [task['id'] for task in response.json()['tasks']]
+            lower, upper = shard_bounds(shard_index, 3)
+            for task_id in ids:
+                key = hashlib.md5(str(task_id).encode()).hexdigest()
+                self.assertTrue((lower is None or key >= lower) and (upper is None or key < upper))
+            self.assertEqual(response.json()['total'], len(ids))
+            shards.append(ids)
+
+        self.assertEqual(sorted(sum(shards, [])), sorted(expected))
+
+        for params in (
+            {'shard_index': 0},
+            {'shard_count': 2},
+            {'shard_index': 2, 'shard_count': 2},
+            {'shard_index': -1, 'shard_count': 2},
+        ):
+            response = self.client.post(self.export_url, {'project_id': self.project.id, **params}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def _run_artifact_job(self, body):
+        """artifact 요청 → 202 작업 등록 → worker 실행 → 재요청(파일 재사용) 응답"""
+        with patch.object(CustomExportAPI, '_queryset_for', side_effect=AssertionError('queried in request')):
+            queued = self.client.post(self.export_url, body, format='json')
+        self.assertEqual(queued.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(queued.data['status'], ExportJob.STATUS_PENDING)
+
+        # 기록 전 같은 요청은 같은 작업 반환 (중복 등록 없음)
+        again = self.client.post(self.export_url, body, format='json')
+        self.assertEqual(again.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(again.data['job_id'], queued.data['job_id'])
+
+        run_job(claim_next_job('test-worker'))
+        job_status = self.client.get(queued.data['status_url']).data
+        self.assertEqual(job_status['status'], ExportJob.STATUS_COMPLETED)
+
+        with patch.object(CustomExportAPI, '_queryset_for', side_effect=AssertionError('re-queried')):
+            reused = self.client.post(self.export_url, body, format='json')
+        self.assertEqual(reused.status_code, status.HTTP_200_OK)
+        self.assertTrue(reused.data['reused'])
+        self.assertEqual(reused.data['artifact_id'], queued.data['artifact_id'])
+        self.assertEqual(job_status['download_url'], reused.data['download_url'])
+        return reused.json()
+
+    def test_export_artifact_delivery(self):
+        """delivery='artifact' - miss는 작업 등록(202), 기록 후 같은 요청 + generation은 파일 재사용"""
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        task = self._create_task({'text': 'Task'})
+        self._create_annotation(task, self.admin_user, result)
+        body = {'project_id': self.project.id, 'delivery': 'artifact'}
+
+        with tempfile.TemporaryDirectory() as artifact_dir, \
+                self.settings(CUSTOM_EXPORT_ARTIFACT_DIR=artifact_dir, CUSTOM_EXPORT_JOB_PRECOMPRESS=['gzip']):
+            created = self._run_artifact_job(body)
+            self.assertEqual(created['content_type'], 'application/x-ndjson')
+
+            download = self.client.get(created['download_url'])
+            self.assertEqual(download.status_code, status.HTTP_200_OK)
+            lines = b''.join(download.streaming_content).decode('utf-8').splitlines()
+            self.assertEqual([json.loads(line)['id'] for line in lines], [task.id])
+
+            compressed = self.client.get(created['download_url'], HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(compressed['Content-Encoding'], 'gzip')
+
+            partial = self.client.get(created['download_url'], HTTP_RANGE='bytes=3-10')
+            self.assertEqual(partial.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(b''.join(partial.streaming_content), '\n'.join(lines).encode('utf-8')[3:11])
+
+            with self.settings(CUSTOM_EXPORT_ARTIFACT_ACCEL_REDIRECT='/protected/artifacts/'):
+                redirected = self.client.get(created['download_url'])
+                ranged = self.client.get(created['download_url'], HTTP_RANGE='bytes=3-10')
+            self.assertEqual(
+                redirected['X-Accel-Redirect'], f"/protected/artifacts/{created['artifact_id']}.ndjson"
+            )
+            # Range도 nginx가 처리 (본문 없이 위임)
+            self.assertEqual(ranged.status_code, status.HTTP_200_OK)
+            self.assertEqual(ranged['X-Accel-Redirect'], redirected['X-Accel-Redirect'])
+            self.assertEqual(ranged.content, b'')
+
+            # 쓰기 → 프로젝트 generation 증가 → 새 artifact
+            self._create_annotation(task, self.admin_user, result)
+            updated = self._run_artifact_job(body)
+            self.assertNotEqual(updated['artifact_id'], created['artifact_id'])
+
+            with self.settings(CUSTOM_EXPORT_ARTIFACT_TTL_SECONDS=0):
+                response = self.client.get(updated['download_url'])
+            self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+        response = self.client.get('/api/custom/export/artifacts/not-an-artifact/download')
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+        response = self.client.post(self.export_url, {**body, 'page': 1, 'page_size': 10}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_sampling(self):
+        """sample_size / sample_seed / stratify_by - 같은 seed면 같은 샘플, 층별 sample_size개"""
+        for index in range(12):
+            label = 'Positive' if index % 3 else 'Negative'
+            task = self._create_task({'text': f'Task {index}'})
+            self._create_annotation(task, self.admin_user, [{'type': 'choices', 'value': {'choices': [label]}}])
+
+        def sampled_ids(**params):
+            response = self.client.post(self.export_url, {'project_id': self.project.id, **params}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK, params)
+            return sorted(task['id'] for task in response.json()['tasks'])
+
+        first = sampled_ids(sample_size=5, sample_seed=7)
+        self.assertEqual(len(first), 5)
+
+        # 해시 ring MD5(task.id)를 seed 시작 위치 MD5('7')부터 순서대로 (뒤쪽이 부족하면 앞쪽에서 채움)
+        offset = hashlib.md5(b'7').hexdigest()
+        ring = sorted(
+            (hashlib.md5(str(task_id).encode()).hexdigest(), task_id)
+            for task_id in Task.objects.filter(project=self.project).values_list('id', flat=True)
+        )
+        ring = [task_id for key, task_id in ring if key >= offset] + [task_id for key, task_id in ring if key < offset]
+        self.assertEqual(first, sorted(ring[:5]))
+        self.assertEqual(sampled_ids(sample_size=5, sample_seed=7), first)
+        self.assertEqual(
+            sampled_ids(sample_size=5, sample_seed=7, page=1, page_size=10), first
+        )
+        self.assertNotEqual(
+            [sampled_ids(sample_size=5, sample_seed=seed) for seed in range(1, 4)], [first] * 3
+        )
+
+        stratified = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'sample_size': 2, 'sample_seed': 7, 'stratify_by': 'label'
+        }, format='json').json()['tasks']
+        labels = [task['annotations'][0]['result'][0]['value']['choices'][0] for task in stratified]
+        self.assertEqual(sorted(labels), ['Negative', 'Negative', 'Positive', 'Positive'])
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'stratify_by': 'label'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_field_projection_validation(self):
+        """data_keys는 data 필드 필요, 컬럼형 형식은 data_keys만 지원"""
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'fields': ['id'], 'data_keys': ['text']
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'fields': ['unknown']
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.export_url, {
+            'project_id': self.project.id, 'format': 'parquet', 'include_annotations': False
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN 형식은 PostgreSQL 기준')
+class CustomExportQueryPlanTest(TestCase):
+    """Export 필터 쿼리 플랜 회귀 테스트 (JOIN + DISTINCT → EXISTS)"""
+
+    def setUp(self):
+        """테스트 데이터 설정 (Task당 annotation/prediction 여러 개)"""
+        self.org = Organization.objects.create(title="Plan Org")
+
+        self.admin_user = User.objects.create_user(
+            username='admin', email='admin@test.com', password='testpass123'
+        )
+        self.admin_user.is_superuser = True
+        self.admin_user.save()
+
+        self.reviewer = User.objects.create_user(
+            username='reviewer', email='reviewer@test.com', password='testpass123'
+        )
+        self.reviewer.is_superuser = True
+        self.reviewer.save()
+
+        self.regular_user = User.objects.create_user(
+            username='user', email='user@test.com', password='testpass123'
+        )
+
+        self.project = Project.objects.create(
+            title='Plan Project',
+            organization=self.org,
+            created_by=self.admin_user
+        )
+
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, data={'text': f'Task {i}'})
+            for i in range(300)
+        ])
+
+        result = [{'type': 'choices', 'value': {'choices': ['Positive']}}]
+        annotations = []
+        predictions = []
+        for i, task in enumerate(tasks):
+            # 1/3은 일반 사용자 annotation만 → export 대상 아님
+            if i % 3:
+                annotations.append(Annotation(task=task, project=self.project, completed_by=self.admin_user, result=result))
+                annotations.append(Annotation(task=task, project=self.project, completed_by=self.reviewer, result=result))
+            annotations.append(Annotation(task=task, project=self.project, completed_by=self.regular_user, result=result))
+            annotations.append(Annotation(task=task, project=self.project, completed_by=self.admin_user, result=result, was_cancelled=True))
+            for model_version in ('bert-v1', 'bert-v2', 'bert-v3'):
+                if model_version == 'bert-v1' and i % 2:
+                    continue
+                predictions.append(Prediction(task=task, project=self.project, model_version=model_version, result=result))
+
+        Annotation.objects.bulk_create(annotations)
+        Prediction.objects.bulk_create(predictions)
+
+    def _legacy_queryset(self, model_version=None, confirm_user_id=None):
+        """기존 JOIN + DISTINCT 방식 QuerySet (비교용)"""
+        queryset = Task.objects.filter(project_id=self.project.id)
+        if model_version:
+            queryset = queryset.filter(predictions__model_version=model_version).distinct()
+        if confirm_user_id:
+            queryset = queryset.filter(
+                annotations__completed_by_id=confirm_user_id,
+                annotations__completed_by__is_superuser=True,
+                annotations__was_cancelled=False
+            ).distinct()
+        queryset = queryset.filter(
+            annotations__completed_by__is_superuser=True,
+            annotations__was_cancelled=False
+        ).distinct()
+        return queryset.order_by('-created_at', '-id')
+
+    def _new_queryset(self, model_version=None, confirm_user_id=None):
+        """현재 EXISTS 방식 QuerySet"""
+        return CustomExportAPI()._build_queryset(
+            project_id=self.project.id,
+            search_from=None,
+            search_to=None,
+            search_date_field='source_created_at',
+            model_version=model_version,
+            confirm_user_id=confirm_user_id
+        ).prefetch_related(None)
+
+    def test_exists_filters_match_legacy_results(self):
+        """EXISTS 필터 결과가 기존 JOIN + DISTINCT 결과와 동일"""
+        filter_sets = [
+            {},
+            {'model_version': 'bert-v1'},
+            {'confirm_user_id': self.reviewer.id},
+            {'model_version': 'bert-v1', 'confirm_user_id': self.admin_user.id},
+        ]
+        for filters in filter_sets:
+            legacy_ids = list(self._legacy_queryset(**filters).values_list('id', flat=True))
+            new_ids = list(self._new_queryset(**filters).values_list('id', flat=True))
+            self.assertEqual(new_ids, legacy_ids, filters)
+            self.assertEqual(self._new_queryset(**filters).count(), len(legacy_ids), filters)
+
+        self.assertEqual(self._new_queryset().count(), 200)
+        self.assertEqual(self._new_queryset(model_version='bert-v1').count(), 100)
+
+    def test_exists_filters_avoid_distinct_in_plan(self):
+        """EXISTS 필터는 DISTINCT 없이 semi-join으로 처리되어 LIMIT이 조기 종료 가능"""
+        filters = {'model_version': 'bert-v1', 'confirm_user_id': self.reviewer.id}
+        legacy = self._legacy_queryset(**filters)
+        new = self._new_queryset(**filters)
+
+        legacy_sql = str(legacy.query).upper()
+        new_sql = str(new.query).upper()
+        self.assertIn('DISTINCT', legacy_sql)
+        self.assertNotIn('DISTINCT', new_sql)
+        self.assertIn('EXISTS', new_sql)
+
+        legacy_plan = legacy[:50].explain()
+        new_plan = new[:50].explain()
+        print(f"\n[OLD PLAN - JOIN + DISTINCT]\n{legacy_plan}")
+        print(f"\n[NEW PLAN - EXISTS]\n{new_plan}")
+
+        # 기존: 중복 제거 노드(Unique/HashAggregate)가 정렬 결과 전체를 소비
+        self.assertTrue(any(node in legacy_plan for node in ('Unique', 'HashAggregate')))
+
+        # 신규: Limit 바로 아래에 중복 제거 노드 없음
+        node_under_limit = new_plan.splitlines()[1].strip().lstrip('->').strip()
+        self.assertTrue(new_plan.startswith('Limit'))
+        self.assertFalse(node_under_limit.startswith(('Unique', 'HashAggregate')))
+
+
+class ExportBenchmarkTest(TestCase):
+    """Export 벤치마크 (합성 프로젝트 생성 + 시나리오 측정) 테스트"""
+
+    def test_seed_project_and_run_suite(self):
+        """검수자 비율에 따라 Export 대상이 정해지고, 모든 시나리오가 리포트에 기록됨"""
+        project = seed_project(
+            tasks=12, annotations_per_task=1, predictions_per_task=2, reviewers=1, annotators=1,
+            reviewer_ratio=1.0, payload_bytes=64, batch_size=5
+        )
+        self.assertEqual(Task.objects.filter(project=project).count(), 12)
+        self.assertEqual(Prediction.objects.filter(project=project).count(), 24)
+
+        reviewer = User.objects.filter(is_superuser=True).order_by('id').first()
+        report = run_suite(project.id, reviewer, page_size=5, repeat=1)
+
+        self.assertEqual(report['dataset']['export_tasks'], 12)
+        self.assertEqual(set(report['scenarios']), set(BENCHMARK_SCENARIOS))
+        self.assertEqual(report['scenarios']['page']['tasks'], 5)
+        self.assertEqual(report['scenarios']['deep_page']['tasks'], 2)
+        self.assertEqual(report['scenarios']['cursor']['tasks'], 2)
+        self.assertEqual(report['scenarios']['full']['tasks'], 12)
+        for result in report['scenarios'].values():
+            self.assertGreater(result['queries'], 0)
+            self.assertGreater(result['response_bytes'], 0)
+
+        # 리포트는 JSON으로 기록 가능
+        json.dumps(report, default=str)
+
+
+class ExportMultiProjectThreadTest(TransactionTestCase):
+    """project_ids 병렬 실행 경로 (worker 스레드는 별도 DB 연결 → 커밋된 데이터 필요)"""
+
+    def setUp(self):
+        self.org = Organization.objects.create(title="Parallel Org")
+        self.admin_user = User.objects.create_user(
+            username='admin', email='admin@test.com', password='testpass123'
+        )
+        self.admin_user.is_superuser = True
+        self.admin_user.is_staff = True
+        self.admin_user.save()
+        self.projects = [
+            Project.objects.create(title=f'Parallel {i}', organization=self.org, created_by=self.admin_user)
+            for i in range(3)
+        ]
+        self.tasks = {
+            project.id: [
+                Task.objects.create(project=project, data={'text': f'{project.id}-{i}'})
+                for i in range(index + 1)
+            ]
+            for index, project in enumerate(self.projects)
+        }
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+        self.export_url = '/api/custom/export/'
+        export_cache.clear()
+
+    @override_settings(CUSTOM_EXPORT_MULTI_PROJECT_WORKERS=3)
+    def test_export_multi_project_threads(self):
+        """worker 스레드에서 조회해도 project_ids 순서로 병합되고 worker 연결은 정리"""
+        project_ids = [project.id for project in reversed(self.projects)]
+        expected = [task.id for project_id in project_ids for task in self.tasks[project_id]]
+
+        response = self.client.post(self.export_url, {
+            'project_ids': project_ids, 'response_type': 'count'
+        }, format='json')
+        self.assertEqual(response.json()['total'], 6)
+        self.assertEqual(
+            response.json()['project_totals'],
+            {str(project_id): len(self.tasks[project_id]) for project_id in project_ids}
+        )
+
+        with patch.object(connections, 'close_all', wraps=connections.close_all) as close_all:
+            response = self.client.post(self.export_url, {
+                'project_ids': project_ids, 'fields': ['id']
+            }, format='json')
+        self.assertEqual([task['id'] for task in response.json()['tasks']], expected)
+        self.assertEqual(close_all.call_count, len(project_ids))
+
+        response = self.client.post(self.export_url, {
+            'project_ids': project_ids, 'response_type': 'stream', 'fields': ['id']
+        }, format='json')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], expected)
+
+
+class ExportDateIndexHelperTest(TestCase):
+    """Export 날짜 필드 expression index 헬퍼 테스트"""
+
+    def test_date_field_sql_uses_literal_field(self):
+        """인덱스 표현식과 일치하도록 필드명을 리터럴로 포함"""
+        sql = date_field_sql('source_created_at')
+        self.assertIn("->> 'source_created_at'", sql)
+        self.assertIn(f'"{Task._meta.db_table}"."data"', sql)
+
+    def test_date_field_sql_rejects_invalid_field(self):
+        """SQL Injection 방지: 허용되지 않은 필드명 거부"""
+        for field in ["source' OR '1'='1", "a;DROP TABLE task", "", "1abc"]:
+            with self.assertRaises(ExportIndexError):
+                date_field_sql(field)
+
+    def test_index_name_fits_postgresql_limit(self):
+        """긴 필드명은 해시로 대체되어 63자 이내"""
+        self.assertEqual(index_name(7, 'source_created_at'), 'cexp_date_p7_source_created_at')
+        long_name = index_name(123456, 'f' * 64)
+        self.assertLessEqual(len(long_name), 63)
+        self.assertTrue(long_name.startswith('cexp_date_p123456_'))
+
+    @override_settings(
+        CUSTOM_EXPORT_DATE_FIELDS=['source_created_at', 'mesure_at'],
+        CUSTOM_EXPORT_TIMESTAMP_FIELDS=['source_created_at']
+    )
+    def test_normalized_fields_have_no_expression_index(self):
+        """정규화 대상 필드는 side table을 사용하므로 인덱스 대상에서 제외/생성 거부"""
+        self.assertEqual(configured_date_fields(), ['mesure_at'])
+        with self.assertRaises(ExportIndexError):
+            create_date_index(1, 'source_created_at')
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Expression index는 PostgreSQL 전용')
+class ExportDateIndexTest(TransactionTestCase):
+    """프로젝트별 partial expression index 생성/사용/삭제 (CONCURRENTLY → 트랜잭션 밖 실행)"""
+
+    def setUp(self):
+        self.org = Organization.objects.create(title="Index Org")
+        self.admin_user = User.objects.create_user(
+            username='admin', email='admin@test.com', password='testpass123'
+        )
+        self.admin_user.is_superuser = True
+        self.admin_user.is_staff = True
+        self.admin_user.save()
+        self.project = Project.objects.create(
+            title='Index Project', organization=self.org, created_by=self.admin_user
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin_user)
+
+    def tearDown(self):
+        for index in list_date_indexes(self.project.id):
+            drop_date_index(index['project_id'], index['field'])
+
+    def test_create_index_matches_export_query(self):
+        """생성한 인덱스를 Export 날짜 필터 쿼리가 사용"""
+        # 정규화(side table) 대상이 아닌 필드는 expression index 사용
+        result = create_date_index(self.project.id, 'mesure_at')
+        self.assertTrue(result['created'])
+
+        # 재실행 시 기존 인덱스 유지
+        self.assertFalse(create_date_index(self.project.id, 'mesure_at')['created'])
+
+        indexes = list_date_indexes(self.project.id)
+        self.assertEqual(len(indexes), 1)
+        self.assertTrue(indexes[0]['valid'])
+        self.assertEqual(indexes[0]['field'], 'mesure_at')
+
+        queryset = CustomExportAPI()._build_queryset(
+            project_id=self.project.id,
+            search_from=datetime(2025, 1, 1, tzinfo=pytz.UTC),
+            search_to=datetime(2025, 1, 31, tzinfo=pytz.UTC),
+            search_date_field='mesure_at',
+            model_version=None,
+            confirm_user_id=None
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                plan = queryset.explain()
+            finally:
+                cursor.execute('SET enable_seqscan = on')
+        self.assertIn(result['name'], plan)
+
+        self.assertTrue(drop_date_index(self.project.id, 'mesure_at')['dropped'])
+        self.assertEqual(list_date_indexes(self.project.id), [])
+
+    def test_date_index_api(self):
+        """Admin API로 인덱스 생성/조회/삭제"""
+        url = '/api/admin/export/date-indexes'
+
+        response = self.client.post(url, {'project_id': self.project.id, 'fields': ['mesure_at']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['indexes'][0]['created'])
+
+        response = self.client.get(url, {'project_id': self.project.id})
+        self.assertEqual([i['field'] for i in response.data['indexes']], ['mesure_at'])
+
+        response = self.client.delete(url, {'project_id': self.project.id, 'fields': ['mesure_at']}, format='json')
+        self.assertTrue(response.data['indexes'][0]['dropped'])
+
+        # 일반 사용자 접근 불가
+        regular_user = User.objects.create_user(username='user', email='user@test.com', password='testpass123')
+        client = APIClient()
+        client.force_authenticate(user=regular_user)
+        self.assertEqual(client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
 
 class ValidatedSSOTokenAPITest(TestCase):
     """Custom SSO Token Validation API 테스트"""
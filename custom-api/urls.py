@@ -5,11 +5,15 @@ AnnotationAPI와 ProjectAPI를 커스텀 버전으로 오버라이드하고,
 Admin 전용 사용자 관리 API를 제공합니다.
 """
 
+from django.db import transaction
 from django.urls import path
 from custom_api.annotations import AnnotationAPI
 from custom_api.projects import ProjectAPI
 from custom_api.admin_users import CreateSuperuserAPI, PromoteToSuperuserAPI, DemoteFromSuperuserAPI, ListUsersAPI
-from custom_api.export import CustomExportAPI
+from custom_api.export import (
+    CustomExportAPI, ExportArtifactDownloadAPI, ExportDateIndexAPI, ExportJobAPI, ExportJobDownloadAPI,
+    ExportStatsAPI,
+)
 from custom_api.users import user_detail, user_by_email
 
 app_name = 'custom_api'
@@ -28,6 +32,21 @@ urlpatterns = [
 
     # Custom Export API (MLOps 모델 학습 및 성능 계산용)
     path('custom/export/', CustomExportAPI.as_view(), name='custom-export'),
+    path('custom/export/stats/', ExportStatsAPI.as_view(), name='custom-export-stats'),
+    path('custom/export/jobs/<uuid:job_id>/', ExportJobAPI.as_view(), name='custom-export-job'),
+    path('custom/export/jobs/<uuid:job_id>/download', ExportJobDownloadAPI.as_view(), name='custom-export-job-download'),
+    path(
+        'custom/export/artifacts/<str:artifact_id>/download',
+        ExportArtifactDownloadAPI.as_view(),
+        name='custom-export-artifact-download'
+    ),
+
+    # Export 날짜 필드 Expression Index 관리 (CONCURRENTLY는 트랜잭션 밖에서 실행)
+    path(
+        'admin/export/date-indexes',
+        transaction.non_atomic_requests(ExportDateIndexAPI.as_view()),
+        name='export-date-indexes'
+    ),
 
     # User Management API (이메일 수정 지원)
     path('users/<int:pk>/', user_detail, name='user-detail'),